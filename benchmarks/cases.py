@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+The benchmark cases. Every case takes the amount of records, the record width
+and a mapper, and returns a callable that performs the measured work together
+with the amount of bytes that callable encodes or decodes.
+"""
+import ast
+import importlib.util
+import io
+import json
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from serde_components.deserializers import (
+    CsvDeserializer,
+    FanOutDeserializer,
+    JsonDeserializer,
+    JsonLinesDeserializer,
+    Sink,
+    StructDeserializer,
+    TomlDeserializer,
+)
+from serde_components.mappers import BaseMapper, FieldMapper
+from serde_components.serializers import (
+    CsvSerializer,
+    JsonLinesSerializer,
+    JsonSerializer,
+    StructSerializer,
+    TomlSerializer,
+)
+from serde_components.struct_layout import StructLayout
+
+Work = Callable[[], Any]
+Case = Callable[[int, int, Type[BaseMapper]], Tuple[Work, int]]
+
+
+class Record:
+    pass
+
+
+def make_records(count: int, width: int) -> List[Record]:
+    records = []
+    for index in range(count):
+        record = Record()
+        for field in range(width):
+            value = index if field % 2 == 0 else f'value{index}'
+            setattr(record, f'f{field}', value)
+        records.append(record)
+
+    return records
+
+
+def make_mappers(width: int) -> Dict[str, Type[BaseMapper]]:
+    """
+    Creates a bytes based mapper and a structured mapper for records of the
+    passed in width.
+    """
+    fields = tuple(f'f{field}' for field in range(width))
+
+    class BytesMapper(BaseMapper[Record]):
+        @staticmethod
+        def map_deserialize(record: Any) -> bytes:
+            data = {field: getattr(record, field) for field in fields}
+            return str(data).encode('utf-8')
+
+        @staticmethod
+        def map_serialize(record: Any, data: bytes) -> Record:
+            _data = ast.literal_eval(data.decode('utf-8'))
+            for field in fields:
+                setattr(record, field, _data.get(field))
+
+            return record
+
+    DictMapper = type('DictMapper', (FieldMapper,), {'fields': fields})
+
+    return {'bytes': BytesMapper, 'dict': DictMapper}
+
+
+def _rows(count: int, width: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            f'f{field}': index if field % 2 == 0 else f'value{index}'
+            for field in range(width)
+        }
+        for index in range(count)
+    ]
+
+
+def _layout(width: int) -> StructLayout:
+    return StructLayout(
+        [(f'f{field}', 'q' if field % 2 == 0 else 'str') for field in range(width)]
+    )
+
+
+def csv_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+
+    def work() -> None:
+        CsvDeserializer.deserialize_to_file(records, mapper, io.BytesIO())
+
+    return work, len(CsvDeserializer.deserialize(records, mapper))
+
+
+def csv_serializer(count: int, width: int, mapper: Type[BaseMapper]):
+    data = CsvDeserializer.deserialize(make_records(count, width), mapper)
+
+    def work() -> None:
+        CsvSerializer.serialize(Record, mapper, data)
+
+    return work, len(data)
+
+
+def json_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+
+    def work() -> None:
+        for record in records:
+            JsonDeserializer.deserialize(record, mapper)
+
+    return work, sum(len(JsonDeserializer.deserialize(r, mapper)) for r in records)
+
+
+def json_serializer(count: int, width: int, mapper: Type[BaseMapper]):
+    payloads = [json.dumps(row).encode('utf-8') for row in _rows(count, width)]
+
+    def work() -> None:
+        for payload in payloads:
+            JsonSerializer.serialize(Record, mapper, payload)
+
+    return work, sum(len(payload) for payload in payloads)
+
+
+def json_lines_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+
+    def work() -> None:
+        JsonLinesDeserializer.deserialize_to_file(records, mapper, io.BytesIO())
+
+    return work, len(JsonLinesDeserializer.deserialize(records, mapper))
+
+
+def json_lines_serializer(count: int, width: int, mapper: Type[BaseMapper]):
+    data = JsonLinesDeserializer.deserialize(make_records(count, width), mapper)
+
+    def work() -> None:
+        for _ in JsonLinesSerializer.iter_serialize_from_file(
+            Record, mapper, io.BytesIO(data)
+        ):
+            pass
+
+    return work, len(data)
+
+
+def toml_serializer(count: int, width: int, mapper: Type[BaseMapper]):
+    payloads = [
+        '\n'.join(f'{key} = {json.dumps(value)}' for key, value in row.items()).encode(
+            'utf-8'
+        )
+        for row in _rows(count, width)
+    ]
+
+    def work() -> None:
+        for payload in payloads:
+            TomlSerializer.serialize(Record, mapper, payload)
+
+    return work, sum(len(payload) for payload in payloads)
+
+
+def toml_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+
+    def work() -> None:
+        TomlDeserializer.deserialize_records_to_file(records, mapper, io.BytesIO())
+
+    return work, len(TomlDeserializer.deserialize_records(records, mapper))
+
+
+def struct_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+    layout = _layout(width)
+
+    def work() -> None:
+        StructDeserializer.deserialize_to_file(
+            records, mapper, io.BytesIO(), layout=layout
+        )
+
+    return work, len(StructDeserializer.deserialize(records, mapper, layout=layout))
+
+
+def struct_serializer(count: int, width: int, mapper: Type[BaseMapper]):
+    layout = _layout(width)
+    data = StructDeserializer.deserialize(
+        make_records(count, width), mapper, layout=layout
+    )
+
+    def work() -> None:
+        StructSerializer.serialize(Record, mapper, data, layout=layout)
+
+    return work, len(data)
+
+
+def fan_out_deserializer(count: int, width: int, mapper: Type[BaseMapper]):
+    records = make_records(count, width)
+    deserializers = [CsvDeserializer, JsonLinesDeserializer]
+
+    def work() -> None:
+        FanOutDeserializer.deserialize_to_file(
+            records,
+            mapper,
+            [Sink(deserializer, io.BytesIO()) for deserializer in deserializers],
+        )
+
+    data = FanOutDeserializer.deserialize(records, mapper, deserializers)
+    return work, sum(len(d) for d in data)
+
+
+CASES: Dict[str, Case] = {
+    'csv_deserializer': csv_deserializer,
+    'csv_serializer': csv_serializer,
+    'fan_out_deserializer': fan_out_deserializer,
+    'json_deserializer': json_deserializer,
+    'json_serializer': json_serializer,
+    'json_lines_deserializer': json_lines_deserializer,
+    'json_lines_serializer': json_lines_serializer,
+    'struct_deserializer': struct_deserializer,
+    'struct_serializer': struct_serializer,
+    'toml_deserializer': toml_deserializer,
+}
+# TomlSerializer parses with tomllib, which is only available from python 3.11
+if importlib.util.find_spec('tomllib') is not None:
+    CASES['toml_serializer'] = toml_serializer
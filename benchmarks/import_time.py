@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the cold start import time of the package and of every component with
+python -X importtime and reports it as json. Every import runs in a fresh
+interpreter, the fastest of the repeats is reported.
+
+Usage:
+    python -m benchmarks.import_time --output imports.json
+    python -m benchmarks.import_time --targets serde_components --baseline imports.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+TARGETS = (
+    'serde_components',
+    'serde_components.deserializers:CsvDeserializer',
+    'serde_components.deserializers:JsonDeserializer',
+    'serde_components.deserializers:JsonLinesDeserializer',
+    'serde_components.deserializers:StructDeserializer',
+    'serde_components.deserializers:TomlDeserializer',
+    'serde_components.mappers:FieldMapper',
+    'serde_components.serializers:CsvSerializer',
+    'serde_components.serializers:JsonLinesSerializer',
+    'serde_components.serializers:JsonSerializer',
+    'serde_components.serializers:StructSerializer',
+    'serde_components.serializers:TomlSerializer',
+)
+
+
+def _statement(target: str) -> str:
+    """
+    Targets are either a module or a module:attribute pair, the attribute is
+    accessed as well because the components are only imported on access.
+    """
+    module, _, attribute = target.partition(':')
+    if attribute:
+        return f'from {module} import {attribute}'
+
+    return f'import {module}'
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses the stderr of python -X importtime into (module, self, cumulative)
+    tuples, the times are in microseconds.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        self_time, cumulative, module = line[len('import time:') :].split('|')
+        if not self_time.strip().isdigit():
+            # The header line
+            continue
+        imports.append((module.strip(), int(self_time), int(cumulative)))
+
+    return imports
+
+
+def measure(target: str, repeat: int) -> Dict:
+    # Modules that the interpreter itself imports at startup are also imported
+    # when nothing is, those are subtracted from the results.
+    baseline = _run('pass')
+    startup = {module for module, _, _ in baseline}
+
+    best: Optional[List[Tuple[str, int, int]]] = None
+    for _ in range(repeat):
+        imports = [item for item in _run(_statement(target)) if item[0] not in startup]
+        if best is None or _total(imports) < _total(best):
+            best = imports
+    assert best is not None
+
+    slowest = sorted(best, key=lambda item: item[1], reverse=True)[:10]
+    return {
+        'target': target,
+        'microseconds': _total(best),
+        'modules': len(best),
+        'stdlib_modules': sorted(
+            module for module, _, _ in best if not module.startswith('serde_components')
+        ),
+        'slowest': [
+            {'module': module, 'self': self_time, 'cumulative': cumulative}
+            for module, self_time, cumulative in slowest
+        ],
+    }
+
+
+def _run(statement: str) -> List[Tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def _total(imports: List[Tuple[str, int, int]]) -> int:
+    return sum(self_time for _, self_time, _ in imports)
+
+
+def compare(results: List[Dict], baseline: Dict, max_regression: float) -> bool:
+    """
+    Prints the import time of every result relative to the baseline and returns
+    whether all results stay within max_regression.
+    """
+    previous = {result['target']: result for result in baseline['results']}
+
+    ok = True
+    for result in results:
+        old = previous.get(result['target'])
+        if not old or not old['microseconds']:
+            continue
+
+        ratio = result['microseconds'] / old['microseconds']
+        regressed = ratio > 1 + max_regression
+        ok = ok and not regressed
+        flag = ' REGRESSION' if regressed else ''
+        added = sorted(set(result['stdlib_modules']) - set(old['stdlib_modules']))
+        new_modules = f" new imports: {', '.join(added)}" if added else ''
+        print(f"{result['target']}: {ratio:.2f}x{flag}{new_modules}", file=sys.stderr)
+
+    return ok
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(',') if item]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--targets', type=_split, default=list(TARGETS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against these results')
+    parser.add_argument('--max-regression', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = [measure(target, args.repeat) for target in args.targets]
+
+    report: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file_object:
+            file_object.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file_object:
+            baseline = json.load(file_object)
+        if not compare(results, baseline, args.max_regression):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Runs the benchmark suite and reports the throughput and peak memory use of
+every component as json. Nothing in here requires network access.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --scales 1,1000 --widths 2 --baseline results.json
+    python -m benchmarks.run --cases json_serializer --json-backends json,pkg:Backend
+"""
+import argparse
+import gc
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+from serde_components.json_backends import register_backend, set_default_backend
+
+from .cases import CASES, make_mappers
+
+SCALES = (1, 100, 10_000, 1_000_000)
+WIDTHS = (2, 10, 50)
+
+
+def measure(
+    case: str,
+    count: int,
+    width: int,
+    mapper: str,
+    repeat: int,
+    backend: Optional[str] = None,
+) -> Dict:
+    set_default_backend(backend)
+    work, size = CASES[case](count, width, make_mappers(width)[mapper])
+
+    seconds = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        work()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Tracing allocations slows everything down, so the peak memory is measured
+    # in a separate run.
+    gc.collect()
+    tracemalloc.start()
+    work()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'case': case,
+        'mapper': mapper,
+        'backend': backend,
+        'records': count,
+        'width': width,
+        'bytes': size,
+        'seconds': seconds,
+        'records_per_second': count / seconds if seconds else None,
+        'bytes_per_second': size / seconds if seconds else None,
+        'peak_memory': peak_memory,
+    }
+
+
+def compare(results: List[Dict], baseline: Dict, max_regression: float) -> bool:
+    """
+    Prints the throughput of every result relative to the baseline and returns
+    whether all results stay within max_regression.
+    """
+    key_fields = ('case', 'mapper', 'backend', 'records', 'width')
+    previous = {
+        tuple(result.get(field) for field in key_fields): result
+        for result in baseline['results']
+    }
+
+    ok = True
+    for result in results:
+        old = previous.get(tuple(result.get(field) for field in key_fields))
+        if not old or not old['records_per_second']:
+            continue
+
+        ratio = result['records_per_second'] / old['records_per_second']
+        regressed = ratio < 1 - max_regression
+        ok = ok and not regressed
+        flag = ' REGRESSION' if regressed else ''
+        backend = f" backend={result['backend']}" if result.get('backend') else ''
+        print(
+            f"{result['case']} {result['mapper']}{backend} records={result['records']} "
+            f"width={result['width']}: {ratio:.2f}x{flag}",
+            file=sys.stderr,
+        )
+
+    return ok
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(',') if item]
+
+
+def _load_backend(spec: str) -> str:
+    """
+    Backends are passed either as the name of a registered backend or as a
+    module:attribute import path, which gets registered under that path.
+    """
+    if ':' in spec:
+        module, attribute = spec.split(':', 1)
+        register_backend(spec, getattr(importlib.import_module(module), attribute))
+
+    return spec
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--cases', type=_split, default=list(CASES))
+    parser.add_argument('--mappers', type=_split, default=['bytes', 'dict'])
+    parser.add_argument(
+        '--scales', type=_split, default=[str(scale) for scale in SCALES]
+    )
+    parser.add_argument(
+        '--widths', type=_split, default=[str(width) for width in WIDTHS]
+    )
+    parser.add_argument('--json-backends', type=_split, default=['json'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against these results')
+    parser.add_argument('--max-regression', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    backends = [_load_backend(spec) for spec in args.json_backends]
+    results = []
+    for case in args.cases:
+        # Only the json components use a json backend, the other cases run once
+        case_backends = backends if case.startswith('json') else [None]
+        for backend in case_backends:
+            for mapper in args.mappers:
+                for width in map(int, args.widths):
+                    for count in map(int, args.scales):
+                        results.append(
+                            measure(case, count, width, mapper, args.repeat, backend)
+                        )
+
+    report: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file_object:
+            file_object.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file_object:
+            baseline = json.load(file_object)
+        if not compare(results, baseline, args.max_regression):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,13 @@
 # -*- coding: utf-8 -*-
-from . import deserializers
-from . import mappers
-from . import serializers
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from . import deserializers
+    from . import mappers
+    from . import serializers
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {'deserializers': '', 'mappers': '', 'serializers': ''}
+)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Hashable, NamedTuple, Optional, OrderedDict, Tuple
+from typing import Union
+
+from .utils import Buffer, map_file
+
+MAX_ENTRIES = 128
+MAX_BYTES = 64 * 1024 * 1024
+
+Parser = Callable[[Buffer], Any]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class DocumentCache:
+    """
+    A least recently used cache for parsed documents. Documents read from a
+    path are keyed by the identity of the file, its size and its modification
+    time, so an unchanged file is never read again. Documents passed in as
+    bytes are keyed by a hash of their content.
+
+    The size of a document is measured as the size of its source, the cache
+    evicts the least recently used documents once either max_entries or
+    max_bytes is exceeded. Documents that are larger than max_bytes on their
+    own are not cached.
+
+    Documents are stored pickled and every load returns a new copy, so a
+    mapper can modify the data it is passed in. Unpickling is still cheaper
+    than parsing. Documents that can not be pickled are not cached. With
+    shared the parsed document itself is stored and handed out on every load,
+    which skips the copy but means a change made by one caller is seen by all
+    later loads.
+
+    Args:
+        max_entries: The maximum amount of cached documents.
+        max_bytes: The maximum combined size of the sources of the cached
+            documents.
+        shared: Whether all loads of a document return the same object.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        max_bytes: int = MAX_BYTES,
+        shared: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]]
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        The amount of hits, misses and evictions since the cache was created
+        and the amount and combined size of the cached documents.
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """
+        Removes all documents from the cache, the statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def load(self, data: Buffer, parse: Parser, namespace: Hashable = None) -> Any:
+        """
+        Returns the parsed document for the data, the data is only parsed if
+        the same content was not parsed before.
+
+        Args:
+            data: Some bytestring or other object that implements the buffer
+                protocol.
+            parse: The function that parses the data into a document.
+            namespace: Some hashable that separates documents that are parsed
+                differently, for example by format or json backend.
+
+        Returns:
+            The parsed document.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        key = (namespace, digest)
+        return self._load(key, len(data), lambda: parse(data))
+
+    def load_path(
+        self,
+        source: Union[str, 'os.PathLike[str]', int],
+        parse: Parser,
+        namespace: Hashable = None,
+    ) -> Any:
+        """
+        Returns the parsed document for a file, the file is only read and
+        parsed if it was not parsed before or has changed since.
+
+        Args:
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            parse: The function that parses the file contents into a document.
+            namespace: Some hashable that separates documents that are parsed
+                differently, for example by format, json backend or the
+                compression the file is read with.
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations.
+        """
+        stat = os.fstat(source) if isinstance(source, int) else os.stat(source)
+        key = (namespace, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        def load() -> Any:
+            with map_file(source) as data:
+                return parse(data)
+
+        return self._load(key, stat.st_size, load)
+
+    def _load(self, key: Hashable, size: int, load: Callable[[], Any]) -> Any:
+        # pickle is only imported once a document is cached
+        import pickle
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is not None:
+            return entry[0] if self.shared else pickle.loads(entry[0])
+
+        # Parsing happens outside of the lock, concurrent misses on the same
+        # key both parse and the last one is kept.
+        document = load()
+        if size > self.max_bytes:
+            return document
+
+        stored = document
+        if not self.shared:
+            try:
+                stored = pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                return document
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (stored, size)
+            self._size += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+        return document
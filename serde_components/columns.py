@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+import array
+import csv
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import Tuple, Union, overload
+from typing import Iterable as Iter
+
+from .schema import Schema
+
+# The array typecodes that are used for the numeric column types
+TYPECODES: Dict[Any, str] = {int: 'q', float: 'd', bool: 'b'}
+NUMPY_ERROR = 'numpy is required to produce numpy arrays'
+
+Columns = Dict[str, Sequence[Any]]
+
+
+class DictionaryColumn(Sequence[Any]):
+    """
+    A column that stores every distinct value once and refers to it with an
+    integer code per row. Columns with many repeated strings take up a
+    fraction of the memory a list would.
+    """
+
+    def __init__(self, values: Iter[Any] = ()):
+        self.codes = array.array('I')
+        self.values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Any) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.values[code] for code in self.codes[index]]
+        return self.values[self.codes[index]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.values
+        return (values[code] for code in self.codes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f'DictionaryColumn({list(self)!r})'
+
+
+class _ColumnBuilder:
+    """
+    Appends converted values to the most compact container for the column
+    type. A numeric column falls back to a list when it contains a value that
+    does not fit the array, like None for a null value or an int that does not
+    fit in 64 bits.
+    """
+
+    column: Any
+    append: Callable[[Any], None]
+
+    def __init__(self, kind: Any, dictionary_encode: bool):
+        if kind in TYPECODES:
+            self.column = array.array(TYPECODES[kind])
+            self.append = self._append_array
+        elif kind is str and dictionary_encode:
+            self.column = DictionaryColumn()
+            self.append = self.column.append
+        elif kind is str:
+            self.column = []
+            self.append = self._append_interned
+        else:
+            self.column = []
+            self.append = self.column.append
+
+    def _append_array(self, value: Any) -> None:
+        try:
+            self.column.append(value)
+        except (TypeError, OverflowError):
+            self.column = list(self.column)
+            self.column.append(value)
+            self.append = self.column.append
+
+    def _append_interned(self, value: Any) -> None:
+        self.column.append(sys.intern(value) if isinstance(value, str) else value)
+
+
+def read_columns(
+    lines: Iter[str],
+    schema: Optional[Schema] = None,
+    dictionary_encode: bool = True,
+    use_numpy: bool = False,
+    fields: Optional[Iter[str]] = None,
+) -> Columns:
+    """
+    Reads csv lines into columns instead of one object per row. Numeric columns
+    are stored in an array.array, string columns are dictionary encoded or
+    interned. The header is resolved with the same schema logic that the
+    CsvSerializer uses.
+
+    Args:
+        lines: Some iterable of strings that each contain one line of csv.
+        schema: The schema that describes how the columns are converted.
+            Columns that are not in the schema are read as strings.
+        dictionary_encode: Whether string columns are stored as a
+            DictionaryColumn, otherwise they are stored as a list of interned
+            strings.
+        use_numpy: Whether the numeric columns are returned as numpy arrays.
+        fields: The names of the columns that get read, the cells of all other
+            columns are skipped. All columns are read when nothing is passed
+            in.
+
+    Returns:
+        A dict that maps every column name to its values.
+
+    Raises:
+        ImportError: use_numpy is passed but numpy is not installed.
+        ValueError: A value does not fit the schema.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, [])
+    plan, defaults = (schema or Schema({})).resolve(header, fields)
+
+    builders = {
+        name: _ColumnBuilder(kind, dictionary_encode) for name, _, kind, _ in plan
+    }
+    for name, default in defaults.items():
+        builders[name] = _ColumnBuilder(type(default), dictionary_encode)
+
+    width = max((index for _, index, _, _ in plan), default=-1) + 1
+    cells: List[Tuple[int, Callable[[Any], None], Callable[[str], Any]]] = [
+        (index, builders[name].append, converter) for name, index, _, converter in plan
+    ]
+    default_appenders = [
+        (builders[name].append, value) for name, value in defaults.items()
+    ]
+
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [''] * (width - len(row))
+        for index, append, converter in cells:
+            append(converter(row[index]))
+        for append, value in default_appenders:
+            append(value)
+
+    columns: Columns = {
+        name: builder.column for name, builder in builders.items()  # type:ignore
+    }
+    if use_numpy:
+        return _to_numpy(columns)
+
+    return columns
+
+
+def _to_numpy(columns: Columns) -> Columns:
+    try:
+        import numpy  # type:ignore
+    except ImportError:
+        raise ImportError(NUMPY_ERROR)
+
+    return {
+        name: (
+            numpy.frombuffer(column, dtype=_numpy_dtype(column.typecode))
+            if isinstance(column, array.array)
+            else column
+        )
+        for name, column in columns.items()
+    }
+
+
+def _numpy_dtype(typecode: str) -> Any:
+    # Bool columns are stored as signed chars, numpy reads them as int8
+    # unless it is told otherwise
+    return bool if typecode == TYPECODES[bool] else typecode
+
+
+def iter_column_rows(columns: Mapping[str, Sequence[Any]]) -> Iterator[Sequence[Any]]:
+    """
+    Yields the header followed by every row of a set of columns.
+
+    Args:
+        columns: Some mapping of column names to sequences of equal length.
+
+    Returns:
+        An iterator over the header and the rows.
+    """
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError('All columns must have the same length')
+
+    yield list(columns.keys())
+    yield from zip(*columns.values())
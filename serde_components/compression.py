@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import io
+import os
+from typing import Any, IO, Iterator, Optional
+
+from .utils import CHUNK_SIZE, Buffer
+
+GZIP = 'gzip'
+BZ2 = 'bz2'
+LZMA = 'lzma'
+# Detects the compression from the magic bytes of the data or the extension of
+# the file name.
+AUTO = 'auto'
+BUFFER_SIZE = CHUNK_SIZE
+
+CompressionKind = Optional[str]
+
+# The bz2 magic is followed by the block size and the magic of the first block,
+# so csv data that starts with BZh is not mistaken for bz2 data.
+_MAGIC = (
+    (GZIP, b'\x1f\x8b\x08'),
+    (LZMA, b'\xfd7zXZ\x00'),
+    (BZ2, b'BZh'),
+)
+_BZ2_BLOCK = b'1AY&SY'
+_MAGIC_SIZE = 10
+_EXTENSIONS = {
+    '.gz': GZIP,
+    '.gzip': GZIP,
+    '.bz2': BZ2,
+    '.xz': LZMA,
+    '.lzma': LZMA,
+}
+# The default level of zlib, gzip itself defaults to the slowest level
+_GZIP_LEVEL = 6
+
+
+def detect(data: Buffer) -> CompressionKind:
+    """
+    Detects the compression of some data from its magic bytes.
+
+    Args:
+        data: Some bytestring that contains at least the first 10 bytes of
+            the data.
+
+    Returns:
+        GZIP, BZ2, LZMA or None if the data is not compressed.
+    """
+    head = bytes(data[:_MAGIC_SIZE])
+    for compression, magic in _MAGIC:
+        if head.startswith(magic):
+            if compression == BZ2 and not (
+                head[3:4].isdigit() and head[4:] == _BZ2_BLOCK
+            ):
+                continue
+            return compression
+
+    return None
+
+
+def detect_name(name: Any) -> CompressionKind:
+    """
+    Detects the compression of a file from the extension of its name.
+
+    Args:
+        name: Some path, anything that is not a path like the file descriptor
+            in the name of some file objects is ignored.
+
+    Returns:
+        GZIP, BZ2, LZMA or None if the extension is not known.
+    """
+    if not isinstance(name, (str, os.PathLike)):
+        return None
+
+    _, extension = os.path.splitext(os.fspath(name))
+    return _EXTENSIONS.get(extension.lower())
+
+
+def _peek(file_object: IO[bytes]) -> bytes:
+    peek = getattr(file_object, 'peek', None)
+    if peek is not None:
+        return peek(_MAGIC_SIZE)[:_MAGIC_SIZE]
+
+    if file_object.seekable():
+        position = file_object.tell()
+        head = file_object.read(_MAGIC_SIZE)
+        file_object.seek(position)
+        return head
+
+    # Streams that can not be rewound are only detected by their name
+    return b''
+
+
+def _check(compression: CompressionKind) -> None:
+    if compression not in (None, AUTO, GZIP, BZ2, LZMA):
+        raise ValueError(f'Unknown compression {compression!r}')
+
+
+@contextlib.contextmanager
+def reading(
+    file_object: IO[bytes],
+    compression: CompressionKind = AUTO,
+    buffer_size: int = BUFFER_SIZE,
+) -> Iterator[IO[bytes]]:
+    """
+    Wraps a file object so the data read from it is decompressed on the fly,
+    the uncompressed data is never held in memory as a whole. The passed in
+    file object is not closed when the context exits.
+
+    Args:
+        file_object: Some file-like object opened in byte mode that can be
+            read from.
+        compression: GZIP, BZ2, LZMA, None for uncompressed data or AUTO to
+            detect the compression from the magic bytes of the data or the
+            extension of the name of the file object.
+        buffer_size: The size of the reads from the decompressor.
+
+    Returns:
+        A context manager that yields a file object with the uncompressed
+        data, uncompressed data is yielded as the passed file object.
+
+    Raises:
+        ValueError: The compression is not known.
+    """
+    _check(compression)
+    if compression == AUTO:
+        compression = detect(_peek(file_object))
+        compression = compression or detect_name(getattr(file_object, 'name', None))
+
+    if compression is None:
+        yield file_object
+        return
+
+    # The modules are only imported when they are used
+    decompressor: Any
+    if compression == GZIP:
+        import gzip
+
+        decompressor = gzip.GzipFile(fileobj=file_object, mode='rb')
+    elif compression == BZ2:
+        import bz2
+
+        decompressor = bz2.BZ2File(file_object, mode='rb')
+    else:
+        import lzma
+
+        decompressor = lzma.LZMAFile(file_object, mode='rb')
+
+    with io.BufferedReader(decompressor, buffer_size) as reader:
+        yield reader  # type:ignore
+
+
+@contextlib.contextmanager
+def writing(
+    file_object: IO[bytes],
+    compression: CompressionKind = AUTO,
+    level: Optional[int] = None,
+    buffer_size: int = BUFFER_SIZE,
+) -> Iterator[IO[bytes]]:
+    """
+    Wraps a file object so the data written to it is compressed on the fly.
+    The compressed stream is finished when the context exits, the passed in
+    file object is not closed.
+
+    Args:
+        file_object: Some file-like object opened in byte mode that can be
+            written to.
+        compression: GZIP, BZ2, LZMA, None for uncompressed data or AUTO to
+            detect the compression from the extension of the name of the file
+            object.
+        level: The compression level, from 1 to 9 for gzip and bz2 and the
+            preset from 0 to 9 for lzma. The default level of the format is
+            used when nothing is passed in, 6 for gzip.
+        buffer_size: The amount of bytes that are buffered before they are
+            passed to the compressor.
+
+    Returns:
+        A context manager that yields a file object that compresses the data
+        written to it.
+
+    Raises:
+        ValueError: The compression is not known.
+    """
+    _check(compression)
+    if compression == AUTO:
+        compression = detect_name(getattr(file_object, 'name', None))
+
+    if compression is None:
+        yield file_object
+        return
+
+    compressor: Any
+    if compression == GZIP:
+        import gzip
+
+        compresslevel = _GZIP_LEVEL if level is None else level
+        compressor = gzip.GzipFile(
+            fileobj=file_object, mode='wb', compresslevel=compresslevel
+        )
+    elif compression == BZ2:
+        import bz2
+
+        compressor = bz2.BZ2File(file_object, mode='wb', compresslevel=level or 9)
+    else:
+        import lzma
+
+        compressor = lzma.LZMAFile(file_object, mode='wb', preset=level)
+
+    with io.BufferedWriter(compressor, buffer_size) as writer:
+        yield writer  # type:ignore
+
+
+def decompress(data: Buffer, compression: CompressionKind = AUTO) -> Buffer:
+    """
+    Decompresses data that is held in memory, for the formats that have to be
+    parsed as a whole.
+
+    Args:
+        data: Some bytestring or other object that implements the buffer
+            protocol.
+        compression: GZIP, BZ2, LZMA, None for uncompressed data or AUTO to
+            detect the compression from the magic bytes of the data.
+
+    Returns:
+        The uncompressed data, uncompressed data is returned as is.
+
+    Raises:
+        ValueError: The compression is not known.
+    """
+    _check(compression)
+    if compression == AUTO:
+        compression = detect(data)
+
+    if compression is None:
+        return data
+
+    with reading(io.BytesIO(data), compression) as reader:  # type:ignore
+        return reader.read()
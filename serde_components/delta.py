@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import dbm
+import hashlib
+import itertools
+import json
+import os
+import struct
+from typing import TYPE_CHECKING
+from typing import Any, Callable, Dict, IO, Iterator, List, NamedTuple, Optional
+from typing import Tuple
+from typing import Type, TypeVar, Union
+from typing import Iterable as Iter
+
+from .mappers import BaseMapper, RowMapper, iter_dicts_from_records
+from .utils import _SENTINEL, BATCH_SIZE, Buffer, batched, map_file
+from .writers import ChunkedWriter, ProgressCallback
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+KeyKind = Union[str, Callable[[Any], Any]]
+
+# digest, generation, offset, length
+_ENTRY = struct.Struct('<16sQQQ')
+# committed generation, started generation, digest of the prefix
+_META = struct.Struct('<QQ16s')
+_META_KEY = b''
+# Record keys are prefixed, so no record key can collide with the metadata
+_RECORD_PREFIX = b'k'
+# The length of a key in the key log of a run
+_KEY_LENGTH = struct.Struct('<I')
+
+
+class Entry(NamedTuple):
+    digest: bytes
+    generation: int
+    offset: int
+    length: int
+
+
+class Delta(NamedTuple):
+    changed: int
+    unchanged: int
+    removed: List[str]
+
+
+class Change(NamedTuple):
+    """
+    A mapped row of the current run together with the entry of its record in
+    the last committed run.
+    """
+
+    key: str
+    row: Any
+    digest: bytes
+    previous: Optional[Entry]
+
+    @property
+    def changed(self) -> bool:
+        return self.previous is None or self.previous.digest != self.digest
+
+
+def _canonical(value: Any) -> Any:
+    # Sets are not ordered the same way in every interpreter run
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+
+    return repr(value)
+
+
+def _digest(row: Any) -> bytes:
+    try:
+        data = json.dumps(
+            row, sort_keys=True, separators=(',', ':'), default=_canonical
+        )
+    except TypeError:
+        # Dicts with keys of different types can not be sorted
+        data = repr(row)
+
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).digest()
+
+
+class DeltaState:
+    """
+    A persistent store of the content hash of every exported record, used to
+    only export the records that changed since the last export. The hashes
+    are kept in a dbm database keyed by the record key, lookups read a single
+    entry and the state is never loaded into memory as a whole. dbm uses the
+    fastest backend that is available on the system and falls back to
+    dbm.dumb.
+
+    Rows are hashed as json with sorted keys, so the same data counts as
+    unchanged regardless of the order of its keys. Values that json can not
+    encode are hashed by their repr.
+
+    An export run starts when the changes of the records are iterated and
+    ends with commit, which also removes the records that were not seen. A
+    run that is not committed, for example because writing the output
+    failed, leaves the records it has seen marked as changed for the next run.
+    Every run logs the keys it has seen to a file next to the database, named
+    after the path and the generation of the run. Commit reads these logs to
+    find the removed records instead of going over the whole database. The
+    entries and keys of a run are written in batches, the keys of a batch are
+    logged before its entries are stored.
+
+    Example:
+        with DeltaState('export.state') as state:
+            changes = state.iter_changes(records, Mapper, key='id')
+            CsvDeserializer.deserialize_to_file(changes, RowMapper, file_object)
+            delta = state.commit()
+
+    Args:
+        path: The path of the dbm database, the database is created if it
+            does not exist.
+    """
+
+    def __init__(self, path: Union[str, 'os.PathLike[str]']):
+        self._path = os.fspath(path)
+        self._db = dbm.open(self._path, 'c')
+        meta = self._db.get(_META_KEY)
+        if meta is None:
+            self._committed, self._generation, self.prefix = 0, 0, bytes(16)
+        else:
+            self._committed, self._generation, self.prefix = _META.unpack(meta)
+        self._changed = 0
+        self._unchanged = 0
+        self._log: Optional[IO[bytes]] = None
+        self._pending: Dict[bytes, bytes] = {}
+
+    def __enter__(self) -> 'DeltaState':
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._db) - (_META_KEY in self._db)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def close(self) -> None:
+        self._close_log()
+        self._db.close()
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Returns the entry of a record if it was part of a committed run.
+
+        Args:
+            key: The key of the record.
+
+        Returns:
+            The stored entry or None.
+        """
+        value = self._db.get(_RECORD_PREFIX + key.encode('utf-8'))
+        if value is None:
+            return None
+
+        entry = Entry(*_ENTRY.unpack(value))
+        if entry.generation > self._committed:
+            # Written by a run that was not committed
+            return None
+
+        return entry
+
+    def diff(
+        self,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        key: KeyKind,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> Iterator[Change]:
+        """
+        Starts a new run, maps the records and yields a Change for every
+        mapped row. Every change has to be stored with update, records that
+        are not updated count as removed once the run is committed.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            key: The name of the field in the mapped row that identifies a
+                record, or some callable that returns the key of a mapped
+                row.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            An iterator over the changes of all records.
+        """
+        # The started generation is stored first, so the entries of a run that
+        # gets interrupted are not trusted by later runs.
+        self._close_log()
+        self._generation += 1
+        self._changed = 0
+        self._unchanged = 0
+        self._write_meta()
+        # Batches of keys are written to the log at once, see _flush
+        self._log = open(self._log_path(self._generation), 'ab', buffering=0)
+
+        get_key = key if callable(key) else lambda row: row[key]
+        rows = iter_dicts_from_records(mapper, records, batch_size, workers, executor)
+        for row in rows:
+            name = str(get_key(row))
+            yield Change(name, row, _digest(row), self.get(name))
+
+    def update(
+        self,
+        change: Change,
+        offset: int = 0,
+        length: int = 0,
+        changed: Optional[bool] = None,
+    ) -> None:
+        """
+        Stores the entry of a record for the current run.
+
+        Args:
+            change: Some change yielded by diff.
+            offset: The offset of the encoded record in the output.
+            length: The length of the encoded record in the output.
+            changed: Whether the record counts as changed, this defaults to
+                whether its content changed.
+
+        Raises:
+            ValueError: No run is started.
+        """
+        if self._log is None:
+            raise ValueError('The state has no started run')
+
+        name = change.key.encode('utf-8')
+        entry = _ENTRY.pack(change.digest, self._generation, offset, length)
+        self._pending[name] = entry
+        if len(self._pending) >= BATCH_SIZE:
+            self._flush()
+        if change.changed if changed is None else changed:
+            self._changed += 1
+        else:
+            self._unchanged += 1
+
+    def iter_changes(
+        self,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        key: KeyKind,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> Iterator[Any]:
+        """
+        Maps the records and yields the mapped rows of the records that are new
+        or changed since the last committed run. The rows can be written by
+        any deserializer with RowMapper as the mapper, only these rows are
+        encoded. Call commit once the rows are written.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            key: The name of the field in the mapped row that identifies a
+                record, or some callable that returns the key of a mapped
+                row.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            An iterator over the mapped rows of the changed records.
+        """
+        changes = self.diff(records, mapper, key, batch_size, workers, executor)
+        for change in changes:
+            if change.previous is not None and not change.changed:
+                # The position in the output of the last full export is kept
+                previous = change.previous
+                self.update(change, previous.offset, previous.length)
+            else:
+                self.update(change)
+                yield change.row
+
+    def commit(self) -> Delta:
+        """
+        Ends the current run. The records that were not seen in this run are
+        removed from the state.
+
+        Returns:
+            The amount of changed and unchanged records and the keys of the
+            removed records of this run.
+        """
+        self._close_log()
+        # The logs of the last committed run and of the runs that were
+        # interrupted since then hold the keys of every stored record
+        generations = range(max(self._committed, 1), self._generation)
+        removed: List[str] = []
+        for generation in generations:
+            for name in self._iter_log(generation):
+                value = self._db.get(_RECORD_PREFIX + name)
+                if value is not None and Entry(*_ENTRY.unpack(value)).generation != (
+                    self._generation
+                ):
+                    del self._db[_RECORD_PREFIX + name]
+                    removed.append(name.decode('utf-8'))
+
+        self._committed = self._generation
+        self._write_meta()
+        for generation in generations:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._log_path(generation))
+
+        delta = Delta(self._changed, self._unchanged, sorted(removed))
+        self._changed = 0
+        self._unchanged = 0
+
+        return delta
+
+    def _log_path(self, generation: int) -> str:
+        return f'{self._path}.{generation}.keys'
+
+    def _iter_log(self, generation: int) -> Iterator[bytes]:
+        try:
+            file_object = open(self._log_path(generation), 'rb')
+        except FileNotFoundError:
+            return
+
+        with file_object:
+            while header := file_object.read(_KEY_LENGTH.size):
+                if len(header) < _KEY_LENGTH.size:
+                    # The end of the log of an interrupted run
+                    return
+                (length,) = _KEY_LENGTH.unpack(header)
+                yield file_object.read(length)
+
+    def _flush(self) -> None:
+        # The keys reach the log before their entries reach the database, so a
+        # run that gets killed never leaves entries behind that no log lists.
+        if self._log is None or not self._pending:
+            return
+
+        self._log.write(
+            b''.join(
+                _KEY_LENGTH.pack(len(name)) + name for name in self._pending.keys()
+            )
+        )
+        for name, entry in self._pending.items():
+            self._db[_RECORD_PREFIX + name] = entry
+        self._pending.clear()
+
+    def _close_log(self) -> None:
+        if self._log is not None:
+            self._flush()
+            self._log.close()
+            self._log = None
+
+    def _write_meta(self) -> None:
+        meta = _META.pack(self._committed, self._generation, self.prefix)
+        self._db[_META_KEY] = meta
+
+
+def export_changes(
+    deserializer: Any,
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    file_object: IO[bytes],
+    state: DeltaState,
+    key: KeyKind,
+    batch_size: int = BATCH_SIZE,
+    workers: Optional[int] = None,
+    executor: Optional['Executor'] = None,
+    **kwargs: Any,
+) -> Delta:
+    """
+    Writes only the records that are new or changed since the last export to
+    a file object and commits the run. Nothing is written when no record has
+    changed.
+
+    Args:
+        deserializer: Some deserializer class whose deserialize_to_file method
+            takes an iterable of records, like CsvDeserializer,
+            JsonLinesDeserializer or StructDeserializer.
+        records: Some iterable of concrete record instances.
+        mapper: Some concrete mapper class that inherits from BaseMapper, this
+            mapper should be specific for the type of record passed in.
+        file_object: Some file-like object that can be written to.
+        state: The DeltaState of the previous exports.
+        key: The name of the field in the mapped row that identifies a record,
+            or some callable that returns the key of a mapped row.
+        batch_size: The amount of records that get passed to the batch hooks
+            of the mapper at once.
+        workers: The amount of worker processes to map the batches in.
+        executor: Some concurrent.futures.Executor to map the batches in.
+        **kwargs: Passed on to deserialize_to_file.
+
+    Returns:
+        The amount of changed and unchanged records and the keys of the
+        removed records.
+
+    Raises:
+        ValueError: An error has occured while doing I/O operations.
+    """
+    changes = state.iter_changes(records, mapper, key, batch_size, workers, executor)
+    first = next(changes, _SENTINEL)
+    if first is not _SENTINEL:
+        changes = itertools.chain([first], changes)
+        deserializer.deserialize_to_file(changes, RowMapper, file_object, **kwargs)
+
+    return state.commit()
+
+
+def _line_encoder(
+    deserializer: Any, row: Any, kwargs: Any
+) -> Tuple[bytes, Callable[[List[Any]], List[bytes]]]:
+    """
+    Splits the output of a deserializer into the prefix, like the header of a
+    csv file, and the lines of the records. This only works for deserializers
+    that write every record as a separate line and have an iter_deserialize
+    method.
+    """
+    if not hasattr(deserializer, 'iter_deserialize'):
+        raise ValueError(f'{deserializer.__name__} does not write records as lines')
+
+    one = deserializer.deserialize([row], RowMapper, **kwargs)
+    two = deserializer.deserialize([row, row], RowMapper, **kwargs)
+    line = two[len(one) :]
+    prefix = one[: len(one) - len(line)]
+    if not line or two != prefix + line + line:
+        raise ValueError(f'{deserializer.__name__} does not write records as lines')
+
+    def encode(rows: List[Any]) -> List[bytes]:
+        if not rows:
+            return []
+
+        # A chunk size of 1 yields every line as a chunk of its own
+        chunks = list(
+            deserializer.iter_deserialize(rows, RowMapper, chunk_size=1, **kwargs)
+        )
+        split = len(chunks) - len(rows)
+        if split < 0 or b''.join(chunks[:split]) != prefix:
+            raise ValueError('The records do not share the same prefix')
+        return chunks[split:]
+
+    return prefix, encode
+
+
+def _previous_line(change: Change, old: Buffer) -> Optional[Buffer]:
+    # Returns the line of an unchanged record in the previous output
+    entry = change.previous
+    if entry is None or change.changed or not entry.length:
+        return None
+    if entry.offset + entry.length > len(old):
+        return None
+    return old[entry.offset : entry.offset + entry.length]
+
+
+def export_full(
+    deserializer: Any,
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    file_object: IO[bytes],
+    state: DeltaState,
+    key: KeyKind,
+    previous: Optional[Union[str, 'os.PathLike[str]']] = None,
+    batch_size: int = BATCH_SIZE,
+    workers: Optional[int] = None,
+    executor: Optional['Executor'] = None,
+    fsync: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    **kwargs: Any,
+) -> Delta:
+    """
+    Writes all records to a file object and commits the run, like
+    deserialize_to_file would. The lines of the records that did not change
+    are copied from the output of the previous export instead of being
+    encoded again, only the changed records are encoded.
+
+    This only works for deserializers that write every record as a separate
+    line, like CsvDeserializer and JsonLinesDeserializer. The changed records
+    are encoded in batches of batch_size records.
+
+    Args:
+        deserializer: Some line based deserializer class.
+        records: Some iterable of concrete record instances.
+        mapper: Some concrete mapper class that inherits from BaseMapper, this
+            mapper should be specific for the type of record passed in.
+        file_object: Some file-like object that can be written to.
+        state: The DeltaState of the previous exports.
+        key: The name of the field in the mapped row that identifies a record,
+            or some callable that returns the key of a mapped row.
+        previous: The path of the output of the last committed export_full
+            run with this state. It can not be the file that is written to.
+            Every record is encoded when nothing is passed in.
+        batch_size: The amount of records that get passed to the batch hooks
+            of the mapper at once.
+        workers: The amount of worker processes to map the batches in.
+        executor: Some concurrent.futures.Executor to map the batches in.
+        fsync: Whether os.fsync is called after every write to the file
+            object.
+        progress: Some callable that gets called with a writers.Progress
+            after every write to the file object.
+        **kwargs: Passed on to the deserialize and iter_deserialize methods of
+            the deserializer.
+
+    Returns:
+        The amount of changed and unchanged records and the keys of the
+        removed records.
+
+    Raises:
+        ValueError: The deserializer does not write records as lines.
+        OSError: An error has occured while doing I/O operations.
+    """
+    changes = state.diff(records, mapper, key, batch_size, workers, executor)
+    first = next(changes, None)
+    if first is None:
+        return state.commit()
+
+    prefix, encode = _line_encoder(deserializer, first.row, kwargs)
+    prefix_digest = hashlib.blake2b(prefix, digest_size=16).digest()
+    # The lines of the previous output can only be reused if it has the same
+    # prefix, a csv header with other fields for example.
+    source: Any = contextlib.nullcontext(b'')
+    if previous is not None and state.prefix == prefix_digest:
+        source = map_file(previous)
+
+    with source as old, ChunkedWriter(
+        file_object, fsync=fsync, progress=progress
+    ) as writer:
+        writer.write(prefix, records=0)
+        offset = len(prefix)
+        for batch in batched(itertools.chain([first], changes), batch_size):
+            copies = [_previous_line(change, old) for change in batch]
+            rows = [change.row for change, copy in zip(batch, copies) if copy is None]
+            lines = iter(encode(rows))
+            for change, copy in zip(batch, copies):
+                data = next(lines) if copy is None else copy
+                state.update(change, offset, len(data), changed=copy is None)
+                writer.write(data)
+                offset += len(data)
+
+    state.prefix = prefix_digest
+    return state.commit()
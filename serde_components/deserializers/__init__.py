@@ -1,4 +1,37 @@
 # -*- coding: utf-8 -*-
-from .base import BaseDeserializer
-from .csv_deserializer import CsvDeserializer
-from .json_deserializer import JsonDeserializer
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import BaseDeserializer
+    from .csv_deserializer import CsvDeserializer
+    from .fan_out import FanOutDeserializer, Sink
+    from .json_deserializer import JsonDeserializer
+    from .json_lines_deserializer import JsonLinesDeserializer
+    from .struct_deserializer import StructDeserializer
+    from .toml_deserializer import TomlDeserializer
+
+__all__ = [
+    'BaseDeserializer',
+    'CsvDeserializer',
+    'FanOutDeserializer',
+    'JsonDeserializer',
+    'JsonLinesDeserializer',
+    'Sink',
+    'StructDeserializer',
+    'TomlDeserializer',
+]
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'BaseDeserializer': '.base',
+        'CsvDeserializer': '.csv_deserializer',
+        'FanOutDeserializer': '.fan_out',
+        'JsonDeserializer': '.json_deserializer',
+        'JsonLinesDeserializer': '.json_lines_deserializer',
+        'Sink': '.fan_out',
+        'StructDeserializer': '.struct_deserializer',
+        'TomlDeserializer': '.toml_deserializer',
+    },
+)
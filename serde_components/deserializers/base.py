@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 import abc
-from typing import Generic, IO, Type, TypeVar
+from typing import Generic, IO, Optional, Type, TypeVar
 
+from ..compression import AUTO, CompressionKind, writing
 from ..mappers import BaseMapper
+from ..utils import AsyncWriter, awrite
+from ..writers import ChunkedWriter, ProgressCallback
 
 T = TypeVar('T')
 
@@ -37,11 +40,19 @@ class BaseDeserializer(abc.ABC, Generic[T]):
 
     @classmethod
     def deserialize_to_file(
-        cls, record: T, mapper: Type[BaseMapper[T]], file_object: IO[bytes]
+        cls,
+        record: T,
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        *,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
     ) -> None:
         """
         A convenience method that maps the record with the passed in mapper and
-        writes it to a file object.
+        writes it to a file object through a writers.ChunkedWriter.
 
         Args:
             record: Some concrete record instance.
@@ -50,9 +61,45 @@ class BaseDeserializer(abc.ABC, Generic[T]):
                 in.
             file_object: Some file-like object that can be read from. This
                 includes io.BytesIO and file objects opened in byte mode.
+            fsync: Whether os.fsync is called after writing to the file object.
+            progress: Some callable that gets called with a writers.Progress
+                after writing to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
 
         Raises:
             ValueError: An error has occured while doing I/O operations.
         """
         data = cls.deserialize(record, mapper)
-        file_object.write(data)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, fsync=fsync, progress=progress
+        ) as writer:
+            writer.write(data)
+
+    @classmethod
+    async def adeserialize_to_stream(
+        cls, record: T, mapper: Type[BaseMapper[T]], writer: AsyncWriter
+    ) -> None:
+        """
+        The asynchronous version of deserialize_to_file. It maps the record
+        with the passed in mapper and writes it to an asyncio.StreamWriter or
+        any other object with an asynchronous write method. The writer is
+        drained after writing when it has a drain method.
+
+        Args:
+            record: Some concrete record instance.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            writer: Some object with a write method that is either awaitable or
+                paired with an awaitable drain method.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        data = cls.deserialize(record, mapper)
+        await awrite(writer, data)
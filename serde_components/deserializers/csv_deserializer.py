@@ -1,20 +1,71 @@
 # -*- coding: utf-8 -*-
-import ast
-import io
 import csv
-from typing import Generic, IO, Type, TypeVar
+from typing import TYPE_CHECKING
+from typing import Any, Generic, IO, Iterator, Mapping, Optional, Sequence, Type
+from typing import TypeVar
 from typing import Iterable as Iter
 
 from .base import BaseDeserializer
-from ..mappers import BaseMapper
+from ..columns import iter_column_rows
+from ..compression import AUTO, CompressionKind, writing
+from ..instrumentation import timed
+from ..mappers import BaseMapper, iter_dicts_from_records
+from ..utils import BATCH_SIZE, CHUNK_SIZE, AsyncWriter, awrite
+from ..writers import ChunkedWriter, ProgressCallback, iter_chunks
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 T = TypeVar('T')
 
 
+class _Echo:
+    """
+    A stand-in file object for csv writers. The write methods of a csv writer
+    return what the file object returns, so every row is encoded on its own.
+    """
+
+    @staticmethod
+    def write(line: str) -> str:
+        return line
+
+
+def _iter_lines(
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    batch_size: int,
+    workers: Optional[int],
+    executor: Optional['Executor'],
+) -> Iterator[bytes]:
+    writer = None
+
+    rows = iter_dicts_from_records(mapper, records, batch_size, workers, executor)
+    for row in rows:
+        if writer is None:
+            keys = list(row.keys())
+            writer = csv.DictWriter(_Echo(), fieldnames=keys, dialect='unix')
+            writerow = timed(writer.writerow, 'CsvDeserializer', 'encode')
+            yield writer.writeheader().encode('utf-8')
+        yield writerow(row).encode('utf-8')
+
+    assert writer is not None
+
+
+def _iter_column_lines(columns: Mapping[str, Sequence[Any]]) -> Iterator[bytes]:
+    writer = csv.writer(_Echo(), dialect='unix')
+    for row in iter_column_rows(columns):
+        yield writer.writerow(row).encode('utf-8')
+
+
 class CsvDeserializer(BaseDeserializer, Generic[T]):
     @staticmethod
-    def deserialize(records: Iter[T], mapper: Type[BaseMapper[T]]) -> bytes:
+    def deserialize(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> bytes:
         """
         This method takes in a iterable over the records and maps the data from
         a to a csv format. It takes an iterable since a csv will contain rows
@@ -29,51 +80,232 @@ class CsvDeserializer(BaseDeserializer, Generic[T]):
             mapper: Some concrete mapper class that inherits from BaseMapper,
                 this mapper should be specific for the type of record passed
                 in.
-            data: Some bytestring that represents the record in a format
-                specified by the concrete Deserializer.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
 
         Returns:
             A bytestring of the data encoded by the specific Deserializer.
         """
-        mapped_data = []
-        for record in records:
-            b_data: bytes = mapper.map_deserialize(record)  # type:ignore
-            data = b_data.decode('utf-8')
-            mapped_data.append(ast.literal_eval(data))
+        chunks = CsvDeserializer.iter_deserialize(
+            records,
+            mapper,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+        )
+
+        return b''.join(chunks)
+
+    @staticmethod
+    def iter_deserialize(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> Iterator[bytes]:
+        """
+        This method maps the records to a csv format one row at a time and
+        yields the encoded output in chunks. The header is taken from the keys
+        of the first mapped record. Only a single chunk is held in memory at
+        any time, so the memory use does not depend on the amount of records.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            chunk_size: The amount of bytes that get buffered before a chunk
+                is yielded.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            An iterator over bytestrings that together form the csv data.
+        """
+        lines = _iter_lines(records, mapper, batch_size, workers, executor)
+        return iter_chunks(lines, chunk_size)
+
+    @staticmethod
+    def deserialize_columns(columns: Mapping[str, Sequence[Any]]) -> bytes:
+        """
+        This method writes columns, like the ones returned by
+        CsvSerializer.serialize_columns, to a csv format. The column names are
+        used as the header.
+
+        Args:
+            columns: Some mapping of column names to sequences of values. All
+                columns need to have the same length.
+
+        Returns:
+            A bytestring of the csv data.
+
+        Raises:
+            ValueError: The columns do not all have the same length.
+        """
+        return b''.join(CsvDeserializer.iter_deserialize_columns(columns))
 
-        assert len(mapped_data) >= 1
+    @staticmethod
+    def iter_deserialize_columns(
+        columns: Mapping[str, Sequence[Any]],
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        This method writes columns to a csv format and yields the encoded
+        output in chunks. The rows are assembled by zipping the columns, no
+        mapper or per-row dict is involved.
 
-        keys = list(mapped_data[0].keys())
-        file_object = io.StringIO('')
+        Args:
+            columns: Some mapping of column names to sequences of values. All
+                columns need to have the same length.
+            chunk_size: The amount of bytes that get buffered before a chunk
+                is yielded.
 
-        writer = csv.DictWriter(file_object, fieldnames=keys, dialect='unix')
-        writer.writeheader()
-        for row in mapped_data:
-            writer.writerow(row)
+        Returns:
+            An iterator over bytestrings that together form the csv data.
 
-        return file_object.getvalue().encode('utf-8')
+        Raises:
+            ValueError: The columns do not all have the same length.
+        """
+        return iter_chunks(_iter_column_lines(columns), chunk_size)
+
+    @classmethod
+    def deserialize_columns_to_file(
+        cls,
+        columns: Mapping[str, Sequence[Any]],
+        file_object: IO[bytes],
+        flush_records: Optional[int] = None,
+        flush_bytes: int = CHUNK_SIZE,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        A convenience method that writes columns to a file object in a csv
+        format. The rows are written in chunks through a writers.ChunkedWriter.
+
+        Args:
+            columns: Some mapping of column names to sequences of values. All
+                columns need to have the same length.
+            file_object: Some file-like object that can be written to. This
+                includes io.BytesIO and file objects opened in byte mode.
+            flush_records: The amount of rows after which the buffered rows
+                are written to the file object.
+            flush_bytes: The amount of bytes after which the buffered rows are
+                written to the file object.
+            fsync: Whether os.fsync is called after every write to the file
+                object.
+            progress: Some callable that gets called with a writers.Progress
+                after every write to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
+
+        Raises:
+            ValueError: The columns do not all have the same length or an error
+                has occured while doing I/O operations.
+        """
+        lines = _iter_column_lines(columns)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, flush_records, flush_bytes, fsync, progress
+        ) as writer:
+            writer.write(next(lines), records=0)
+            writer.writelines(lines)
 
     @classmethod
     def deserialize_to_file(
-        cls, record: Iter[T], mapper: Type[BaseMapper], file_object: IO[bytes]
+        cls,
+        record: Iter[T],
+        mapper: Type[BaseMapper],
+        file_object: IO[bytes],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        flush_records: Optional[int] = None,
+        flush_bytes: int = CHUNK_SIZE,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
     ) -> None:
         """
-        A convenience method that maps the record with the passed in mapper and
-        writes it to a file object.
-        This method only gets overwriten to change the accepted types.
+        A convenience method that maps the records with the passed in mapper
+        and writes them to a file object. The rows are written in chunks
+        through a writers.ChunkedWriter as they are mapped, the full csv data
+        is never held in memory.
 
         Args:
-            record: Some concrete record instance.
+            record: Some iterable of concrete record instances.
             mapper: Some concrete mapper class that inherits from BaseMapper,
                 this mapper should be specific for the type of record passed
                 in.
-            file_object: Some file-like object that can be read from. This
+            file_object: Some file-like object that can be written to. This
                 includes io.BytesIO and file objects opened in byte mode.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            flush_records: The amount of rows after which the buffered rows
+                are written to the file object.
+            flush_bytes: The amount of bytes after which the buffered rows are
+                written to the file object.
+            fsync: Whether os.fsync is called after every write to the file
+                object.
+            progress: Some callable that gets called with a writers.Progress
+                after every write to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        lines = _iter_lines(record, mapper, batch_size, workers, executor)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, flush_records, flush_bytes, fsync, progress
+        ) as writer:
+            # The header does not count as a record
+            writer.write(next(lines), records=0)
+            writer.writelines(lines)
+
+    @classmethod
+    async def adeserialize_to_stream(
+        cls,
+        record: Iter[T],
+        mapper: Type[BaseMapper],
+        writer: AsyncWriter,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        """
+        The asynchronous version of deserialize_to_file. The csv data is
+        written to an asyncio.StreamWriter or any other object with an
+        asynchronous write method one chunk at a time, and the writer is
+        drained between chunks.
+
+        Args:
+            record: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            writer: Some object with a write method that is either awaitable or
+                paired with an awaitable drain method.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
 
         Raises:
             ValueError: An error has occured while doing I/O operations.
         """
-        r = record
-        m = mapper
-        f = file_object
-        return super().deserialize_to_file(r, m, f)
+        for chunk in cls.iter_deserialize(record, mapper, batch_size=batch_size):
+            await awrite(writer, chunk)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+import functools
+import io
+import queue
+from typing import TYPE_CHECKING
+from typing import Any, Dict, Generic, IO, Iterator, List, NamedTuple, Optional
+from typing import Type, TypeVar
+from typing import Iterable as Iter
+
+from .base import BaseDeserializer
+from ..mappers import BaseMapper, RowMapper, dicts_from_records
+from ..utils import _SENTINEL, BATCH_SIZE, batched, map_batches
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+# The amount of batches that can be queued for every sink
+MAX_PENDING = 4
+
+
+class Sink(NamedTuple):
+    """
+    An output of the FanOutDeserializer.
+
+    Args:
+        deserializer: Some deserializer class.
+        file_object: Some file-like object that can be written to.
+        kwargs: Passed on to the method of the deserializer.
+        method: The name of the method of the deserializer that takes the
+            rows, a mapper and the file object.
+        collect: Whether the rows are passed as a list instead of an
+            iterator. This is needed for deserializers that encode a single
+            document, like JsonDeserializer.
+    """
+
+    deserializer: Any
+    file_object: IO[bytes]
+    kwargs: Optional[Dict[str, Any]] = None
+    method: str = 'deserialize_to_file'
+    collect: bool = False
+
+
+class _Aborted(Exception):
+    pass
+
+
+class _Feed:
+    """
+    The bounded queue of batches of a single sink.
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        self.batches: 'queue.Queue[Any]' = queue.Queue(maxsize=max_pending)
+        self.done = False
+        self.failed = False
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            batch = self.batches.get()
+            if batch is _SENTINEL:
+                self.done = True
+                return
+            if isinstance(batch, _Aborted):
+                raise batch
+            yield from batch
+
+    def drain(self) -> None:
+        while not self.done:
+            self.done = self.batches.get() is _SENTINEL
+
+
+def _write(sink: Sink, feed: _Feed) -> None:
+    try:
+        rows: Iter[Any] = list(feed) if sink.collect else feed
+        method = getattr(sink.deserializer, sink.method)
+        method(rows, RowMapper, sink.file_object, **(sink.kwargs or {}))
+    except BaseException:
+        feed.failed = True
+        raise
+    finally:
+        # A sink that stopped early keeps taking batches until the end, so the
+        # mapping of the records never blocks on its full queue.
+        feed.drain()
+
+
+class FanOutDeserializer(BaseDeserializer, Generic[T]):
+    """
+    This class maps every record exactly once and writes the mapped rows to
+    several deserializers in a single pass over the records, so the records
+    do not have to be materialised and the mapper cost is paid once no matter
+    how many formats are written.
+
+    Every sink is written in its own thread. The rows are passed to the sinks
+    in batches through bounded queues, a slow sink holds back the mapping of
+    the records instead of letting the batches pile up in memory.
+
+    Example:
+        FanOutDeserializer.deserialize_to_file(records, Mapper, [
+            Sink(CsvDeserializer, csv_file),
+            Sink(JsonLinesDeserializer, json_lines_file),
+        ])
+    """
+
+    @classmethod
+    def deserialize(  # type:ignore
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        deserializers: List[Any],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> List[bytes]:
+        """
+        This method takes in a iterable over the records and encodes them with
+        every deserializer, the records are mapped once.
+
+        This class takes a different type than the BaseDeserializer, it does
+        not make sense for a fan-out deserializer to only map a single record.
+        For this reason the type checking is ignored.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            deserializers: Some deserializer classes whose
+                deserialize_to_file method takes an iterable of records.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            A bytestring of the encoded data for every deserializer.
+        """
+        sinks = [Sink(deserializer, io.BytesIO()) for deserializer in deserializers]
+        cls.deserialize_to_file(
+            records,
+            mapper,
+            sinks,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+        )
+
+        return [sink.file_object.getvalue() for sink in sinks]  # type:ignore
+
+    @classmethod
+    def deserialize_to_file(  # type:ignore
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        sinks: List[Sink],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        max_pending: int = MAX_PENDING,
+    ) -> None:
+        """
+        A convenience method that maps the records with the passed in mapper
+        and writes the mapped rows to every sink in a single pass.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            sinks: The outputs, every Sink holds a deserializer and the file
+                object it writes to.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once, and the amount of rows that get
+                passed to the sinks at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            max_pending: The amount of batches that can be queued for every
+                sink.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        feeds = [_Feed(max_pending) for _ in sinks]
+        with ThreadPoolExecutor(max_workers=len(sinks) or 1) as pool:
+            futures = [
+                pool.submit(_write, sink, feed) for sink, feed in zip(sinks, feeds)
+            ]
+            aborted = False
+            try:
+                function = functools.partial(dicts_from_records, mapper)
+                batches = batched(records, batch_size)
+                for rows in map_batches(function, batches, workers, executor):
+                    if any(feed.failed for feed in feeds):
+                        aborted = True
+                        break
+                    for feed in feeds:
+                        feed.batches.put(rows)
+            except BaseException:
+                aborted = True
+                raise
+            finally:
+                # Aborted sinks raise, so they do not finish a partial output
+                for feed in feeds:
+                    if aborted:
+                        feed.batches.put(_Aborted())
+                    feed.batches.put(_SENTINEL)
+
+            # The sinks that were aborted because another sink failed are skipped,
+            # the error of the failed sink is raised
+            for future in futures:
+                error = future.exception()
+                if error is not None and not isinstance(error, _Aborted):
+                    raise error
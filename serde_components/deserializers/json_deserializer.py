@@ -1,22 +1,87 @@
 # -*- coding: utf-8 -*-
-import ast
-import json
-from typing import Generic, Type, TypeVar
+from typing import Generic, IO, Optional, Type, TypeVar
 
 from .base import BaseDeserializer
-from ..mappers import BaseMapper
+from ..compression import AUTO, CompressionKind, writing
+from ..instrumentation import timed
+from ..json_backends import BackendKind, get_backend
+from ..mappers import BaseMapper, dict_from_record
+from ..writers import ChunkedWriter, ProgressCallback
 
 T = TypeVar('T')
 
 
 class JsonDeserializer(BaseDeserializer, Generic[T]):
     @staticmethod
-    def deserialize(record: T, mapper: Type[BaseMapper[T]]) -> bytes:
-        _data: bytes = mapper.map_deserialize(record)  # type:ignore
-        data = ast.literal_eval(_data.decode('utf-8'))
-        json_data: bytes = json.dumps(data).encode('utf-8')
+    def deserialize(
+        record: T,
+        mapper: Type[BaseMapper[T]],
+        backend: BackendKind = None,
+    ) -> bytes:
+        """
+        This method maps the record with the passed in mapper and encodes the
+        result as a json document.
+
+        Args:
+            record: Some concrete record instance.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+
+        Returns:
+            A bytestring of the data encoded by the specific Deserializer.
+        """
+        data = dict_from_record(mapper, record)
+        dumps = timed(get_backend(backend).dumps, 'JsonDeserializer', 'encode')
+        json_data: bytes = dumps(data)
 
         return json_data
 
+    @classmethod
+    def deserialize_to_file(
+        cls,
+        record: T,
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        *,
+        backend: BackendKind = None,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        A convenience method that maps the record with the passed in mapper and
+        writes it as a json document to a file object.
+
+        Args:
+            record: Some concrete record instance.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be written to. This
+                includes io.BytesIO and file objects opened in byte mode.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fsync: Whether os.fsync is called after writing to the file object.
+            progress: Some callable that gets called with a writers.Progress
+                after writing to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
 
-JsonDeserializer.deserialize.__doc__ = BaseDeserializer.deserialize.__doc__
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        data = cls.deserialize(record, mapper, backend=backend)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, fsync=fsync, progress=progress
+        ) as writer:
+            writer.write(data)
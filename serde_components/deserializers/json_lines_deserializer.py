@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+from typing import TYPE_CHECKING
+from typing import Generic, IO, Iterator, Optional, Type, TypeVar
+from typing import Iterable as Iter
+
+from .base import BaseDeserializer
+from ..compression import AUTO, CompressionKind, writing
+from ..instrumentation import timed
+from ..json_backends import BackendKind, get_backend
+from ..mappers import BaseMapper, iter_dicts_from_records
+from ..utils import BATCH_SIZE, CHUNK_SIZE, AsyncWriter, awrite
+from ..writers import ChunkedWriter, ProgressCallback, iter_chunks
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+
+
+def _iter_lines(
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    batch_size: int,
+    workers: Optional[int],
+    executor: Optional['Executor'],
+    backend: BackendKind,
+) -> Iterator[bytes]:
+    dumps = timed(get_backend(backend).dumps, 'JsonLinesDeserializer', 'encode')
+    rows = iter_dicts_from_records(mapper, records, batch_size, workers, executor)
+    for row in rows:
+        yield dumps(row) + b'\n'
+
+
+class JsonLinesDeserializer(BaseDeserializer, Generic[T]):
+    @staticmethod
+    def deserialize(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        backend: BackendKind = None,
+    ) -> bytes:
+        """
+        This method takes in a iterable over the records and maps the data to
+        the json lines format, every record is written as a single json object
+        on its own line.
+
+        This class takes a different type than the BaseDeserializer, it does
+        not make sense for a json lines deserializer to only map a single
+        record. For this reason the type checking is ignored.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+
+        Returns:
+            A bytestring of the data encoded by the specific Deserializer.
+        """
+        chunks = JsonLinesDeserializer.iter_deserialize(
+            records,
+            mapper,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+            backend=backend,
+        )
+
+        return b''.join(chunks)
+
+    @staticmethod
+    def iter_deserialize(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        backend: BackendKind = None,
+    ) -> Iterator[bytes]:
+        """
+        This method maps the records to the json lines format one line at a
+        time and yields the encoded output in chunks. Only a single chunk is
+        held in memory at any time.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            chunk_size: The amount of bytes that get buffered before a chunk
+                is yielded.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+
+        Returns:
+            An iterator over bytestrings that together form the json lines
+            data.
+        """
+        lines = _iter_lines(records, mapper, batch_size, workers, executor, backend)
+        return iter_chunks(lines, chunk_size)
+
+    @classmethod
+    def deserialize_to_file(
+        cls,
+        record: Iter[T],
+        mapper: Type[BaseMapper],
+        file_object: IO[bytes],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        backend: BackendKind = None,
+        flush_records: Optional[int] = None,
+        flush_bytes: int = CHUNK_SIZE,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        A convenience method that maps the records with the passed in mapper
+        and writes them to a file object. The lines are written in chunks
+        through a writers.ChunkedWriter as they are mapped, the full json lines
+        data is never held in memory.
+
+        Args:
+            record: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be written to. This
+                includes io.BytesIO and file objects opened in byte mode.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            flush_records: The amount of records after which the buffered
+                lines are written to the file object.
+            flush_bytes: The amount of bytes after which the buffered lines
+                are written to the file object.
+            fsync: Whether os.fsync is called after every write to the file
+                object.
+            progress: Some callable that gets called with a writers.Progress
+                after every write to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        lines = _iter_lines(record, mapper, batch_size, workers, executor, backend)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, flush_records, flush_bytes, fsync, progress
+        ) as writer:
+            writer.writelines(lines)
+
+    @classmethod
+    async def adeserialize_to_stream(
+        cls,
+        record: Iter[T],
+        mapper: Type[BaseMapper],
+        writer: AsyncWriter,
+        batch_size: int = BATCH_SIZE,
+        backend: BackendKind = None,
+    ) -> None:
+        """
+        The asynchronous version of deserialize_to_file. The json lines data is
+        written to an asyncio.StreamWriter or any other object with an
+        asynchronous write method one chunk at a time, and the writer is
+        drained between chunks.
+
+        Args:
+            record: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            writer: Some object with a write method that is either awaitable or
+                paired with an awaitable drain method.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        chunks = cls.iter_deserialize(
+            record, mapper, batch_size=batch_size, backend=backend
+        )
+        for chunk in chunks:
+            await awrite(writer, chunk)
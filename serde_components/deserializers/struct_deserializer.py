@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from typing import TYPE_CHECKING
+from typing import Any, ClassVar, Dict, Generic, IO, Iterator, List, Optional
+from typing import Tuple, Type, TypeVar
+from typing import Iterable as Iter
+
+from .base import BaseDeserializer
+from ..compression import AUTO, CompressionKind, writing
+from ..mappers import BaseMapper, iter_dicts_from_records
+from ..struct_layout import DICTIONARY, FOOTER, MAGIC, NULL, StructLayout
+from ..struct_layout import pack_table
+from ..utils import BATCH_SIZE, CHUNK_SIZE
+from ..writers import ChunkedWriter, ProgressCallback
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+LAYOUT_ERROR = 'No layout is passed in or declared on the class'
+
+
+def _iter_packed(
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    layout: StructLayout,
+    chunk_size: int,
+    batch_size: int,
+    workers: Optional[int],
+    executor: Optional['Executor'],
+) -> Iterator[Tuple[memoryview, int]]:
+    # Yields views on a single reused buffer together with the amount of
+    # records in them, a view is only valid until the next one is requested.
+    names = layout.names
+    string_indices = layout.string_indices
+    dictionary = layout.strings == DICTIONARY
+    codes: Dict[str, int] = {}
+    table: List[str] = []
+    pack_into = layout.struct.pack_into
+    size = layout.struct.size
+
+    buffer = bytearray(max(chunk_size, size))
+    offset = 0
+    count = 0
+    chunk_records = 0
+    written = 0
+
+    rows = iter_dicts_from_records(mapper, records, batch_size, workers, executor)
+    for row in rows:
+        values: List[Any] = [row.get(name) for name in names]
+        strings: List[bytes] = []
+        for index in string_indices:
+            value = values[index]
+            if value is None:
+                values[index] = NULL
+            elif dictionary:
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(table)
+                    table.append(value)
+                values[index] = code
+            else:
+                encoded = value.encode('utf-8')
+                values[index] = len(encoded)
+                strings.append(encoded)
+
+        needed = size + sum(len(encoded) for encoded in strings)
+        if offset + needed > len(buffer):
+            if offset:
+                yield memoryview(buffer)[:offset], chunk_records
+                written += offset
+                offset = 0
+                chunk_records = 0
+            if needed > len(buffer):
+                buffer = bytearray(needed)
+
+        pack_into(buffer, offset, *values)
+        offset += size
+        for encoded in strings:
+            buffer[offset : offset + len(encoded)] = encoded
+            offset += len(encoded)
+        count += 1
+        chunk_records += 1
+
+    if offset:
+        yield memoryview(buffer)[:offset], chunk_records
+        written += offset
+
+    tail = pack_table(table) if dictionary and string_indices else b''
+    tail += FOOTER.pack(count, written, MAGIC)
+    yield memoryview(tail), 0
+
+
+class StructDeserializer(BaseDeserializer, Generic[T]):
+    """
+    This class writes records in a binary format that is described by a
+    struct_layout.StructLayout. The layout is either declared on a derived
+    class or passed in to every method.
+
+    Example:
+        class RecordDeserializer(StructDeserializer[Record]):
+            layout = StructLayout([('age', 'q'), ('name', 'str')])
+    """
+
+    layout: ClassVar[Optional[StructLayout]] = None
+
+    @classmethod
+    def deserialize(  # type:ignore
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        layout: Optional[StructLayout] = None,
+    ) -> bytes:
+        """
+        This method takes in a iterable over the records and packs the mapped
+        data of every record with the layout.
+
+        This class takes a different type than the BaseDeserializer, it does
+        not make sense for a binary record format to only map a single record.
+        For this reason the type checking is ignored.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            layout: The layout that describes the fields, this defaults to the
+                layout of the class.
+
+        Returns:
+            A bytestring of the data encoded by the specific Deserializer.
+
+        Raises:
+            ValueError: No layout is available.
+            struct.error: A value does not fit its field.
+        """
+        chunks = cls.iter_deserialize(
+            records,
+            mapper,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+            layout=layout,
+        )
+
+        return b''.join(chunks)
+
+    @classmethod
+    def iter_deserialize(
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        layout: Optional[StructLayout] = None,
+    ) -> Iterator[bytes]:
+        """
+        This method packs the records into a single reused buffer and yields
+        its contents whenever it is full. The string table and the footer are
+        yielded last.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            chunk_size: The size of the reused buffer in bytes.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            layout: The layout that describes the fields, this defaults to the
+                layout of the class.
+
+        Returns:
+            An iterator over bytestrings that together form the binary data.
+
+        Raises:
+            ValueError: No layout is available.
+            struct.error: A value does not fit its field.
+        """
+        _layout = cls._get_layout(layout)
+        chunks = _iter_packed(
+            records, mapper, _layout, chunk_size, batch_size, workers, executor
+        )
+        for view, _ in chunks:
+            yield bytes(view)
+
+    @classmethod
+    def deserialize_to_file(  # type:ignore
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        layout: Optional[StructLayout] = None,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        A convenience method that packs the records and writes them to a file
+        object. The reused buffer is written directly, the binary data is
+        never copied or held in memory as a whole.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be written to. This
+                includes io.BytesIO and file objects opened in byte mode.
+            chunk_size: The size of the reused buffer in bytes.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            layout: The layout that describes the fields, this defaults to the
+                layout of the class.
+            fsync: Whether os.fsync is called after every write to the file
+                object.
+            progress: Some callable that gets called with a writers.Progress
+                after every write to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
+
+        Raises:
+            ValueError: No layout is available or an error has occured while
+                doing I/O operations.
+            struct.error: A value does not fit its field.
+        """
+        _layout = cls._get_layout(layout)
+        chunks = _iter_packed(
+            records, mapper, _layout, chunk_size, batch_size, workers, executor
+        )
+        output = writing(file_object, compression, compression_level)
+        # Every chunk but the tail fills the buffer, flush_bytes=1 writes them
+        # straight through without copying them into the writer buffer. The
+        # views are copied once, the file object may keep what it is passed
+        # while the packing buffer is reused.
+        with output as stream, ChunkedWriter(
+            stream, flush_bytes=1, fsync=fsync, progress=progress
+        ) as writer:
+            for view, count in chunks:
+                writer.write(bytes(view), records=count)
+
+    @classmethod
+    def _get_layout(cls, layout: Optional[StructLayout]) -> StructLayout:
+        _layout = layout or cls.layout
+        if _layout is None:
+            raise ValueError(LAYOUT_ERROR)
+        return _layout
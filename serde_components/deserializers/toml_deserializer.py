@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+import datetime
+import math
+import re
+from typing import TYPE_CHECKING
+from typing import Any, Generic, IO, Iterator, Mapping, Optional, Tuple, Type
+from typing import TypeVar
+from typing import Iterable as Iter
+
+from .base import BaseDeserializer
+from ..compression import AUTO, CompressionKind, writing
+from ..instrumentation import timed
+from ..mappers import BaseMapper, dict_from_record, iter_dicts_from_records
+from ..utils import BATCH_SIZE, CHUNK_SIZE, AsyncWriter, awrite
+from ..writers import ChunkedWriter, ProgressCallback, iter_chunks
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+TABLE_NAME = 'records'
+
+_BARE_KEY = re.compile(r'[A-Za-z0-9_-]+')
+_ESCAPE = re.compile(r'[\x00-\x1f"\\\x7f]')
+_ESCAPES = {'\b': '\\b', '\t': '\\t', '\n': '\\n', '\f': '\\f', '\r': '\\r'}
+_ESCAPES.update({'"': '\\"', '\\': '\\\\'})
+
+
+def _escape(match: 're.Match[str]') -> str:
+    character = match.group()
+    return _ESCAPES.get(character) or f'\\u{ord(character):04x}'
+
+
+def _key(key: Any) -> str:
+    if not isinstance(key, str):
+        raise TypeError(f'Toml keys must be strings, not {type(key).__name__}')
+    if _BARE_KEY.fullmatch(key):
+        return key
+    return _string(key)
+
+
+def _string(value: str) -> str:
+    return f'"{_ESCAPE.sub(_escape, value)}"'
+
+
+def _value(value: Any) -> str:
+    # bool is checked before int since it is a subclass of int
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return _string(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return 'nan'
+        if math.isinf(value):
+            return 'inf' if value > 0 else '-inf'
+        return repr(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        items = ', '.join(
+            f'{_key(key)} = {_value(item)}'
+            for key, item in value.items()
+            if item is not None
+        )
+        return f'{{ {items} }}' if items else '{}'
+    if isinstance(value, (list, tuple)):
+        return f'[{", ".join(_value(item) for item in value)}]'
+    if value is None:
+        raise TypeError('Toml has no null value, None can only be used in tables')
+    raise TypeError(f'Objects of type {type(value).__name__} can not be written')
+
+
+def _is_table_array(value: Any) -> bool:
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and all(isinstance(item, Mapping) for item in value)
+    )
+
+
+def _iter_table(table: Mapping[str, Any], path: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Yields the lines of a table. The values are written first, followed by the
+    sub tables and arrays of tables, since a key that follows a table header
+    belongs to that table. Keys with a None value are left out.
+    """
+    if not isinstance(table, Mapping):
+        raise TypeError('Only mappings can be written as a toml table')
+
+    tables = []
+    for key, value in table.items():
+        if value is None:
+            continue
+        if isinstance(value, Mapping) or _is_table_array(value):
+            tables.append((key, value))
+            continue
+        yield f'{_key(key)} = {_value(value)}\n'
+
+    for key, value in tables:
+        sub_path = (*path, _key(key))
+        name = '.'.join(sub_path)
+        if isinstance(value, Mapping):
+            yield f'\n[{name}]\n'
+            yield from _iter_table(value, sub_path)
+        else:
+            for item in value:
+                yield f'\n[[{name}]]\n'
+                yield from _iter_table(item, sub_path)
+
+
+def _dumps_table(table: Mapping[str, Any], path: Tuple[str, ...]) -> str:
+    return ''.join(_iter_table(table, path))
+
+
+def _iter_tables(
+    records: Iter[T],
+    mapper: Type[BaseMapper[T]],
+    table: str,
+    batch_size: int,
+    workers: Optional[int],
+    executor: Optional['Executor'],
+) -> Iterator[bytes]:
+    path = (_key(table),)
+    header = f'[[{path[0]}]]\n'
+    separator = ''
+    dumps_table = timed(_dumps_table, 'TomlDeserializer', 'encode')
+
+    rows = iter_dicts_from_records(mapper, records, batch_size, workers, executor)
+    for row in rows:
+        table_lines = dumps_table(row, path)
+        yield f'{separator}{header}{table_lines}'.encode('utf-8')
+        separator = '\n'
+
+
+class TomlDeserializer(BaseDeserializer, Generic[T]):
+    @staticmethod
+    def deserialize(record: T, mapper: Type[BaseMapper[T]]) -> bytes:
+        """
+        This method maps the record with the passed in mapper and encodes the
+        result as a toml document. The mapper has to produce a dict, keys with
+        a None value are left out since toml does not have a null value.
+
+        Args:
+            record: Some concrete record instance.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+
+        Returns:
+            A bytestring of the data encoded by the specific Deserializer.
+
+        Raises:
+            TypeError: The mapped data contains a value that can not be
+                written as toml.
+        """
+        data = dict_from_record(mapper, record)
+        document = timed(_dumps_table, 'TomlDeserializer', 'encode')(data, ())
+
+        return document.lstrip('\n').encode('utf-8')
+
+    @staticmethod
+    def deserialize_records(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        table: str = TABLE_NAME,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> bytes:
+        """
+        This method maps the records with the passed in mapper and encodes the
+        result as a toml document that contains a single array of tables.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            table: The name of the array of tables, every record is written
+                as a [[table]] entry.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            A bytestring of the data encoded by the specific Deserializer.
+
+        Raises:
+            TypeError: The mapped data contains a value that can not be
+                written as toml.
+        """
+        chunks = TomlDeserializer.iter_deserialize_records(
+            records,
+            mapper,
+            table=table,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+        )
+
+        return b''.join(chunks)
+
+    @staticmethod
+    def iter_deserialize_records(
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        table: str = TABLE_NAME,
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+    ) -> Iterator[bytes]:
+        """
+        This method maps the records to a toml array of tables one record at a
+        time and yields the encoded output in chunks. Only a single chunk is
+        held in memory at any time, so the memory use does not depend on the
+        amount of records.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            table: The name of the array of tables, every record is written
+                as a [[table]] entry.
+            chunk_size: The amount of bytes that get buffered before a chunk
+                is yielded.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+
+        Returns:
+            An iterator over bytestrings that together form the toml data.
+
+        Raises:
+            TypeError: The mapped data contains a value that can not be
+                written as toml.
+        """
+        tables = _iter_tables(records, mapper, table, batch_size, workers, executor)
+        return iter_chunks(tables, chunk_size)
+
+    @classmethod
+    def deserialize_records_to_file(
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        table: str = TABLE_NAME,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        flush_records: Optional[int] = None,
+        flush_bytes: int = CHUNK_SIZE,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        compression: CompressionKind = AUTO,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        A convenience method that maps the records with the passed in mapper
+        and writes them to a file object as a toml array of tables. The tables
+        are written in chunks through a writers.ChunkedWriter as they are
+        mapped, the full toml document is never held in memory.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be written to. This
+                includes io.BytesIO and file objects opened in byte mode.
+            table: The name of the array of tables, every record is written
+                as a [[table]] entry.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            flush_records: The amount of records after which the buffered
+                tables are written to the file object.
+            flush_bytes: The amount of bytes after which the buffered tables
+                are written to the file object.
+            fsync: Whether os.fsync is called after every write to the file
+                object.
+            progress: Some callable that gets called with a writers.Progress
+                after every write to the file object.
+            compression: The compression of the written data, see
+                compression.writing for details. By default it is detected
+                from the extension of the name of the file.
+            compression_level: The compression level, the default level of the
+                compression is used when nothing is passed in.
+
+        Raises:
+            TypeError: The mapped data contains a value that can not be
+                written as toml.
+            ValueError: An error has occured while doing I/O operations.
+        """
+        tables = _iter_tables(records, mapper, table, batch_size, workers, executor)
+        output = writing(file_object, compression, compression_level)
+        with output as stream, ChunkedWriter(
+            stream, flush_records, flush_bytes, fsync, progress
+        ) as writer:
+            writer.writelines(tables)
+
+    @classmethod
+    async def adeserialize_records_to_stream(
+        cls,
+        records: Iter[T],
+        mapper: Type[BaseMapper[T]],
+        writer: AsyncWriter,
+        table: str = TABLE_NAME,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        """
+        The asynchronous version of deserialize_records_to_file. The toml data
+        is written to an asyncio.StreamWriter or any other object with an
+        asynchronous write method one chunk at a time, and the writer is
+        drained between chunks.
+
+        Args:
+            records: Some iterable of concrete record instances.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            writer: Some object with a write method that is either awaitable or
+                paired with an awaitable drain method.
+            table: The name of the array of tables, every record is written
+                as a [[table]] entry.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+
+        Raises:
+            TypeError: The mapped data contains a value that can not be
+                written as toml.
+            ValueError: An error has occured while doing I/O operations.
+        """
+        chunks = cls.iter_deserialize_records(
+            records, mapper, table=table, batch_size=batch_size
+        )
+        for chunk in chunks:
+            await awrite(writer, chunk)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import time
+from typing import TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+from typing import TypeVar
+from typing import Iterable as Iter
+
+# Every component imports this module, logging and threading are only imported
+# once a sink that needs them is created
+if TYPE_CHECKING:
+    import logging
+
+T = TypeVar('T')
+
+
+class Event(NamedTuple):
+    """
+    The measurement of a single stage of a component.
+    """
+
+    component: str
+    stage: str
+    seconds: float
+    records: int = 1
+    size: int = 0
+
+
+Sink = Callable[[Event], Any]
+
+# The active sink, components read this attribute on their hot paths. Use
+# set_sink or instrument to change it.
+sink: Optional[Sink] = None
+
+
+def set_sink(new_sink: Optional[Sink]) -> None:
+    """
+    Sets the sink that receives the events of all components, None disables
+    the instrumentation.
+
+    Args:
+        new_sink: Some callable that takes an Event or None.
+    """
+    global sink
+
+    sink = new_sink
+
+
+@contextlib.contextmanager
+def instrument(new_sink: Sink) -> Iterator[Sink]:
+    """
+    Sets a sink for the duration of a with block, the previous sink is
+    restored afterwards.
+
+    Args:
+        new_sink: Some callable that takes an Event.
+
+    Returns:
+        A context manager that yields the passed in sink.
+    """
+    previous = sink
+    set_sink(new_sink)
+    try:
+        yield new_sink
+    finally:
+        set_sink(previous)
+
+
+class Measurement:
+    """
+    The records and bytes of a stage that is measured with measure, they can
+    be updated inside of the with block.
+    """
+
+    __slots__ = ('records', 'size')
+
+    def __init__(self, records: int, size: int):
+        self.records = records
+        self.size = size
+
+
+@contextlib.contextmanager
+def measure(
+    component: str, stage: str, records: int = 1, size: int = 0
+) -> Iterator[Measurement]:
+    """
+    Measures the duration of a with block and sends it to the active sink. No
+    event is sent when the block raises.
+
+    Args:
+        component: The name of the component that is measured.
+        stage: The name of the stage that is measured.
+        records: The amount of records that the stage processes.
+        size: The amount of bytes that the stage processes.
+
+    Returns:
+        A context manager that yields a Measurement.
+    """
+    measurement = Measurement(records, size)
+    start = time.perf_counter()
+    yield measurement
+    seconds = time.perf_counter() - start
+
+    current = sink
+    if current is not None:
+        current(Event(component, stage, seconds, measurement.records, measurement.size))
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    return 0
+
+
+def timed(function: Callable[..., T], component: str, stage: str) -> Callable[..., T]:
+    """
+    Wraps a function so every call sends an event to the active sink. The size
+    of the event is the length of the result, or of the first argument when
+    the result is not a string or bytestring. The function is returned as is
+    when the instrumentation is disabled.
+
+    Args:
+        function: The function that gets measured.
+        component: The name of the component that is measured.
+        stage: The name of the stage that is measured.
+
+    Returns:
+        The wrapped function.
+    """
+    if sink is None:
+        return function
+
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        current = sink
+        if current is not None:
+            size = _size(result) or (_size(args[0]) if args else 0)
+            current(Event(component, stage, seconds, 1, size))
+        return result
+
+    return wrapper
+
+
+def timed_iter(iterable: Iter[T], component: str, stage: str) -> Iterator[T]:
+    """
+    Wraps an iterable so producing every item sends an event to the active
+    sink. No events are sent when the instrumentation is disabled.
+
+    Args:
+        iterable: The iterable that gets measured.
+        component: The name of the component that is measured.
+        stage: The name of the stage that is measured.
+
+    Returns:
+        An iterator over the items of the iterable.
+    """
+    if sink is None:
+        return iter(iterable)
+
+    def wrapper() -> Iterator[T]:
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            seconds = time.perf_counter() - start
+
+            current = sink
+            if current is not None:
+                current(Event(component, stage, seconds, 1, 0))
+            yield item
+
+    return wrapper()
+
+
+class LoggingSink:
+    """
+    A sink that logs every event.
+
+    Args:
+        logger: The logger the events are logged to, this defaults to the
+            logger of this module.
+        level: The level the events are logged at, this defaults to
+            logging.DEBUG.
+    """
+
+    def __init__(
+        self, logger: Optional['logging.Logger'] = None, level: Optional[int] = None
+    ):
+        import logging
+
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = logging.DEBUG if level is None else level
+
+    def __call__(self, event: Event) -> None:
+        self.logger.log(
+            self.level,
+            '%s %s %.6fs records=%d bytes=%d',
+            event.component,
+            event.stage,
+            event.seconds,
+            event.records,
+            event.size,
+        )
+
+
+class StageStats:
+    """
+    The aggregated events of a single stage of a component. The histogram maps
+    the upper bound of a duration bucket in microseconds to the amount of
+    events in it, the buckets grow by powers of two.
+    """
+
+    __slots__ = ('count', 'seconds', 'records', 'size', 'min', 'max', 'histogram')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.records = 0
+        self.size = 0
+        self.min = float('inf')
+        self.max = 0.0
+        self.histogram: Dict[int, int] = {}
+
+    def add(self, event: Event) -> None:
+        self.count += 1
+        self.seconds += event.seconds
+        self.records += event.records
+        self.size += event.size
+        self.min = min(self.min, event.seconds)
+        self.max = max(self.max, event.seconds)
+        bucket = 1 << int(event.seconds * 1_000_000).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f'StageStats(count={self.count}, seconds={self.seconds:.6f}, '
+            f'records={self.records}, size={self.size})'
+        )
+
+
+class Aggregator:
+    """
+    A sink that aggregates the events in memory per component and stage. It
+    can be shared between threads.
+    """
+
+    def __init__(self) -> None:
+        import threading
+
+        self.stages: Dict[Tuple[str, str], StageStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        key = (event.component, event.stage)
+        with self._lock:
+            stats = self.stages.get(key)
+            if stats is None:
+                stats = self.stages[key] = StageStats()
+            stats.add(event)
+
+    def reset(self) -> None:
+        """
+        Removes all aggregated events.
+        """
+        with self._lock:
+            self.stages.clear()
+
+    def report(self) -> str:
+        """
+        Formats the aggregated events as a table, the slowest stages first.
+        """
+        lines = [
+            f'{"component":<24} {"stage":<8} {"count":>10} {"seconds":>12} '
+            f'{"records":>10} {"bytes":>12}'
+        ]
+        with self._lock:
+            items = sorted(self.stages.items(), key=lambda item: -item[1].seconds)
+            for (component, stage), stats in items:
+                lines.append(
+                    f'{component:<24} {stage:<8} {stats.count:>10} '
+                    f'{stats.seconds:>12.6f} {stats.records:>10} {stats.size:>12}'
+                )
+
+        return '\n'.join(lines)
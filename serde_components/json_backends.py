@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import abc
+import json
+from typing import Any, Callable, Dict, Optional, Union
+from typing import Iterable as Iter
+
+from .utils import Buffer
+
+
+class BaseJsonBackend(abc.ABC):
+    """
+    This class defines the interface that a json backend must implement. The
+    json components never call the json module directly, they go through a
+    backend so a faster third party encoder can be plugged in without
+    subclassing every component.
+
+    Both methods work on bytes, a backend that produces bytes directly does not
+    pay for an extra encode step. It is technically possible to use a backend
+    that does not inherit from this class, as long as it implements the same
+    methods.
+
+    Example:
+        import orjson
+
+        class OrjsonBackend(BaseJsonBackend):
+            loads = staticmethod(orjson.loads)
+            dumps = staticmethod(orjson.dumps)
+
+        register_backend('orjson', OrjsonBackend)
+        set_default_backend('orjson')
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def loads(data: Buffer) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    @abc.abstractmethod
+    def dumps(data: Any) -> bytes:
+        raise NotImplementedError
+
+
+class StdlibJsonBackend(BaseJsonBackend):
+    """
+    The default backend, it uses the json module from the standard library.
+    """
+
+    @staticmethod
+    def loads(data: Buffer) -> Any:
+        # json.loads only accepts bytes like objects that have a decode method
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
+
+BackendKind = Union[str, BaseJsonBackend, type, None]
+
+_BACKENDS: Dict[str, Any] = {'json': StdlibJsonBackend}
+_default_backend: Any = StdlibJsonBackend
+
+
+def register_backend(name: str, backend: Any) -> None:
+    """
+    Registers a backend under a name, so it can be selected by that name.
+
+    Args:
+        name: The name the backend gets registered under.
+        backend: Some object or class that implements the BaseJsonBackend
+            interface.
+
+    Raises:
+        TypeError: The backend does not implement loads and dumps.
+    """
+    for method in ('loads', 'dumps'):
+        if not callable(getattr(backend, method, None)):
+            raise TypeError(f'{backend!r} does not implement {method}')
+
+    _BACKENDS[name] = backend
+
+
+def set_default_backend(backend: BackendKind) -> None:
+    """
+    Sets the backend that the json components use when no backend is passed in.
+
+    Args:
+        backend: The name of a registered backend or a backend object. None
+            resets the default to the standard library backend.
+
+    Raises:
+        KeyError: No backend is registered under the passed in name.
+    """
+    global _default_backend
+
+    _default_backend = get_backend(backend or 'json')
+
+
+def get_backend(backend: BackendKind = None) -> Any:
+    """
+    Resolves a backend.
+
+    Args:
+        backend: The name of a registered backend, a backend object or None
+            for the default backend.
+
+    Returns:
+        The backend object.
+
+    Raises:
+        KeyError: No backend is registered under the passed in name.
+    """
+    if backend is None:
+        return _default_backend
+    if not isinstance(backend, str):
+        return backend
+
+    try:
+        return _BACKENDS[backend]
+    except KeyError:
+        raise KeyError(f'No json backend is registered under {backend!r}')
+
+
+def project(document: Any, fields: Optional[Iter[str]]) -> Any:
+    """
+    Keeps only the passed in top level keys of a decoded json object. Keys that
+    are missing from the document are left out, documents that are not an
+    object are returned as is.
+
+    Args:
+        document: Some decoded json document.
+        fields: The keys that should be kept, all keys are kept when nothing
+            is passed in.
+
+    Returns:
+        The projected document.
+    """
+    if fields is None or not isinstance(document, dict):
+        return document
+
+    return {key: document[key] for key in fields if key in document}
+
+
+def get_loads(
+    backend: BackendKind = None, fields: Optional[Iter[str]] = None
+) -> Callable[[Buffer], Any]:
+    """
+    Resolves the loads function of a backend, optionally combined with a
+    projection on the top level keys of the decoded documents. The unneeded
+    values are dropped right after decoding, before they reach a mapper.
+
+    Args:
+        backend: The name of a registered backend, a backend object or None
+            for the default backend.
+        fields: The top level keys that should be kept, all keys are kept when
+            nothing is passed in.
+
+    Returns:
+        A function that decodes a bytestring.
+
+    Raises:
+        KeyError: No backend is registered under the passed in name.
+    """
+    loads = get_backend(backend).loads
+    if fields is None:
+        return loads
+
+    keys = tuple(fields)
+
+    def projected_loads(data: Buffer) -> Any:
+        return project(loads(data), keys)
+
+    return projected_loads
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Creates the module level __getattr__ and __dir__ functions (PEP 562) of a
+    package that imports its attributes on first access. This keeps importing
+    the package cheap, only the modules of the components that are actually
+    used get imported together with the stdlib modules they depend on.
+
+    Args:
+        package: The __name__ of the package that exposes the attributes.
+        attributes: The name of every attribute mapped to the module it is
+            defined in, relative to the package. An empty name means the
+            attribute is the module itself.
+
+    Returns:
+        The __getattr__ and __dir__ functions of the package.
+    """
+    namespace: Dict[str, Any] = vars(importlib.import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            ) from None
+
+        if module:
+            value = getattr(importlib.import_module(module, package), name)
+        else:
+            value = importlib.import_module(f'.{name}', package)
+
+        # Later lookups find the attribute directly and skip this function
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
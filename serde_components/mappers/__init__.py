@@ -1,3 +1,49 @@
 # -*- coding: utf-8 -*-
-from typing import TypeVar
-from .base import BaseMapper
+from typing import TYPE_CHECKING, TypeVar
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import (
+        BaseDictMapper,
+        BaseMapper,
+        aiter_records_from_dicts,
+        dict_from_record,
+        dicts_from_records,
+        iter_dicts_from_records,
+        iter_records_from_dicts,
+        record_from_dict,
+        records_from_dicts,
+    )
+    from .field_mapper import FieldMapper
+    from .row_mapper import RowMapper
+
+__all__ = [
+    'BaseDictMapper',
+    'BaseMapper',
+    'FieldMapper',
+    'RowMapper',
+    'aiter_records_from_dicts',
+    'dict_from_record',
+    'dicts_from_records',
+    'iter_dicts_from_records',
+    'iter_records_from_dicts',
+    'record_from_dict',
+    'records_from_dicts',
+]
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'BaseDictMapper': '.base',
+        'BaseMapper': '.base',
+        'FieldMapper': '.field_mapper',
+        'RowMapper': '.row_mapper',
+        'aiter_records_from_dicts': '.base',
+        'dict_from_record': '.base',
+        'dicts_from_records': '.base',
+        'iter_dicts_from_records': '.base',
+        'iter_records_from_dicts': '.base',
+        'record_from_dict': '.base',
+        'records_from_dicts': '.base',
+    },
+)
@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 import abc
-from typing import Generic, Type, TypeVar, Union
+import functools
+import itertools
+from typing import TYPE_CHECKING
+from typing import Any, AsyncIterable, AsyncIterator, Generic, Iterator, List
+from typing import Optional, Tuple, Type, TypeVar, Union
+from typing import Iterable as Iter
 
+from .. import instrumentation
+from ..instrumentation import measure
+from ..utils import BATCH_SIZE, abatched, batched, map_batches
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 T = TypeVar('T')
 RKind = Union[T, Type[T]]
@@ -24,3 +35,373 @@ class BaseMapper(abc.ABC, Generic[T]):
     @abc.abstractmethod
     def map_serialize(record: RKind[T], data: bytes) -> T:
         raise NotImplementedError
+
+    @classmethod
+    def map_deserialize_many(cls, records: Iter[T]) -> List[bytes]:
+        """
+        Maps a batch of records. The default implementation calls
+        map_deserialize for every record, derived classes can override this
+        method with bulk logic.
+        """
+        return [cls.map_deserialize(record) for record in records]
+
+    @classmethod
+    def map_serialize_many(cls, records: Iter[T], data: Iter[bytes]) -> List[T]:
+        """
+        Maps a batch of data to a batch of records. The default implementation
+        calls map_serialize for every pair of record and data, derived classes
+        can override this method with bulk logic.
+        """
+        return [cls.map_serialize(record, d) for record, d in zip(records, data)]
+
+
+class BaseDictMapper(BaseMapper[T]):
+    """
+    This class defines a structured mapper interface. Instead of passing data
+    around as a utf-8 encoded bytestring of a python literal, the mapped data
+    is passed as plain python objects.
+
+    All built-in serializers and deserializers detect the map_to_dict and
+    map_from_dict methods and call them directly, which skips the str() and
+    ast.literal_eval round trip. The bytes based methods are still implemented
+    so a derived mapper keeps working with components that only know about
+    BaseMapper.
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def map_to_dict(record: RKind[T]) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    @abc.abstractmethod
+    def map_from_dict(record: RKind[T], data: Any) -> T:
+        raise NotImplementedError
+
+    @classmethod
+    def map_to_dict_many(cls, records: Iter[T]) -> List[Any]:
+        """
+        The structured counterpart of map_deserialize_many.
+        """
+        return [cls.map_to_dict(record) for record in records]
+
+    @classmethod
+    def map_from_dict_many(cls, records: Iter[T], data: Iter[Any]) -> List[T]:
+        """
+        The structured counterpart of map_serialize_many.
+        """
+        return [cls.map_from_dict(record, d) for record, d in zip(records, data)]
+
+    @classmethod
+    def map_deserialize(cls, record: RKind[T]) -> bytes:  # type:ignore
+        return str(cls.map_to_dict(record)).encode('utf-8')
+
+    @classmethod
+    def map_serialize(cls, record: RKind[T], data: bytes) -> T:  # type:ignore
+        return cls.map_from_dict(record, _literal_eval(data))
+
+
+def _literal_eval(data: bytes) -> Any:
+    # ast is only imported once a mapper passes its data as a bytestring
+    import ast
+
+    return ast.literal_eval(data.decode('utf-8'))
+
+
+def dict_from_record(mapper: Type[BaseMapper[T]], record: RKind[T]) -> Any:
+    """
+    Maps a record to a python data structure with the passed in mapper. If the
+    mapper implements map_to_dict it is called directly, otherwise the output
+    of map_deserialize is parsed with ast.literal_eval.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        record: Some concrete record instance.
+
+    Returns:
+        The data structure that represents the record.
+    """
+    if instrumentation.sink is not None:
+        rv = _measured_dicts_from_records(mapper, [record], False)  # type:ignore
+        return rv[0]
+
+    map_to_dict = getattr(mapper, 'map_to_dict', None)
+    if map_to_dict is not None:
+        return map_to_dict(record)
+
+    data: bytes = mapper.map_deserialize(record)  # type:ignore
+    return _literal_eval(data)
+
+
+def record_from_dict(mapper: Type[BaseMapper[T]], record: RKind[T], data: Any) -> T:
+    """
+    Maps a python data structure to a record with the passed in mapper. If the
+    mapper implements map_from_dict it is called directly, otherwise the data
+    is encoded as a bytestring and passed to map_serialize.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        record: Some concrete record instance.
+        data: The data structure that should be mapped to the record.
+
+    Returns:
+        The passed record with data mapped from the data.
+    """
+    if instrumentation.sink is not None:
+        records = [record]
+        rv = _measured_records_from_dicts(mapper, records, [data], False)  # type:ignore
+        return rv[0]  # type:ignore
+
+    map_from_dict = getattr(mapper, 'map_from_dict', None)
+    if map_from_dict is not None:
+        return map_from_dict(record, data)
+
+    return mapper.map_serialize(record, str(data).encode('utf-8'))
+
+
+def dicts_from_records(mapper: Type[BaseMapper[T]], records: Iter[T]) -> List[Any]:
+    """
+    The batched version of dict_from_record. The batch hooks of the mapper are
+    used when they are available.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        records: Some iterable of concrete record instances.
+
+    Returns:
+        A list of data structures that represent the records.
+    """
+    if instrumentation.sink is not None:
+        return _measured_dicts_from_records(mapper, list(records), True)
+
+    map_to_dict_many = getattr(mapper, 'map_to_dict_many', None)
+    if map_to_dict_many is not None:
+        return map_to_dict_many(records)
+
+    map_deserialize_many = getattr(mapper, 'map_deserialize_many', None)
+    if map_deserialize_many is None or hasattr(mapper, 'map_to_dict'):
+        return [dict_from_record(mapper, record) for record in records]
+
+    return [_literal_eval(d) for d in map_deserialize_many(records)]
+
+
+def records_from_dicts(
+    mapper: Type[BaseMapper[T]], records: Iter[T], data: Iter[Any]
+) -> List[T]:
+    """
+    The batched version of record_from_dict. The batch hooks of the mapper are
+    used when they are available.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        records: Some iterable of concrete record instances.
+        data: Some iterable of data structures, one for every record.
+
+    Returns:
+        The passed records with data mapped from the data.
+    """
+    if instrumentation.sink is not None:
+        return _measured_records_from_dicts(mapper, list(records), list(data), True)
+
+    map_from_dict_many = getattr(mapper, 'map_from_dict_many', None)
+    if map_from_dict_many is not None:
+        return map_from_dict_many(records, data)
+
+    map_serialize_many = getattr(mapper, 'map_serialize_many', None)
+    if map_serialize_many is None or hasattr(mapper, 'map_from_dict'):
+        return [record_from_dict(mapper, r, d) for r, d in zip(records, data)]
+
+    return map_serialize_many(records, [str(d).encode('utf-8') for d in data])
+
+
+def _measured_dicts_from_records(
+    mapper: Type[BaseMapper[T]], records: List[T], many: bool
+) -> List[Any]:
+    # The instrumented counterpart of dict_from_record and dicts_from_records,
+    # the map and parse stages are measured separately.
+    name = mapper.__name__
+    count = len(records)
+    if hasattr(mapper, 'map_to_dict'):
+        with measure(name, 'map', count):
+            if many and hasattr(mapper, 'map_to_dict_many'):
+                return mapper.map_to_dict_many(records)  # type:ignore
+            return [mapper.map_to_dict(record) for record in records]  # type:ignore
+
+    with measure(name, 'map', count) as measurement:
+        if many:
+            data = mapper.map_deserialize_many(records)
+        else:
+            data = [mapper.map_deserialize(record) for record in records]
+        measurement.size = sum(len(d) for d in data)
+    with measure(name, 'parse', count, measurement.size):
+        return [_literal_eval(d) for d in data]
+
+
+def _measured_records_from_dicts(
+    mapper: Type[BaseMapper[T]], records: List[T], data: List[Any], many: bool
+) -> List[T]:
+    # The instrumented counterpart of record_from_dict and records_from_dicts,
+    # the format and map stages are measured separately.
+    name = mapper.__name__
+    count = len(records)
+    if hasattr(mapper, 'map_from_dict'):
+        with measure(name, 'map', count):
+            if many and hasattr(mapper, 'map_from_dict_many'):
+                return mapper.map_from_dict_many(records, data)  # type:ignore
+            return [
+                mapper.map_from_dict(r, d)  # type:ignore
+                for r, d in zip(records, data)
+            ]
+
+    with measure(name, 'format', count) as measurement:
+        encoded = [str(d).encode('utf-8') for d in data]
+        measurement.size = sum(len(e) for e in encoded)
+    with measure(name, 'map', count, measurement.size):
+        if many:
+            return mapper.map_serialize_many(records, encoded)
+        return [mapper.map_serialize(r, e) for r, e in zip(records, encoded)]
+
+
+def iter_dicts_from_records(
+    mapper: Type[BaseMapper[T]],
+    records: Iter[T],
+    batch_size: int = BATCH_SIZE,
+    workers: Optional[int] = None,
+    executor: Optional['Executor'] = None,
+) -> Iterator[Any]:
+    """
+    Lazily maps an iterable of records to data structures. The records are
+    passed to the mapper in batches of batch_size. When workers or an executor
+    is passed, the batches are mapped concurrently and reassembled in order,
+    see utils.map_batches for details.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        records: Some iterable of concrete record instances.
+        batch_size: The amount of records that get passed to the batch hooks
+            of the mapper at once.
+        workers: The amount of worker processes to map the batches in.
+        executor: Some concurrent.futures.Executor to map the batches in.
+
+    Returns:
+        An iterator over the data structures that represent the records.
+    """
+    function = functools.partial(dicts_from_records, mapper)
+    batches = batched(records, batch_size)
+    for rows in map_batches(function, batches, workers, executor):
+        yield from rows
+
+
+def iter_records_from_dicts(
+    mapper: Type[BaseMapper[T]],
+    records: Union[Iter[T], Type[T]],
+    data: Iter[Any],
+    batch_size: int = BATCH_SIZE,
+    workers: Optional[int] = None,
+    executor: Optional['Executor'] = None,
+) -> Iterator[T]:
+    """
+    Lazily maps an iterable of data structures to records. The data is passed
+    to the mapper in batches of batch_size. When workers or an executor is
+    passed, the batches are mapped concurrently and reassembled in order, see
+    utils.map_batches for details. The passed records are filled in place, so
+    record instances can only be mapped in threads. Records that get mapped
+    in worker processes have to be created by a factory method.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        records: Some iterable of concrete record instances or a factory
+            method that creates an instance of a record when called.
+        data: Some iterable of data structures, one for every record.
+        batch_size: The amount of records that get passed to the batch hooks
+            of the mapper at once.
+        workers: The amount of worker processes to map the batches in.
+        executor: Some concurrent.futures.Executor to map the batches in.
+
+    Returns:
+        An iterator over the passed records with data mapped from the data.
+
+    Raises:
+        ValueError: Record instances are passed together with workers or a
+            process pool executor.
+    """
+    jobs: Iter[Tuple[Any, List[Any]]]
+    if isinstance(records, Iter):
+        if _in_processes(workers, executor):
+            raise ValueError(
+                'Record instances can not be mapped in worker processes, pass '
+                'a factory method instead'
+            )
+        record_iterator = iter(records)
+        jobs = (
+            (list(itertools.islice(record_iterator, len(batch))), batch)
+            for batch in batched(data, batch_size)
+        )
+    else:
+        jobs = ((records, batch) for batch in batched(data, batch_size))
+
+    function = functools.partial(_records_from_job, mapper)
+    for _records in map_batches(function, jobs, workers, executor):
+        yield from _records
+
+
+async def aiter_records_from_dicts(
+    mapper: Type[BaseMapper[T]],
+    records: Union[Iter[T], Type[T]],
+    data: AsyncIterable[Any],
+    batch_size: int = BATCH_SIZE,
+) -> AsyncIterator[T]:
+    """
+    The asynchronous version of iter_records_from_dicts, the data structures
+    are taken from an asynchronous iterable.
+
+    Args:
+        mapper: Some concrete mapper class that inherits from BaseMapper or
+            BaseDictMapper.
+        records: Some iterable of concrete record instances or a factory
+            method that creates an instance of a record when called.
+        data: Some asynchronous iterable of data structures, one for every
+            record.
+        batch_size: The amount of records that get passed to the batch hooks
+            of the mapper at once.
+
+    Returns:
+        An asynchronous iterator over the passed records with data mapped from
+        the data.
+    """
+    record_iterator = iter(records) if isinstance(records, Iter) else None
+    job: Tuple[Any, List[Any]]
+    async for batch in abatched(data, batch_size):
+        if record_iterator is not None:
+            job = (list(itertools.islice(record_iterator, len(batch))), batch)
+        else:
+            job = (records, batch)
+
+        for record in _records_from_job(mapper, job):
+            yield record
+
+
+def _in_processes(workers: Optional[int], executor: Optional['Executor']) -> bool:
+    if executor is None:
+        return bool(workers)
+
+    # The process pool is only imported when an executor is passed in
+    from concurrent.futures import ProcessPoolExecutor
+
+    return isinstance(executor, ProcessPoolExecutor)
+
+
+def _records_from_job(
+    mapper: Type[BaseMapper[T]], job: Tuple[Any, List[Any]]
+) -> List[T]:
+    records, batch = job
+    if not isinstance(records, list):
+        records = [records() for _ in batch]
+
+    return records_from_dicts(mapper, records, batch)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import keyword
+from typing import Any, Callable, ClassVar, Dict, Sequence, TypeVar
+
+from .base import BaseDictMapper
+
+T = TypeVar('T')
+
+
+class FieldMapper(BaseDictMapper[T]):
+    """
+    This class implements a declarative mapper for records that store their
+    data as attributes. A derived class lists the attributes in `fields`,
+    optionally together with `converters` that are applied to values read from
+    the data and `renames` that map an attribute name to a different key.
+
+    The declarations are compiled once when the derived class is created into
+    specialised map_to_dict and map_from_dict functions and their batched
+    counterparts, so no per-record lookups of the declarations take place.
+
+    Example:
+        class Mapper(FieldMapper[Record]):
+            fields = ('age', 'name')
+            converters = {'age': int}
+            renames = {'name': 'full_name'}
+    """
+
+    fields: ClassVar[Sequence[str]] = ()
+    converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    renames: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        functions = _compile(cls.fields, cls.converters, cls.renames)
+        for name, function in functions.items():
+            setattr(cls, name, staticmethod(function))
+
+
+def _compile(
+    fields: Sequence[str],
+    converters: Dict[str, Callable[[Any], Any]],
+    renames: Dict[str, str],
+) -> Dict[str, Callable[..., Any]]:
+    namespace: Dict[str, Any] = {}
+    to_dict_items = []
+    from_dict_lines = []
+
+    for index, field in enumerate(fields):
+        if not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f'{field!r} is not a valid attribute name')
+
+        key = repr(renames.get(field, field))
+        to_dict_items.append(f'{key}: record.{field}')
+
+        if field in converters:
+            converter = f'_converter{index}'
+            namespace[converter] = converters[field]
+            from_dict_lines.append(f'    value = data.get({key})')
+            from_dict_lines.append(
+                f'    record.{field} = None if value is None else {converter}(value)'
+            )
+        else:
+            from_dict_lines.append(f'    record.{field} = data.get({key})')
+
+    to_dict = f'{{{", ".join(to_dict_items)}}}'
+    source = '\n'.join(
+        [
+            'def map_to_dict(record):',
+            f'    return {to_dict}',
+            '',
+            'def map_to_dict_many(records):',
+            f'    return [{to_dict} for record in records]',
+            '',
+            'def map_from_dict(record, data):',
+            *from_dict_lines,
+            '    return record',
+            '',
+            'def map_from_dict_many(records, data_many):',
+            '    rv = []',
+            '    for record, data in zip(records, data_many):',
+            *[f'    {line}' for line in from_dict_lines],
+            '        rv.append(record)',
+            '    return rv',
+        ]
+    )
+    exec(compile(source, '<FieldMapper>', 'exec'), namespace)
+
+    return {
+        name: namespace[name]
+        for name in (
+            'map_to_dict',
+            'map_to_dict_many',
+            'map_from_dict',
+            'map_from_dict_many',
+        )
+    }
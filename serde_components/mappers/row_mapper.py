@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from typing import Any
+
+from .base import BaseDictMapper
+
+
+class RowMapper(BaseDictMapper[Any]):
+    """
+    Some mapper that passes already mapped rows through as is. Components that
+    map the records once and pass the rows on to other components, like
+    delta.DeltaState.iter_changes and the FanOutDeserializer, use this mapper
+    so the rows can be written with any deserializer.
+    """
+
+    @staticmethod
+    def map_to_dict(record: Any) -> Any:
+        return record
+
+    @staticmethod
+    def map_from_dict(record: Any, data: Any) -> Any:
+        return data
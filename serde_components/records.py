@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import keyword
+import sys
+from typing import Any, Callable, ClassVar, Dict, Iterator, Optional, Sequence
+from typing import Tuple, Type
+
+from .mappers import FieldMapper
+
+
+class SlotsRecord:
+    """
+    This class implements a lightweight base for records. A derived class
+    lists its attributes in `__slots__`, so instances do not carry a
+    `__dict__` and take up a fraction of the memory of a regular object. The
+    attributes of all slotted base classes together form `_fields`.
+
+    The constructor takes the fields positionally or by name and defaults
+    missing fields to None, so a derived class can be passed as the record
+    factory to the serializers directly.
+
+    Records compare and hash by their field values like a tuple, so a record
+    should not be changed while it is used as a dict key or in a set.
+
+    Example:
+        class Record(SlotsRecord):
+            __slots__ = ('age', 'name')
+    """
+
+    __slots__: ClassVar[Tuple[str, ...]] = ()
+    _fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        cls._fields = tuple(getattr(cls.__base__, '_fields', ())) + tuple(slots)
+        cls.__init__ = _compile_init(cls._fields)  # type:ignore
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __iter__(self) -> Iterator[Any]:
+        return (getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SlotsRecord) or other._fields != self._fields:
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash((self._fields, tuple(self)))
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{field}={getattr(self, field)!r}' for field in self._fields
+        )
+        return f'{type(self).__name__}({values})'
+
+    def _asdict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+
+def _compile_init(fields: Sequence[str]) -> Callable[..., None]:
+    for field in fields:
+        if not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f'{field!r} is not a valid attribute name')
+
+    arguments = ''.join(f', {field}=None' for field in fields)
+    lines = [f'    self.{field} = {field}' for field in fields] or ['    pass']
+    source = '\n'.join([f'def __init__(self{arguments}):', *lines])
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<SlotsRecord>', 'exec'), namespace)
+
+    return namespace['__init__']
+
+
+def make_record(
+    name: str, fields: Sequence[str], module: Optional[str] = None
+) -> Type[SlotsRecord]:
+    """
+    Creates a SlotsRecord class from a list of field names, for example the
+    header of a csv file.
+
+    Args:
+        name: The name of the created class.
+        fields: The attribute names of the created class.
+        module: The module the class is defined in. This defaults to the module
+            of the caller and is needed to pickle the instances, for example
+            when mapping with worker processes.
+
+    Returns:
+        A class that inherits from SlotsRecord.
+
+    Raises:
+        ValueError: A field name is not a valid attribute name.
+    """
+    for field in fields:
+        if not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f'{field!r} is not a valid attribute name')
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__', '__main__')
+
+    namespace = {'__slots__': tuple(fields), '__module__': module}
+    return type(name, (SlotsRecord,), namespace)
+
+
+def make_mapper(
+    record: Type[SlotsRecord], converters: Optional[Dict[str, Any]] = None
+) -> Type[FieldMapper]:
+    """
+    Creates a FieldMapper for every field of a SlotsRecord class.
+
+    Args:
+        record: Some class that inherits from SlotsRecord.
+        converters: Some mapping of field names to functions that get applied
+            to the values read from the data, see FieldMapper for details.
+
+    Returns:
+        A class that inherits from FieldMapper.
+    """
+    namespace = {
+        'fields': record._fields,
+        'converters': dict(converters or {}),
+        '__module__': record.__module__,
+    }
+    return type(f'{record.__name__}Mapper', (FieldMapper,), namespace)
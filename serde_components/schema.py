@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+import csv
+import operator
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import Tuple, Union
+from typing import Iterable as Iter
+
+NULL_VALUES = ('',)
+
+
+def to_bool(value: str) -> bool:
+    """
+    Converts the common textual representations of a boolean, bool() can not be
+    used for this since every non empty string is truthy.
+    """
+    _value = value.strip().lower()
+    if _value in ('1', 'true', 't', 'yes', 'y'):
+        return True
+    if _value in ('0', 'false', 'f', 'no', 'n'):
+        return False
+
+    raise ValueError(f'{value!r} is not a boolean')
+
+
+# Types whose constructor does not do the expected thing for a string
+_CONVERTERS: Dict[Any, Callable[[str], Any]] = {bool: to_bool}
+
+
+class Column:
+    """
+    This class describes how a single column of text should be converted to a
+    python value.
+
+    Args:
+        converter: Some callable that takes a string and returns the converted
+            value, usually a type like int or float.
+        nullable: Whether the column can contain null values. A null value is
+            replaced by the default, a null value in a column that is not
+            nullable raises a ValueError.
+        default: The value that is used for null values and for columns that
+            are missing from the header.
+        null_values: The strings that are considered a null value.
+    """
+
+    def __init__(
+        self,
+        converter: Callable[[str], Any] = str,
+        nullable: bool = True,
+        default: Any = None,
+        null_values: Sequence[str] = NULL_VALUES,
+    ):
+        self.converter = converter
+        self.nullable = nullable
+        self.default = default
+        self.null_values = frozenset(null_values)
+
+    def compile(self, name: str) -> Callable[[str], Any]:
+        """
+        Creates the function that converts a single value of this column.
+        """
+        convert = _CONVERTERS.get(self.converter, self.converter)
+        null_values = self.null_values
+        nullable = self.nullable
+        default = self.default
+
+        def converter(value: str) -> Any:
+            if value in null_values:
+                if nullable:
+                    return default
+                raise ValueError(f'Column {name!r} can not contain null values')
+            return convert(value)
+
+        return converter
+
+
+SchemaKind = Mapping[str, Union[Column, Callable[[str], Any]]]
+RowConverter = Callable[[Sequence[str]], Dict[str, Any]]
+ResolvedColumn = Tuple[str, int, Any, Callable[[str], Any]]
+
+
+class Schema:
+    """
+    This class maps column names to the way their values should be converted.
+    A column can be described with a Column or with just a converter, like int.
+    Columns that are not in the schema are passed on as strings.
+
+    The schema is compiled against a header once, which resolves every column
+    to its index and produces a single function that converts a whole row.
+
+    Example:
+        schema = Schema({'age': int, 'score': Column(float, default=0.0)})
+    """
+
+    def __init__(self, columns: SchemaKind):
+        self.columns: Dict[str, Column] = {
+            name: column if isinstance(column, Column) else Column(column)
+            for name, column in columns.items()
+        }
+
+    def resolve(
+        self, header: Sequence[str], fields: Optional[Iter[str]] = None
+    ) -> Tuple[List[ResolvedColumn], Dict[str, Any]]:
+        """
+        Resolves the schema against a header.
+
+        Args:
+            header: The column names in the order they appear in the rows.
+            fields: The names of the columns that should be read, all other
+                columns are left out. All columns are read when nothing is
+                passed in.
+
+        Returns:
+            A list with a (name, index, type, converter) tuple for every column
+            in the header and a dict with the default values of the columns
+            that are missing from the header. Columns that are not in the
+            schema have str as their type and converter.
+
+        Raises:
+            ValueError: A column that is not nullable is missing from the
+                header.
+        """
+        selected = None if fields is None else set(fields)
+        plan: List[ResolvedColumn] = []
+        for index, name in enumerate(header):
+            if selected is not None and name not in selected:
+                continue
+            column = self.columns.get(name)
+            if column is None:
+                plan.append((name, index, str, str))
+            else:
+                plan.append((name, index, column.converter, column.compile(name)))
+
+        defaults: Dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if name in header or (selected is not None and name not in selected):
+                continue
+            if not column.nullable:
+                raise ValueError(f'Column {name!r} is missing from the header')
+            defaults[name] = column.default
+
+        return plan, defaults
+
+    def compile(
+        self, header: Sequence[str], fields: Optional[Iter[str]] = None
+    ) -> RowConverter:
+        """
+        Compiles the schema against a header. Cells of columns that are not
+        in fields are skipped by their index, they are never converted or
+        added to the returned dicts.
+
+        Args:
+            header: The column names in the order they appear in the rows.
+            fields: The names of the columns that should be read, all other
+                columns are left out. All columns are read when nothing is
+                passed in.
+
+        Returns:
+            A function that takes a row as a sequence of strings and returns a
+            dict of converted values.
+
+        Raises:
+            ValueError: A column that is not nullable is missing from the
+                header.
+        """
+        plan, defaults = self.resolve(header, fields)
+        names = [name for name, _, _, _ in plan]
+        indices = [index for _, index, _, _ in plan]
+        converters = [converter for _, _, _, converter in plan]
+
+        return _compile_row(names, indices, converters, defaults)
+
+
+def _compile_row(
+    names: Sequence[str],
+    indices: Sequence[int],
+    converters: Sequence[Callable[[str], Any]],
+    defaults: Dict[str, Any],
+) -> RowConverter:
+    plan: Tuple[Tuple[str, Callable[[str], Any]], ...] = tuple(zip(names, converters))
+    width = max(indices) + 1 if indices else 0
+    getter: Callable[[Sequence[str]], Sequence[str]]
+    if len(indices) > 1:
+        getter = operator.itemgetter(*indices)
+    else:
+        # itemgetter returns a single value instead of a tuple for one index
+        def getter(row: Sequence[str]) -> Sequence[str]:
+            return tuple(row[index] for index in indices)
+
+    def convert_row(row: Sequence[str]) -> Dict[str, Any]:
+        if len(row) < width:
+            row = list(row) + [''] * (width - len(row))
+        rv = dict(defaults)
+        for (name, converter), value in zip(plan, getter(row)):
+            rv[name] = converter(value)
+        return rv
+
+    return convert_row
+
+
+def as_schema(schema: Union[Schema, SchemaKind, None]) -> Union[Schema, None]:
+    """
+    Accepts a Schema, a mapping that describes a schema or None.
+    """
+    if schema is None or isinstance(schema, Schema):
+        return schema
+
+    return Schema(schema)
+
+
+class SchemaReader:
+    """
+    The schema aware counterpart of csv.DictReader. It reads the header from
+    the first row, compiles the schema against it and yields a dict of
+    converted values for every following row. Empty rows are skipped.
+
+    Just like a csv.reader it can be iterated again after it ran out of lines,
+    as long as the underlying iterator can produce more lines.
+
+    Args:
+        lines: Some iterable of strings that each contain one line of csv.
+        schema: The schema that describes how the columns are converted.
+        fields: The names of the columns that should be read, all other
+            columns are left out.
+        **kwargs: Passed on to csv.reader.
+    """
+
+    def __init__(
+        self,
+        lines: Iter[str],
+        schema: Schema,
+        fields: Optional[Iter[str]] = None,
+        **kwargs: Any,
+    ):
+        self.reader = csv.reader(lines, **kwargs)
+        self.schema = schema
+        self.fields = None if fields is None else tuple(fields)
+        self.convert_row: Optional[RowConverter] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        row = next(self.reader)
+        while self.convert_row is None or not row:
+            if self.convert_row is None:
+                self.convert_row = self.schema.compile(row, self.fields)
+            row = next(self.reader)
+
+        return self.convert_row(row)
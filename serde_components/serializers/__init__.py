@@ -1,6 +1,32 @@
 # -*- coding: utf-8 -*-
-from typing import TypeVar
-from .base import BaseSerializer
-from .csv_serializer import CsvSerializer
-from .json_serializer import JsonSerializer
-from .toml_serializer import TomlSerializer
+from typing import TYPE_CHECKING, TypeVar
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import BaseSerializer
+    from .csv_serializer import CsvSerializer
+    from .json_lines_serializer import JsonLinesSerializer
+    from .json_serializer import JsonSerializer
+    from .struct_serializer import StructSerializer
+    from .toml_serializer import TomlSerializer
+
+__all__ = [
+    'BaseSerializer',
+    'CsvSerializer',
+    'JsonLinesSerializer',
+    'JsonSerializer',
+    'StructSerializer',
+    'TomlSerializer',
+]
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'BaseSerializer': '.base',
+        'CsvSerializer': '.csv_serializer',
+        'JsonLinesSerializer': '.json_lines_serializer',
+        'JsonSerializer': '.json_serializer',
+        'StructSerializer': '.struct_serializer',
+        'TomlSerializer': '.toml_serializer',
+    },
+)
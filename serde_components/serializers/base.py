@@ -1,11 +1,57 @@
 # -*- coding: utf-8 -*-
 import abc
-from typing import Generic, IO, Type, TypeVar, Union
+import collections
+import os
+from typing import TYPE_CHECKING
+from typing import Any, Deque, Generic, IO, Iterator, List, Optional, Tuple, Type
+from typing import TypeVar, Union
+from typing import Iterable as Iter
 
+from ..compression import AUTO, CompressionKind, decompress, reading
 from ..mappers import BaseMapper
+from ..instrumentation import timed
+from ..utils import _SENTINEL, CHUNK_SIZE, AsyncReader, Buffer, _is_picklable
+from ..utils import map_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
 
 T = TypeVar('T')
 RKind = Union[T, Type[T]]
+PathKind = Union[str, 'os.PathLike[str]']
+FileError = Tuple[PathKind, Exception]
+
+
+def _serialize_data(serializer: Any, record: Any, mapper: Any, data: bytes) -> Any:
+    return serializer.serialize(record, mapper, data)
+
+
+def _serialize_file(
+    serializer: Any,
+    record: Any,
+    mapper: Any,
+    path: PathKind,
+    parse_executor: Optional['Executor'],
+) -> Any:
+    with open(path, 'rb') as file_object, reading(file_object) as stream:
+        data = timed(stream.read, serializer.__name__, 'read')()
+    if parse_executor is None:
+        return serializer.serialize(record, mapper, data)
+
+    future = parse_executor.submit(_serialize_data, serializer, record, mapper, data)
+    return future.result()
+
+
+def _file_result(
+    path: PathKind, future: 'Future', errors: Optional[List[FileError]]
+) -> Any:
+    try:
+        return future.result()
+    except Exception as error:
+        if errors is None:
+            raise
+        errors.append((path, error))
+        return _SENTINEL
 
 
 class BaseSerializer(abc.ABC, Generic[T]):
@@ -20,7 +66,7 @@ class BaseSerializer(abc.ABC, Generic[T]):
 
     @staticmethod
     @abc.abstractmethod
-    def serialize(record: RKind[T], mapper: Type[BaseMapper[T]], data: bytes) -> T:
+    def serialize(record: RKind[T], mapper: Type[BaseMapper[T]], data: Buffer) -> T:
         """
         This method is the main way to interact with an instance of a class
         derived from this base.
@@ -32,7 +78,9 @@ class BaseSerializer(abc.ABC, Generic[T]):
                 this mapper should be specific for the type of record passed
                 in.
             data: Some bytestring that represents the record in a format
-                specified by the concrete Serializer.
+                specified by the concrete Serializer. Any object that
+                implements the buffer protocol like bytearray, memoryview or
+                mmap.mmap is accepted as well.
 
         Returns:
             The passed record with data mapped from the data.
@@ -45,10 +93,13 @@ class BaseSerializer(abc.ABC, Generic[T]):
         record: RKind[T],
         mapper: Type[BaseMapper[T]],
         file_object: IO[bytes],
+        *,
+        compression: CompressionKind = AUTO,
     ) -> T:
         """
         A convenience method that reads data from a file object and maps it to
-        the record with the passed in mapper.
+        the record with the passed in mapper. Compressed data is decompressed
+        while it is read.
 
         Args:
             record: Some concrete record instance or a factory method that
@@ -61,6 +112,9 @@ class BaseSerializer(abc.ABC, Generic[T]):
                 specified by the concrete Serializer.
             file_object: Some file-like object that can be read from. This
                 includes io.BytesIO and file objects opened in byte mode.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file.
 
         Returns:
             The passed record with data mapped from the data.
@@ -68,5 +122,172 @@ class BaseSerializer(abc.ABC, Generic[T]):
         Raises:
             ValueError: An error has occured while doing I/O operations.
         """
-        data = file_object.read()
+        with reading(file_object, compression) as stream:
+            data = timed(stream.read, cls.__name__, 'read')()
         return cls.serialize(record, mapper, data)
+
+    @classmethod
+    def serialize_from_path(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        source: Union[str, 'os.PathLike[str]', int],
+        *,
+        compression: CompressionKind = AUTO,
+    ) -> T:
+        """
+        A convenience method that memory maps a file and maps its contents to
+        the record with the passed in mapper. Serializers that read their data
+        line by line never copy the whole file into memory this way, unless
+        the file is compressed.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            compression: The compression of the file, see
+                compression.decompress for details. By default it is detected
+                from the magic bytes of the file.
+
+        Returns:
+            The passed record with data mapped from the data.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations.
+        """
+        with map_file(source) as data:
+            return cls.serialize(record, mapper, decompress(data, compression))
+
+    @classmethod
+    async def aserialize_from_stream(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        reader: AsyncReader,
+    ) -> T:
+        """
+        The asynchronous version of serialize_from_file. It reads data from an
+        asyncio.StreamReader or any other object with an awaitable read method
+        and maps it to the record with the passed in mapper.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            reader: Some object with an awaitable read method.
+
+        Returns:
+            The passed record with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        chunks = []
+        while chunk := await reader.read(CHUNK_SIZE):
+            chunks.append(chunk)
+
+        return cls.serialize(record, mapper, b''.join(chunks))
+
+    @classmethod
+    def serialize_many_files(
+        cls,
+        paths: Iter[PathKind],
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        ordered: bool = True,
+        errors: Optional[List[FileError]] = None,
+    ) -> Iterator[Tuple[PathKind, T]]:
+        """
+        Reads and maps many files concurrently. Every file is read in a thread
+        pool and mapped to a new record, at most twice the amount of workers
+        files are in flight so the memory use stays bounded. Compressed files
+        are detected and decompressed while they are read.
+
+        When parse_workers is passed the files are still read in the thread
+        pool, but parsed and mapped in a process pool. This only happens if the
+        serializer, the record factory and the mapper can be pickled,
+        otherwise they are parsed in the thread pool.
+
+        Args:
+            paths: Some iterable of paths to the files.
+            record: Some factory method that creates an instance of a record
+                when called, a new record is created for every file. For
+                serializers that map multiple records per file this is passed
+                on as is.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            workers: The amount of threads that read the files.
+            parse_workers: The amount of worker processes that parse the
+                files.
+            ordered: Whether the results are yielded in the order of paths,
+                otherwise they are yielded as soon as they are done.
+            errors: Some list that the (path, exception) pairs of the files
+                that could not be read or mapped get appended to. These files
+                are skipped and the others are still yielded. When nothing is
+                passed in the first error is raised.
+
+        Returns:
+            An iterator over (path, record) pairs.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations and no
+                errors list is passed in.
+        """
+        # The pools are imported on first use, importing them pulls in
+        # logging and threading and multiprocessing for the process pool
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        threads = workers or min(32, (os.cpu_count() or 1) + 4)
+        read_executor = ThreadPoolExecutor(max_workers=threads)
+        parse_executor = None
+        if parse_workers and _is_picklable((cls, record, mapper)):
+            from concurrent.futures import ProcessPoolExecutor
+
+            parse_executor = ProcessPoolExecutor(max_workers=parse_workers)
+
+        max_pending = 2 * threads
+        pending: Deque[Tuple[PathKind, Future]] = collections.deque()
+
+        def submit(path: PathKind) -> None:
+            future = read_executor.submit(
+                _serialize_file, cls, record, mapper, path, parse_executor
+            )
+            pending.append((path, future))
+
+        def collect() -> Iterator[Tuple[PathKind, T]]:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                futures = [future for _, future in pending]
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                done = [item for item in pending if item[1] in finished]
+                for item in done:
+                    pending.remove(item)
+            for path, future in done:
+                result = _file_result(path, future, errors)
+                if result is not _SENTINEL:
+                    yield path, result
+
+        try:
+            for path in paths:
+                if len(pending) >= max_pending:
+                    yield from collect()
+                submit(path)
+
+            while pending:
+                yield from collect()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            read_executor.shutdown()
+            if parse_executor is not None:
+                parse_executor.shutdown()
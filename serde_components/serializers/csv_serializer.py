@@ -1,20 +1,98 @@
 # -*- coding: utf-8 -*-
+import collections
 import io
 import csv
-from typing import Generic, IO, Type, TypeVar, Union
+import os
+from typing import TYPE_CHECKING
+from typing import Any, AsyncIterator, Deque, Generic, IO, Iterator, Optional, Type
+from typing import TypeVar, Union
 from typing import Iterable as Iter
 
 from .base import BaseSerializer
-from ..mappers import BaseMapper
+from ..columns import Columns, read_columns
+from ..compression import AUTO, BUFFER_SIZE, CompressionKind, decompress, reading
+from ..instrumentation import timed, timed_iter
+from ..schema import Schema, SchemaKind, SchemaReader, as_schema
+from ..mappers import BaseMapper, aiter_records_from_dicts, iter_records_from_dicts
+from ..utils import BATCH_SIZE, CHUNK_SIZE, AsyncReader, Buffer, aiter_lines, iter_lines
+from ..utils import map_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 T = TypeVar('T')
 RKind = Union[Iter[T], Type[T]]
 
 
+class _LineFeed:
+    """
+    An iterator over lines that can be refilled after it ran dry. This lets a
+    csv.reader consume lines that arrive asynchronously.
+    """
+
+    def __init__(self) -> None:
+        self.lines: Deque[str] = collections.deque()
+
+    def __iter__(self) -> '_LineFeed':
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _reader(
+    lines: Iter[str], schema: Optional[Schema], fields: Optional[Iter[str]]
+) -> Iterator[Any]:
+    if schema is None and fields is None:
+        return csv.DictReader(lines)
+    return SchemaReader(lines, schema or Schema({}), fields)
+
+
+async def _aiter_rows(
+    reader: AsyncReader,
+    chunk_size: int,
+    schema: Optional[Schema],
+    fields: Optional[Iter[str]],
+) -> AsyncIterator[Any]:
+    feed = _LineFeed()
+    dict_reader = _reader(feed, schema, fields)
+    pending = ''
+    quotes = 0
+
+    async for line in aiter_lines(reader, chunk_size):
+        _line = line.decode('utf-8')
+        pending += _line
+        quotes += _line.count('"')
+        # An odd amount of quotes means a quoted field continues on the next
+        # line, the csv reader should only ever see complete rows.
+        if quotes % 2:
+            continue
+
+        feed.lines.append(pending)
+        pending = ''
+        quotes = 0
+        for row in dict_reader:
+            yield row
+
+    if pending:
+        feed.lines.append(pending)
+        for row in dict_reader:
+            yield row
+
+
 class CsvSerializer(BaseSerializer, Generic[T]):
     @staticmethod
     def serialize(
-        records: RKind[T], mapper: Type[BaseMapper[T]], data: bytes
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        data: Buffer,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
     ) -> Iter[T]:
         """
         This method takes in a iterable over the records and maps the data from
@@ -32,44 +110,170 @@ class CsvSerializer(BaseSerializer, Generic[T]):
                 this mapper should be specific for the type of record passed
                 in.
             data: Some bytestring that represents the record in a format
-                specified by the concrete Serializer.
+                specified by the concrete Serializer. Any object that
+                implements the buffer protocol is accepted as well, the data is
+                read one line at a time.
+            batch_size: The amount of rows that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
 
         Returns:
             The passed record with data mapped from the data.
         """
-        file_object = io.StringIO(data.decode('utf-8'))
-        dict_reader = csv.DictReader(file_object)
-
-        if isinstance(records, Iter):
-            return [
-                mapper.map_serialize(
-                    record,  # type:ignore
-                    str(row).encode('utf-8'),
-                )  # type:ignore
-                for record, row in zip(records, dict_reader)
-            ]
-        else:
-            return [
-                mapper.map_serialize(
-                    records(),  # type:ignore
-                    str(row).encode('utf-8'),
-                )  # type:ignore
-                for row in dict_reader
-            ]
+        lines = (line.decode('utf-8') for line in iter_lines(data))
+        dict_reader = _reader(lines, as_schema(schema), fields)
+        dict_reader = timed_iter(dict_reader, 'CsvSerializer', 'decode')
+        mapped_records = iter_records_from_dicts(
+            mapper, records, dict_reader, batch_size, workers, executor
+        )
+
+        return list(mapped_records)
 
     @classmethod
     def serialize_from_file(
         cls,
-        record: RKind[T],
+        records: RKind[T],
         mapper: Type[BaseMapper[T]],
         file_object: IO[bytes],
+        *,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
     ) -> Iter[T]:
         """
         A convenience method that reads data from a file object and maps it to
-        the record with the passed in mapper.
+        the records with the passed in mapper.
 
-        This method only gets overwriten to change the accepted types, see
-        BaseSerializer for more details.
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be read from. This
+                includes io.BytesIO and file objects opened in byte mode.
+            batch_size: The amount of rows that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        with reading(file_object, compression) as stream:
+            data = timed(stream.read, 'CsvSerializer', 'read')()
+        return cls.serialize(
+            records,
+            mapper,
+            data,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+            schema=schema,
+            fields=fields,
+        )
+
+    @classmethod
+    def serialize_from_path(
+        cls,
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        source: Union[str, 'os.PathLike[str]', int],
+        *,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+    ) -> Iter[T]:
+        """
+        A convenience method that memory maps a csv file and maps its rows to
+        the records with the passed in mapper. The file is read one line at a
+        time, unless it is compressed.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            batch_size: The amount of rows that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
+            compression: The compression of the file, see
+                compression.decompress for details. By default it is detected
+                from the magic bytes of the file.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations.
+        """
+        with map_file(source) as data:
+            return cls.serialize(
+                records,
+                mapper,
+                decompress(data, compression),
+                batch_size=batch_size,
+                workers=workers,
+                executor=executor,
+                schema=schema,
+                fields=fields,
+            )
+
+    @staticmethod
+    def iter_serialize_from_file(
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> Iterator[T]:
+        """
+        This method reads the csv data from a file object and lazily yields the
+        mapped records one row at a time. The file is decoded incrementally, so
+        only the current row is held in memory.
 
         Args:
             records: Some iterable of concrete record instances or a factory
@@ -77,18 +281,224 @@ class CsvSerializer(BaseSerializer, Generic[T]):
             mapper: Some concrete mapper class that inherits from BaseMapper,
                 this mapper should be specific for the type of record passed
                 in.
-            data: Some bytestring that represents the record in a format
-                specified by the concrete Deserializer.
             file_object: Some file-like object that can be read from. This
                 includes io.BytesIO and file objects opened in byte mode.
+            batch_size: The amount of rows that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file. The
+                data is decompressed while it is read.
+            buffer_size: The size of the reads from the decompressor.
 
         Returns:
-            The passed record with data mapped from the data.
+            An iterator over the passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        with reading(file_object, compression, buffer_size) as stream:
+            text_object = io.TextIOWrapper(
+                stream,  # type:ignore
+                encoding='utf-8',
+                newline='',
+            )
+            try:
+                dict_reader = _reader(text_object, as_schema(schema), fields)
+                dict_reader = timed_iter(dict_reader, 'CsvSerializer', 'decode')
+                yield from iter_records_from_dicts(
+                    mapper, records, dict_reader, batch_size, workers, executor
+                )
+            finally:
+                # Detaching makes sure the passed in file object is not closed
+                # when the wrapper gets garbage collected.
+                text_object.detach()
+
+    @staticmethod
+    def serialize_columns(
+        data: Buffer,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+        dictionary_encode: bool = True,
+        use_numpy: bool = False,
+    ) -> Columns:
+        """
+        This method reads the csv data into columns instead of records. Integer,
+        float and bool columns are stored in an array.array and string columns
+        are dictionary encoded, which takes up far less memory than a dict or
+        record per row. No mapper is involved since there are no records.
+
+        Args:
+            data: Some bytestring that contains csv data. Any object that
+                implements the buffer protocol is accepted as well, the data is
+                read one line at a time.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The type decides how the column is stored,
+                columns that are not in the schema are read as strings.
+            fields: The names of the columns that get read, the cells of all
+                other columns are skipped. All columns are read when nothing
+                is passed in.
+            dictionary_encode: Whether string columns are stored as a
+                columns.DictionaryColumn or as a list of interned strings.
+            use_numpy: Whether the numeric columns are returned as numpy
+                arrays. This requires numpy to be installed.
+
+        Returns:
+            A dict that maps every column name to a sequence of its values.
+
+        Raises:
+            ImportError: use_numpy is passed but numpy is not installed.
+        """
+        lines = (line.decode('utf-8') for line in iter_lines(data))
+        return read_columns(
+            lines, as_schema(schema), dictionary_encode, use_numpy, fields
+        )
+
+    @staticmethod
+    def serialize_columns_from_file(
+        file_object: IO[bytes],
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+        dictionary_encode: bool = True,
+        use_numpy: bool = False,
+        compression: CompressionKind = AUTO,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> Columns:
+        """
+        A convenience method that reads csv data from a file object into
+        columns, see serialize_columns for details. The file is decoded
+        incrementally.
+
+        Args:
+            file_object: Some file-like object that can be read from. This
+                includes io.BytesIO and file objects opened in byte mode.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The type decides how the column is stored,
+                columns that are not in the schema are read as strings.
+            fields: The names of the columns that get read, the cells of all
+                other columns are skipped. All columns are read when nothing
+                is passed in.
+            dictionary_encode: Whether string columns are stored as a
+                columns.DictionaryColumn or as a list of interned strings.
+            use_numpy: Whether the numeric columns are returned as numpy
+                arrays. This requires numpy to be installed.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file. The
+                data is decompressed while it is read.
+            buffer_size: The size of the reads from the decompressor.
+
+        Returns:
+            A dict that maps every column name to a sequence of its values.
+
+        Raises:
+            ImportError: use_numpy is passed but numpy is not installed.
+            ValueError: An error has occured while doing I/O operations.
+        """
+        with reading(file_object, compression, buffer_size) as stream:
+            text_object = io.TextIOWrapper(
+                stream,  # type:ignore
+                encoding='utf-8',
+                newline='',
+            )
+            try:
+                return read_columns(
+                    text_object, as_schema(schema), dictionary_encode, use_numpy, fields
+                )
+            finally:
+                text_object.detach()
+
+    @classmethod
+    async def aserialize_from_stream(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        reader: AsyncReader,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> Iter[T]:
+        """
+        The asynchronous version of serialize_from_file. It reads the csv data
+        from an asyncio.StreamReader or any other object with an awaitable read
+        method.
+
+        This method only gets overwriten to change the accepted types, see
+        BaseSerializer for more details.
+
+        Args:
+            record: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            reader: Some object with an awaitable read method.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        records = cls.aiter_serialize_from_stream(
+            record, mapper, reader, schema=schema, fields=fields
+        )
+
+        return [r async for r in records]
+
+    @staticmethod
+    async def aiter_serialize_from_stream(
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        reader: AsyncReader,
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        schema: Union[Schema, SchemaKind, None] = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> AsyncIterator[T]:
+        """
+        This method reads the csv data from an asyncio.StreamReader or any
+        other object with an awaitable read method and lazily yields the mapped
+        records as an asynchronous iterator.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            reader: Some object with an awaitable read method.
+            chunk_size: The amount of bytes that get read at once.
+            batch_size: The amount of rows that get passed to the batch hooks
+                of the mapper at once.
+            schema: Some mapping of column names to a type, a converter or a
+                schema.Column. The values of those columns are converted before
+                they get passed to the mapper, see schema.Schema for details.
+            fields: The names of the columns that get passed to the mapper,
+                the cells of all other columns are skipped. All columns are
+                passed when nothing is passed in.
+
+        Returns:
+            An asynchronous iterator over the passed records with data mapped
+            from the data.
 
         Raises:
             ValueError: An error has occured while doing I/O operations.
         """
-        r = record
-        m = mapper
-        f = file_object
-        return super().serialize_from_file(r, m, f)
+        rows = _aiter_rows(reader, chunk_size, as_schema(schema), fields)
+        async for record in aiter_records_from_dicts(mapper, records, rows, batch_size):
+            yield record
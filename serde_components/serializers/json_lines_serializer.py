@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import TYPE_CHECKING
+from typing import Any, AsyncIterator, Generic, IO, Iterator, Optional, Type
+from typing import TypeVar, Union
+from typing import Iterable as Iter
+
+from .base import BaseSerializer
+from ..compression import AUTO, BUFFER_SIZE, CompressionKind, decompress, reading
+from ..json_backends import BackendKind, get_loads
+from ..instrumentation import timed
+from ..mappers import BaseMapper, aiter_records_from_dicts, iter_records_from_dicts
+from ..utils import BATCH_SIZE, CHUNK_SIZE, AsyncReader, Buffer, aiter_lines, iter_lines
+from ..utils import map_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+RKind = Union[Iter[T], Type[T]]
+
+
+def _iter_lines(
+    lines: Iter[bytes], backend: BackendKind, fields: Optional[Iter[str]]
+) -> Iterator[Any]:
+    loads = timed(get_loads(backend, fields), 'JsonLinesSerializer', 'decode')
+    for line in lines:
+        if line.strip():
+            yield loads(line)
+
+
+async def _aiter_lines(
+    reader: AsyncReader,
+    chunk_size: int,
+    backend: BackendKind,
+    fields: Optional[Iter[str]],
+) -> AsyncIterator[Any]:
+    loads = timed(get_loads(backend, fields), 'JsonLinesSerializer', 'decode')
+    async for line in aiter_lines(reader, chunk_size):
+        if line.strip():
+            yield loads(line)
+
+
+class JsonLinesSerializer(BaseSerializer, Generic[T]):
+    @staticmethod
+    def serialize(
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        data: Buffer,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> Iter[T]:
+        """
+        This method takes in a iterable over the records and maps the data from
+        the given json lines data. Every non empty line should contain a single
+        json object which corresponds with a single record.
+
+        This class takes a different type than the BaseSerializer, it does not
+        make sense for a json lines serializer to only map a single record. For
+        this reason the type checking is ignored.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            data: Some bytestring that represents the records in the json
+                lines format. Any object that implements the buffer protocol is
+                accepted as well, the data is read one line at a time.
+            batch_size: The amount of lines that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+
+        Returns:
+            The passed records with data mapped from the data.
+        """
+        rows = _iter_lines(iter_lines(data), backend, fields)
+        mapped_records = iter_records_from_dicts(
+            mapper, records, rows, batch_size, workers, executor
+        )
+
+        return list(mapped_records)
+
+    @classmethod
+    def serialize_from_file(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+    ) -> Iter[T]:
+        """
+        A convenience method that reads data from a file object and maps it to
+        the records with the passed in mapper.
+
+        Args:
+            record: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be read from. This
+                includes io.BytesIO and file objects opened in byte mode.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        records = cls.iter_serialize_from_file(
+            record,
+            mapper,
+            file_object,
+            backend=backend,
+            fields=fields,
+            compression=compression,
+        )
+
+        return list(records)
+
+    @classmethod
+    def serialize_from_path(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        source: Union[str, 'os.PathLike[str]', int],
+        *,
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+    ) -> Iter[T]:
+        """
+        A convenience method that memory maps a json lines file and maps its
+        lines to the records with the passed in mapper. The file is read one
+        line at a time, unless it is compressed.
+
+        Args:
+            record: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+            compression: The compression of the file, see
+                compression.decompress for details. By default it is detected
+                from the magic bytes of the file.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations.
+        """
+        with map_file(source) as data:
+            return cls.serialize(
+                record,
+                mapper,
+                decompress(data, compression),
+                backend=backend,
+                fields=fields,
+            )
+
+    @staticmethod
+    def iter_serialize_from_file(
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> Iterator[T]:
+        """
+        This method reads the json lines data from a file object and lazily
+        yields the mapped records one line at a time. Only the current batch
+        of lines is held in memory.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be read from. This
+                includes io.BytesIO and file objects opened in byte mode.
+            batch_size: The amount of lines that get passed to the batch hooks
+                of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file. The
+                data is decompressed while it is read.
+            buffer_size: The size of the reads from the decompressor.
+
+        Returns:
+            An iterator over the passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        with reading(file_object, compression, buffer_size) as stream:
+            rows = _iter_lines(stream, backend, fields)
+
+            yield from iter_records_from_dicts(
+                mapper, records, rows, batch_size, workers, executor
+            )
+
+    @classmethod
+    async def aserialize_from_stream(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        reader: AsyncReader,
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> Iter[T]:
+        """
+        The asynchronous version of serialize_from_file. It reads the json
+        lines data from an asyncio.StreamReader or any other object with an
+        awaitable read method.
+
+        Args:
+            record: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            reader: Some object with an awaitable read method.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        records = cls.aiter_serialize_from_stream(
+            record, mapper, reader, backend=backend, fields=fields
+        )
+
+        return [r async for r in records]
+
+    @staticmethod
+    async def aiter_serialize_from_stream(
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        reader: AsyncReader,
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = BATCH_SIZE,
+        backend: BackendKind = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> AsyncIterator[T]:
+        """
+        This method reads the json lines data from an asyncio.StreamReader or
+        any other object with an awaitable read method and lazily yields the
+        mapped records as an asynchronous iterator.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            reader: Some object with an awaitable read method.
+            chunk_size: The amount of bytes that get read at once.
+            batch_size: The amount of lines that get passed to the batch hooks
+                of the mapper at once.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after a line is decoded. All keys
+                are passed when nothing is passed in.
+
+        Returns:
+            An asynchronous iterator over the passed records with data mapped
+            from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        rows = _aiter_lines(reader, chunk_size, backend, fields)
+        async for record in aiter_records_from_dicts(mapper, records, rows, batch_size):
+            yield record
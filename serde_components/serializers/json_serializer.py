@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
-import inspect
-import json
-from typing import Type, TypeVar, Union
+import os
+from typing import TYPE_CHECKING
+from typing import Any, IO, Optional, Type, TypeVar, Union
+from typing import Iterable as Iter
 
 from .base import BaseSerializer
-from ..mappers import BaseMapper
+from ..compression import AUTO, CompressionKind, decompress, reading
+from ..instrumentation import timed
+from ..json_backends import BackendKind, get_backend, project
+from ..mappers import BaseMapper, record_from_dict
+from ..utils import Buffer, map_file
+
+if TYPE_CHECKING:
+    from ..cache import DocumentCache
 
 T = TypeVar('T')
 RKind = Union[T, Type[T]]
@@ -15,19 +23,161 @@ class JsonSerializer(BaseSerializer[T]):
     def serialize(
         record: RKind[T],
         mapper: Type[BaseMapper[T]],
-        data: bytes,
+        data: Buffer,
+        backend: BackendKind = None,
+        cache: Optional['DocumentCache'] = None,
+        fields: Optional[Iter[str]] = None,
+    ) -> T:
+        """
+        This method decodes a json document and maps it to the record with the
+        passed in mapper.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            data: Some bytestring that represents the record as json. Any
+                object that implements the buffer protocol is accepted as well.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by a hash of the data. The data is not parsed again when
+                the same content is passed in later.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after the document is decoded.
+                All keys are passed when nothing is passed in.
+
+        Returns:
+            The passed record with data mapped from the data.
+        """
+        json_backend = get_backend(backend)
+        loads = timed(json_backend.loads, 'JsonSerializer', 'decode')
+        if cache is None:
+            json_data = loads(data)
+        else:
+            namespace = ('json', json_backend)
+            json_data = cache.load(data, loads, namespace)
+
+        return JsonSerializer._map(record, mapper, project(json_data, fields))
+
+    @classmethod
+    def serialize_from_file(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        file_object: IO[bytes],
+        *,
+        backend: BackendKind = None,
+        cache: Optional['DocumentCache'] = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
+    ) -> T:
+        """
+        A convenience method that reads a json document from a file object and
+        maps it to the record with the passed in mapper.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            file_object: Some file-like object that can be read from. This
+                includes io.BytesIO and file objects opened in byte mode.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by a hash of the data read from the file. The file is
+                still read, but not parsed again when its content did not
+                change.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after the document is decoded.
+                All keys are passed when nothing is passed in.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file.
+
+        Returns:
+            The passed record with data mapped from the data.
+
+        Raises:
+            ValueError: An error has occured while doing I/O operations.
+        """
+        with reading(file_object, compression) as stream:
+            data = timed(stream.read, 'JsonSerializer', 'read')()
+        return cls.serialize(
+            record, mapper, data, backend=backend, cache=cache, fields=fields
+        )
+
+    @classmethod
+    def serialize_from_path(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        source: Union[str, 'os.PathLike[str]', int],
+        backend: BackendKind = None,
+        cache: Optional['DocumentCache'] = None,
+        fields: Optional[Iter[str]] = None,
+        compression: CompressionKind = AUTO,
     ) -> T:
-        """This docstring gets overwritten with the original one."""
-        json_data: bytes = str(json.loads(data)).encode('utf-8')
+        """
+        A convenience method that memory maps a json file and maps its
+        contents to the record with the passed in mapper.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            backend: The name of a registered json backend or a backend
+                object, see json_backends for details. The default backend is
+                used when nothing is passed in.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by the identity, size and modification time of the file.
+                An unchanged file is not read or parsed again.
+            fields: The top level keys that get passed to the mapper, all
+                other keys are dropped right after the document is decoded.
+                All keys are passed when nothing is passed in.
+            compression: The compression of the file, see
+                compression.decompress for details. By default it is detected
+                from the magic bytes of the file.
+
+        Returns:
+            The passed record with data mapped from the data.
+
+        Raises:
+            OSError: An error has occured while doing I/O operations.
+        """
+        json_backend = get_backend(backend)
+        loads = timed(json_backend.loads, 'JsonSerializer', 'decode')
+        if cache is None:
+            with map_file(source) as data:
+                json_data = loads(decompress(data, compression))
+        else:
+            namespace = ('json', json_backend, compression)
+            json_data = cache.load_path(
+                source, lambda data: loads(decompress(data, compression)), namespace
+            )
+
+        return cls._map(record, mapper, project(json_data, fields))
+
+    @staticmethod
+    def _map(record: RKind[T], mapper: Type[BaseMapper[T]], json_data: Any) -> T:
+        import inspect
+
         _rv = None
 
         if inspect.isclass(record):
             _record = record()
-            _rv = mapper.map_serialize(_record, json_data)
+            _rv = record_from_dict(mapper, _record, json_data)  # type:ignore
         else:
-            _rv = mapper.map_serialize(record, json_data)  # type:ignore
+            _rv = record_from_dict(mapper, record, json_data)  # type:ignore
 
         return _rv  # type:ignore
-
-
-JsonSerializer.serialize.__doc__ = BaseSerializer.serialize.__doc__
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+from typing import TYPE_CHECKING
+from typing import ClassVar, Generic, Iterator, Optional, Type, TypeVar, Union
+from typing import Iterable as Iter
+
+from .base import BaseSerializer
+from ..mappers import BaseMapper, iter_records_from_dicts
+from ..struct_layout import StructLayout, iter_rows
+from ..utils import BATCH_SIZE, Buffer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+RKind = Union[Iter[T], Type[T]]
+LAYOUT_ERROR = 'No layout is passed in or declared on the class'
+
+
+class StructSerializer(BaseSerializer, Generic[T]):
+    """
+    This class reads records from the binary format that StructDeserializer
+    writes. The layout is either declared on a derived class or passed in to
+    every method, it has to match the layout the data was written with.
+
+    Example:
+        class RecordSerializer(StructSerializer[Record]):
+            layout = StructLayout([('age', 'q'), ('name', 'str')])
+    """
+
+    layout: ClassVar[Optional[StructLayout]] = None
+
+    @classmethod
+    def serialize(  # type:ignore
+        cls,
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        data: Buffer,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        layout: Optional[StructLayout] = None,
+    ) -> Iter[T]:
+        """
+        This method takes in a iterable over the records and maps the unpacked
+        fields of every record in the data to them.
+
+        This class takes a different type than the BaseSerializer, it does not
+        make sense for a binary record format to only map a single record. For
+        this reason the type checking is ignored.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            data: Some bytestring written by StructDeserializer. Any object
+                that implements the buffer protocol is accepted as well, the
+                data is unpacked without copying it.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            layout: The layout that describes the fields, this defaults to the
+                layout of the class.
+
+        Returns:
+            The passed records with data mapped from the data.
+
+        Raises:
+            ValueError: No layout is available or the data was not written by
+                a StructDeserializer.
+        """
+        mapped_records = cls.iter_serialize(
+            records,
+            mapper,
+            data,
+            batch_size=batch_size,
+            workers=workers,
+            executor=executor,
+            layout=layout,
+        )
+
+        return list(mapped_records)
+
+    @classmethod
+    def iter_serialize(
+        cls,
+        records: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        data: Buffer,
+        batch_size: int = BATCH_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional['Executor'] = None,
+        layout: Optional[StructLayout] = None,
+    ) -> Iterator[T]:
+        """
+        This method lazily yields the mapped records one at a time. Records
+        with dictionary encoded strings are unpacked with struct.iter_unpack.
+        The data has to stay available until the iterator is exhausted.
+
+        Args:
+            records: Some iterable of concrete record instances or a factory
+                method that creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            data: Some bytestring written by StructDeserializer. Any object
+                that implements the buffer protocol is accepted as well, the
+                data is unpacked without copying it.
+            batch_size: The amount of records that get passed to the batch
+                hooks of the mapper at once.
+            workers: The amount of worker processes to map the batches in,
+                records have to be passed as a factory method.
+            executor: Some concurrent.futures.Executor to map the batches in.
+            layout: The layout that describes the fields, this defaults to the
+                layout of the class.
+
+        Returns:
+            An iterator over the passed records with data mapped from the data.
+
+        Raises:
+            ValueError: No layout is available or the data was not written by
+                a StructDeserializer.
+        """
+        _layout = layout or cls.layout
+        if _layout is None:
+            raise ValueError(LAYOUT_ERROR)
+
+        rows = iter_rows(data, _layout)
+        yield from iter_records_from_dicts(
+            mapper, records, rows, batch_size, workers, executor
+        )
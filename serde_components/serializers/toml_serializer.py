@@ -1,17 +1,31 @@
 # -*- coding: utf-8 -*-
-import inspect
-from typing import IO, Type, TypeVar, Union
-import sys
+import os
+from typing import TYPE_CHECKING
+from typing import Any, IO, Optional, Type, TypeVar, Union
 from .base import BaseSerializer
-from ..mappers import BaseMapper
+from ..compression import AUTO, CompressionKind, decompress, reading
+from ..instrumentation import timed
+from ..mappers import BaseMapper, record_from_dict
+from ..utils import Buffer
+
+if TYPE_CHECKING:
+    from ..cache import DocumentCache
 
 T = TypeVar('T')
 RKind = Union[T, Type[T]]
 PYTHON_VERSION_ERROR = 'Your python version does not support this component'
 
 
-if sys.version_info.minor >= 11:
-    import tomllib  # type:ignore
+def _loads(data: Buffer) -> Any:
+    # tomllib is imported on first use, so importing this module stays cheap and
+    # works on python versions that do not ship it
+    try:
+        import tomllib  # type:ignore
+    except ImportError:
+        raise ImportError(PYTHON_VERSION_ERROR)
+
+    # tomllib.loads does not take in bytestrings like json.loads does
+    return tomllib.loads(str(data, 'utf-8'))
 
 
 class TomlSerializer(BaseSerializer[T]):
@@ -19,7 +33,8 @@ class TomlSerializer(BaseSerializer[T]):
     def serialize(
         record: RKind[T],
         mapper: Type[BaseMapper[T]],
-        data: bytes,
+        data: Buffer,
+        cache: Optional['DocumentCache'] = None,
     ) -> T:
         """
         This method is only available in python versions 3.11 and later.
@@ -32,32 +47,86 @@ class TomlSerializer(BaseSerializer[T]):
                 in.
             data: Some bytestring that represents the record in a format
                 specified by the concrete Serializer.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by a hash of the data. The data is not parsed again when
+                the same content is passed in later.
 
         Returns:
             The passed record with data mapped from the data.
 
         Raises:
-            NameError: Tomllib is not available on the system. This class is
+            ImportError: Tomllib is not available on the system. This class is
                 only supported on python versions 3.11 and later.
         """
-        # tomllib.loads does not take in bytestrings like json.loads does
-        _data: str = data.decode('utf-8')
-        _rv = None
+        loads = timed(_loads, 'TomlSerializer', 'decode')
+        if cache is None:
+            toml = loads(data)
+        else:
+            toml = cache.load(data, loads, namespace='toml')
+
+        return TomlSerializer._map(record, mapper, toml)
+
+    @classmethod
+    def serialize_from_path(
+        cls,
+        record: RKind[T],
+        mapper: Type[BaseMapper[T]],
+        source: Union[str, 'os.PathLike[str]', int],
+        cache: Optional['DocumentCache'] = None,
+        compression: CompressionKind = AUTO,
+    ) -> T:
+        """
+        This method is only available in python versions 3.11 and later.
+
+        Args:
+            record: Some concrete record instance or a factory method that
+                creates an instance of a record when called.
+            mapper: Some concrete mapper class that inherits from BaseMapper,
+                this mapper should be specific for the type of record passed
+                in.
+            source: Some path or an open file descriptor, a passed file
+                descriptor is not closed.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by the identity, size and modification time of the file.
+                An unchanged file is not read or parsed again.
+            compression: The compression of the file, see
+                compression.decompress for details. By default it is detected
+                from the magic bytes of the file.
 
-        try:
-            toml = tomllib.loads(_data)
-        except NameError:
-            raise ImportError(PYTHON_VERSION_ERROR)
+        Returns:
+            The passed record with data mapped from the data.
 
-        toml_data: bytes = str(toml).encode('utf-8')
+        Raises:
+            ImportError: Tomllib is not available on the system. This class is
+                only supported on python versions 3.11 and later.
+            OSError: An error has occured while doing I/O operations.
+        """
+        if cache is None:
+            return super().serialize_from_path(
+                record, mapper, source, compression=compression
+            )
+
+        loads = timed(_loads, 'TomlSerializer', 'decode')
+        toml = cache.load_path(
+            source,
+            lambda data: loads(decompress(data, compression)),
+            namespace=('toml', compression),
+        )
+        return cls._map(record, mapper, toml)
+
+    @staticmethod
+    def _map(record: RKind[T], mapper: Type[BaseMapper[T]], toml: Any) -> T:
+        import inspect
+
+        _rv = None
 
         if inspect.isclass(record):
             _record = record()
-            _rv = mapper.map_serialize(_record, toml_data)
+            _rv = record_from_dict(mapper, _record, toml)  # type:ignore
         else:
-            _rv = mapper.map_serialize(record, toml_data)  # type: ignore
+            _rv = record_from_dict(mapper, record, toml)  # type:ignore
 
-        return _rv  # type: ignore
+        return _rv  # type:ignore
 
     @classmethod
     def serialize_from_file(
@@ -65,6 +134,8 @@ class TomlSerializer(BaseSerializer[T]):
         record: RKind[T],
         mapper: Type[BaseMapper[T]],
         file_object: IO[bytes],
+        compression: CompressionKind = AUTO,
+        cache: Optional['DocumentCache'] = None,
     ) -> T:
         """
         This method is only available in python versions 3.11 and later.
@@ -76,16 +147,28 @@ class TomlSerializer(BaseSerializer[T]):
                 in.
             data: Some bytestring that represents the record in a format
                 specified by the concrete Serializer.
+            compression: The compression of the data, see
+                compression.reading for details. By default it is detected
+                from the magic bytes of the data or the name of the file.
+            cache: Some cache.DocumentCache that stores the parsed document
+                keyed by a hash of the data read from the file. The file is
+                still read, but not parsed again when its content did not
+                change.
 
         Returns:
             The passed record with data mapped from the data.
 
         Raises:
-            NameError: Tomllib is not available on the system. This class is
+            ImportError: Tomllib is not available on the system. This class is
                 only supported on python versions 3.11 and later.
             ValueError: An error has occured while doing I/O operations.
         """
         r = record
         m = mapper
         fo = file_object
-        return super().serialize_from_file(r, m, fo)
+        if cache is None:
+            return super().serialize_from_file(r, m, fo, compression=compression)
+
+        with reading(fo, compression) as stream:
+            data = timed(stream.read, 'TomlSerializer', 'read')()
+        return cls.serialize(r, m, data, cache=cache)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import struct
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from .utils import Buffer
+
+# The field kind of strings, all other kinds are struct format characters
+STRING = 'str'
+# The ways strings can be stored
+DICTIONARY = 'dictionary'
+LENGTH_PREFIXED = 'length_prefixed'
+# The code or length of a string field that holds None
+NULL = 0xFFFFFFFF
+
+MAGIC = b'SCS1'
+# The record count, the offset of the string table and the magic bytes
+FOOTER = struct.Struct('<QQ4s')
+_LENGTH = struct.Struct('<I')
+
+
+class StructLayout:
+    """
+    Describes the binary layout of a record for the struct components. The
+    fields are compiled once into a struct.Struct, every record is stored as
+    the packed values of its fields in the declared order.
+
+    Strings are either dictionary encoded, where every record stores a code
+    into a table of distinct strings that is written after the records, or
+    length prefixed, where the encoded string directly follows the fixed part
+    of the record. Dictionary encoded records all have the same width, so they
+    are read with struct.iter_unpack. A None string is stored as NULL, other
+    None values can not be stored.
+
+    Args:
+        fields: Some sequence of (name, kind) pairs. The kind is a single
+            struct format code like 'q', 'd', '?' or '16s', or 'str' for a
+            string of any length.
+        strings: How strings are stored, either 'dictionary' or
+            'length_prefixed'.
+        byte_order: The struct byte order character that is used.
+
+    Raises:
+        ValueError: There are no fields or strings is not a known mode.
+        struct.error: A kind is not a valid struct format.
+
+    Example:
+        layout = StructLayout([('age', 'q'), ('name', 'str')])
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[Tuple[str, str]],
+        strings: str = DICTIONARY,
+        byte_order: str = '<',
+    ):
+        if not fields:
+            raise ValueError('A layout needs at least one field')
+        if strings not in (DICTIONARY, LENGTH_PREFIXED):
+            raise ValueError(f'{strings!r} is not a known string mode')
+
+        self.names = tuple(name for name, _ in fields)
+        self.kinds = tuple(kind for _, kind in fields)
+        self.strings = strings
+        self.string_indices = tuple(
+            index for index, kind in enumerate(self.kinds) if kind == STRING
+        )
+        codes = ''.join('I' if kind == STRING else kind for kind in self.kinds)
+        self.struct = struct.Struct(byte_order + codes)
+
+    def __repr__(self) -> str:
+        fields = list(zip(self.names, self.kinds))
+        return f'StructLayout({fields!r}, strings={self.strings!r})'
+
+
+def pack_table(table: List[str]) -> bytes:
+    """
+    Packs the string table of dictionary encoded data, the amount of strings
+    followed by every utf-8 encoded string with its length.
+    """
+    buffer = bytearray(_LENGTH.pack(len(table)))
+    for value in table:
+        encoded = value.encode('utf-8')
+        buffer += _LENGTH.pack(len(encoded))
+        buffer += encoded
+
+    return bytes(buffer)
+
+
+def _unpack_table(view: memoryview, offset: int) -> List[str]:
+    (count,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    table = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        table.append(str(view[offset : offset + length], 'utf-8'))
+        offset += length
+
+    return table
+
+
+def iter_rows(data: Buffer, layout: StructLayout) -> Iterator[Dict[str, Any]]:
+    """
+    Unpacks the records of data written by StructDeserializer into dicts.
+
+    Args:
+        data: Some bytestring or other object that implements the buffer
+            protocol.
+        layout: The layout the data was written with.
+
+    Returns:
+        An iterator over a dict per record.
+
+    Raises:
+        ValueError: The data was not written by a StructDeserializer.
+    """
+    with memoryview(data) as view:
+        end = len(view) - FOOTER.size
+        if end < 0:
+            raise ValueError('The data is too short to contain struct records')
+        count, table_offset, magic = FOOTER.unpack_from(view, end)
+        if magic != MAGIC:
+            raise ValueError('The data does not end with the struct magic bytes')
+
+        names = layout.names
+        string_indices = layout.string_indices
+        size = layout.struct.size
+        if layout.strings == DICTIONARY:
+            table = _unpack_table(view, table_offset) if string_indices else []
+            with view[: count * size] as records_view:
+                for values in layout.struct.iter_unpack(records_view):
+                    if string_indices:
+                        _values = list(values)
+                        for index in string_indices:
+                            code = _values[index]
+                            _values[index] = None if code == NULL else table[code]
+                        values = tuple(_values)
+                    yield dict(zip(names, values))
+            return
+
+        unpack_from = layout.struct.unpack_from
+        offset = 0
+        for _ in range(count):
+            _values = list(unpack_from(view, offset))
+            offset += size
+            for index in string_indices:
+                length = _values[index]
+                if length == NULL:
+                    _values[index] = None
+                else:
+                    _values[index] = str(view[offset : offset + length], 'utf-8')
+                    offset += length
+            yield dict(zip(names, _values))
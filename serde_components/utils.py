@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+import collections
+import contextlib
+import itertools
+import os
+import re
+from typing import TYPE_CHECKING
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque
+from typing import Iterator, List, Optional, Protocol, TypeVar, Union
+from typing import Iterable as Iter
+
+# These modules are imported on first use, so importing a component does not
+# pull in the modules of features it does not use
+if TYPE_CHECKING:
+    import mmap
+    from concurrent.futures import Executor, Future
+
+T = TypeVar('T')
+R = TypeVar('R')
+BATCH_SIZE = 1000
+CHUNK_SIZE = 64 * 1024
+_SENTINEL = object()
+_LINE = re.compile(rb'[^\n]*\n|[^\n]+')
+
+# Every object that implements the buffer protocol can be used as input data,
+# these are the ones that are supported explicitly.
+Buffer = Union[bytes, bytearray, memoryview, 'mmap.mmap']
+
+
+class AsyncReader(Protocol):
+    """
+    Any object with an awaitable read method, like asyncio.StreamReader.
+    """
+
+    def read(self, n: int = -1) -> Awaitable[bytes]:
+        ...
+
+
+class AsyncWriter(Protocol):
+    """
+    Any object with a write method that is either awaitable or paired with an
+    awaitable drain method, like asyncio.StreamWriter.
+    """
+
+    def write(self, data: bytes) -> Any:
+        ...
+
+
+def batched(iterable: Iter[T], size: int = BATCH_SIZE) -> Iterator[List[T]]:
+    """
+    Splits an iterable into lists of at most size items. The last list can be
+    shorter than size.
+
+    Args:
+        iterable: Some iterable that gets split up.
+        size: The maximum amount of items in a single batch.
+
+    Returns:
+        An iterator over the batches.
+    """
+    if size < 1:
+        raise ValueError('size must be at least 1')
+
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def map_batches(
+    function: Callable[[T], R],
+    batches: Iter[T],
+    workers: Optional[int] = None,
+    executor: Optional['Executor'] = None,
+) -> Iterator[R]:
+    """
+    Applies function to every batch and yields the results in input order. When
+    workers or an executor is passed the batches are mapped concurrently, with
+    at most twice the amount of workers batches in flight so the memory use
+    stays bounded. If workers is passed a process pool is created and shut
+    down by this function, a passed executor is left running.
+
+    Work is only sent to a process pool if the function and the first batch
+    can be pickled, otherwise every batch is mapped serially.
+
+    Args:
+        function: Some picklable callable that takes a single batch.
+        batches: Some iterable of batches.
+        workers: The amount of worker processes to use.
+        executor: Some concurrent.futures.Executor to submit the batches to.
+
+    Returns:
+        An iterator over the results of function in input order.
+    """
+    iterator = iter(batches)
+    if executor is None and not workers:
+        yield from map(function, iterator)
+        return
+
+    first_batch = next(iterator, _SENTINEL)
+    if first_batch is _SENTINEL:
+        return
+    iterator = itertools.chain([first_batch], iterator)  # type:ignore
+
+    # Importing the process pool pulls in multiprocessing, so it only happens
+    # once batches are actually mapped concurrently
+    from concurrent.futures import ProcessPoolExecutor
+
+    pickled = executor is None or isinstance(executor, ProcessPoolExecutor)
+    if pickled and not _is_picklable((function, first_batch)):
+        yield from map(function, iterator)
+        return
+
+    _executor = executor or ProcessPoolExecutor(max_workers=workers)
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending: Deque[Future] = collections.deque()
+    try:
+        for batch in iterator:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(_executor.submit(function, batch))
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            _executor.shutdown()
+
+
+def _is_picklable(obj: Any) -> bool:
+    import pickle
+
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+
+    return True
+
+
+async def abatched(
+    iterable: AsyncIterable[T], size: int = BATCH_SIZE
+) -> AsyncIterator[List[T]]:
+    """
+    The asynchronous version of batched.
+
+    Args:
+        iterable: Some asynchronous iterable that gets split up.
+        size: The maximum amount of items in a single batch.
+
+    Returns:
+        An asynchronous iterator over the batches.
+    """
+    if size < 1:
+        raise ValueError('size must be at least 1')
+
+    batch = []
+    async for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def aiter_lines(
+    reader: AsyncReader, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Reads from an asynchronous reader in chunks of chunk_size bytes and yields
+    the data one line at a time. The line endings are kept.
+
+    Args:
+        reader: Some object with an awaitable read method.
+        chunk_size: The amount of bytes that get read at once.
+
+    Returns:
+        An asynchronous iterator over the lines.
+    """
+    pending = b''
+    while chunk := await reader.read(chunk_size):
+        lines = chunk.split(b'\n')
+        lines[0] = pending + lines[0]
+        pending = lines.pop()
+        for line in lines:
+            yield line + b'\n'
+
+    if pending:
+        yield pending
+
+
+async def awrite(writer: AsyncWriter, data: bytes) -> None:
+    """
+    Writes data to an asynchronous writer. If the writer has a drain method it
+    gets awaited, so the backpressure of the writer is respected.
+
+    Args:
+        writer: Some object with a write method that is either awaitable or
+            paired with an awaitable drain method.
+        data: The bytestring that gets written.
+    """
+    import inspect
+
+    rv = writer.write(data)
+    if inspect.isawaitable(rv):
+        await rv
+
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+
+
+def iter_lines(data: Buffer) -> Iterator[bytes]:
+    """
+    Yields the lines in a buffer one at a time, the line endings are kept. Only
+    the current line gets copied, so iterating over a memory mapped file does
+    not read the whole file into memory.
+
+    Args:
+        data: Some object that implements the buffer protocol.
+
+    Returns:
+        An iterator over the lines.
+    """
+    for match in _LINE.finditer(data):
+        yield match.group()
+
+
+@contextlib.contextmanager
+def map_file(source: Union[str, 'os.PathLike[str]', int]) -> Iterator[Buffer]:
+    """
+    Memory maps a file for reading. A file descriptor that is passed in is not
+    closed when the context exits.
+
+    Args:
+        source: Some path or an open file descriptor.
+
+    Returns:
+        A context manager that yields the memory mapped file. Empty files can
+        not be memory mapped, in that case an empty bytestring is yielded.
+    """
+    import mmap
+
+    fd = source if isinstance(source, int) else os.open(source, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+    finally:
+        if not isinstance(source, int):
+            os.close(fd)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import Any, Callable, IO, Iterator, NamedTuple, Optional
+from typing import Iterable as Iter
+
+from .instrumentation import measure
+from .utils import CHUNK_SIZE, Buffer
+
+
+class Progress(NamedTuple):
+    """
+    The progress that a ChunkedWriter reports after every flush.
+    """
+
+    chunk_records: int
+    chunk_bytes: int
+    records: int
+    bytes_written: int
+
+
+ProgressCallback = Callable[[Progress], Any]
+
+
+class ChunkedWriter:
+    """
+    A buffered writer that the deserializers use to write encoded records to a
+    file object. The encoded records are collected in a single bytearray that
+    is reused for every chunk, and flushed to the file object once either
+    flush_records records or flush_bytes bytes are buffered. The memory use is
+    bounded by the chunk size, no matter how many records are written.
+
+    The remaining buffered data is flushed when the writer is closed or when
+    its context exits without an error. The file object itself is not closed.
+
+    Args:
+        file_object: Some file-like object that can be written to.
+        flush_records: The amount of records after which the buffer is
+            flushed. Only the amount of bytes is taken into account when
+            nothing is passed in.
+        flush_bytes: The amount of bytes after which the buffer is flushed.
+        fsync: Whether os.fsync is called on the file object after every
+            flush, so every chunk is on disk once it has been reported.
+        progress: Some callable that gets called with a Progress after every
+            flush.
+
+    Example:
+        with ChunkedWriter(file_object, flush_records=1000) as writer:
+            for line in lines:
+                writer.write(line)
+    """
+
+    def __init__(
+        self,
+        file_object: IO[bytes],
+        flush_records: Optional[int] = None,
+        flush_bytes: int = CHUNK_SIZE,
+        fsync: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        if flush_records is not None and flush_records < 1:
+            raise ValueError('flush_records must be at least 1')
+
+        self.file_object = file_object
+        self.flush_records = flush_records
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+        self.progress = progress
+        self.records = 0
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._buffered_records = 0
+
+    def __enter__(self) -> 'ChunkedWriter':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.close()
+
+    def write(self, data: Buffer, records: int = 1) -> None:
+        """
+        Buffers encoded data and flushes the buffer when one of the limits is
+        reached.
+
+        Args:
+            data: Some bytestring that contains complete records.
+            records: The amount of records in the data, this is 0 for data like
+                a header.
+        """
+        if not self._buffer and len(data) >= self.flush_bytes:
+            # Large payloads skip the copy into the buffer
+            self._write(data, records)
+            return
+
+        self._buffer += data
+        self._buffered_records += records
+        if len(self._buffer) >= self.flush_bytes or (
+            self.flush_records is not None
+            and self._buffered_records >= self.flush_records
+        ):
+            self.flush()
+
+    def writelines(self, lines: Iter[bytes]) -> None:
+        """
+        Writes every bytestring in lines as a single record.
+        """
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered data to the file object.
+        """
+        if self._buffer:
+            # The file object may keep the written buffer, so it is replaced
+            # instead of cleared.
+            self._write(self._buffer, self._buffered_records)
+            self._buffer = bytearray()
+            self._buffered_records = 0
+
+    def close(self) -> None:
+        """
+        Flushes the remaining buffered data, the file object is not closed.
+        """
+        self.flush()
+
+    def _write(self, data: Buffer, records: int) -> None:
+        with measure('ChunkedWriter', 'write', records, len(data)):
+            self.file_object.write(data)
+            if self.fsync:
+                self.file_object.flush()
+                os.fsync(self.file_object.fileno())
+
+        self.records += records
+        self.bytes_written += len(data)
+        if self.progress is not None:
+            self.progress(
+                Progress(records, len(data), self.records, self.bytes_written)
+            )
+
+
+def iter_chunks(pieces: Iter[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Joins bytestrings into chunks of at least chunk_size bytes, only the last
+    chunk can be smaller. A single bytearray is reused for every chunk.
+
+    Args:
+        pieces: Some iterable of bytestrings.
+        chunk_size: The amount of bytes that get buffered before a chunk is
+            yielded.
+
+    Returns:
+        An iterator over the chunks.
+    """
+    buffer = bytearray()
+    for piece in pieces:
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+        buffer += piece
+
+    if buffer:
+        yield bytes(buffer)
@@ -1,3 +1,15 @@
 # -*- coding: utf-8 -*-
+from . import test_cache
+from . import test_columns
+from . import test_compression
 from . import test_csv
+from . import test_delta
+from . import test_fan_out
+from . import test_instrumentation
 from . import test_json
+from . import test_lazy
+from . import test_mappers
+from . import test_records
+from . import test_schema
+from . import test_struct
+from . import test_writers
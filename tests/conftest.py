@@ -2,9 +2,13 @@
 
 # The test fixtures in this file are automagically imported to all test files
 
-from typing import List
+import asyncio
+import io
+from typing import Any, List, Type, Union
 import pytest
 
+from serde_components.mappers import BaseDictMapper
+
 
 class ConcreteRecord:
     def __init__(self, name=None, age=None):
@@ -18,6 +22,48 @@ class ConcreteRecord:
         return f"ConcreteRecord(name='{self.name}', age={self.age})"
 
 
+class DictMapper(BaseDictMapper['ConcreteRecord']):
+    @staticmethod
+    def map_to_dict(record: Union[ConcreteRecord, Type[ConcreteRecord]]) -> Any:
+        assert isinstance(record, ConcreteRecord)
+        return {
+            'age': record.age,
+            'name': record.name,
+        }
+
+    @staticmethod
+    def map_from_dict(
+        record: Union[ConcreteRecord, Type[ConcreteRecord]], data: Any
+    ) -> ConcreteRecord:
+        assert isinstance(record, ConcreteRecord)
+        age = data.get('age')
+        record.age = int(age) if isinstance(age, str) and age.isdigit() else age
+        record.name = data.get('name')
+
+        return record
+
+
+class AsyncBytesWriter:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.drain_count = 0
+
+    def write(self, data: bytes) -> None:
+        self.buffer.write(data)
+
+    async def drain(self) -> None:
+        self.drain_count += 1
+
+
+def make_stream_reader(data: bytes) -> asyncio.StreamReader:
+    # This has to be called while an event loop is running.
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+
+    return reader
+
+
 @pytest.fixture
 def record() -> ConcreteRecord:
     return ConcreteRecord(name='testName', age=10)
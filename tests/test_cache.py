@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import sys
+
+import pytest
+
+from serde_components.cache import CacheStats, DocumentCache
+from serde_components.serializers import JsonSerializer, TomlSerializer
+
+from .conftest import ConcreteRecord, DictMapper
+
+
+def test_document_cache():
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        return bytes(data).upper()
+
+    cache = DocumentCache(max_entries=2)
+
+    assert cache.load(b'a', parse) == b'A'
+    assert cache.load(bytearray(b'a'), parse) == b'A'
+    assert cache.load(b'a', parse, namespace='other') == b'A'
+    assert cache.load(b'b', parse) == b'B'
+    assert len(calls) == 3
+    assert cache.stats == CacheStats(hits=1, misses=3, evictions=1, entries=2, size=2)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats.size == 0
+
+
+def test_document_cache_byte_budget():
+    cache = DocumentCache(max_bytes=4)
+    cache.load(b'12', bytes)
+    cache.load(b'34', bytes)
+    cache.load(b'5', bytes)
+    cache.load(b'too large', bytes)
+
+    assert cache.stats == CacheStats(hits=0, misses=4, evictions=1, entries=2, size=3)
+
+
+def test_json_serializer_cache(tmp_path):
+    path = tmp_path / 'record.json'
+    path.write_bytes(b'{"age": 10, "name": "testName"}')
+    cache = DocumentCache()
+
+    first = JsonSerializer.serialize_from_path(
+        ConcreteRecord, DictMapper, path, cache=cache
+    )
+    second = JsonSerializer.serialize_from_path(
+        ConcreteRecord, DictMapper, path, cache=cache
+    )
+    path.write_bytes(b'{"age": 11, "name": "testName"}')
+    os.utime(path, ns=(0, 0))
+    changed = JsonSerializer.serialize_from_path(
+        ConcreteRecord, DictMapper, path, cache=cache
+    )
+
+    assert first == second == ConcreteRecord(name='testName', age=10)
+    assert first is not second
+    assert changed == ConcreteRecord(name='testName', age=11)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_toml_serializer_cache():
+    if sys.version_info.minor < 11:
+        return
+
+    cache = DocumentCache()
+    with open('tests/data/toml/record1.toml', 'rb') as file_object:
+        data = file_object.read()
+    records = [
+        TomlSerializer.serialize(ConcreteRecord, DictMapper, data, cache=cache),
+        TomlSerializer.serialize_from_path(
+            ConcreteRecord, DictMapper, 'tests/data/toml/record1.toml', cache=cache
+        ),
+        TomlSerializer.serialize_from_path(
+            ConcreteRecord, DictMapper, 'tests/data/toml/record1.toml', cache=cache
+        ),
+    ]
+
+    with open('tests/data/toml/record1.toml', 'rb') as file_object:
+        records.append(
+            TomlSerializer.serialize_from_file(
+                ConcreteRecord, DictMapper, file_object, cache=cache
+            )
+        )
+    records.append(
+        TomlSerializer.serialize_from_file(
+            ConcreteRecord, DictMapper, io.BytesIO(data), cache=cache
+        )
+    )
+
+    assert records == [ConcreteRecord(name='testName', age=10)] * 5
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 2
+
+
+def test_document_cache_copies():
+    cache = DocumentCache()
+    shared_cache = DocumentCache(shared=True)
+    document = cache.load(b'a', lambda data: {'values': []})
+    document['values'].append(1)
+    shared = shared_cache.load(b'a', lambda data: {'values': []})
+
+    assert cache.load(b'a', bytes) == {'values': []}
+    assert shared_cache.load(b'a', bytes) is shared
+    assert cache.load(b'b', lambda data: lambda: None)() is None
+    assert cache.stats.entries == 1
+
+
+def test_json_serializer_cache_compression(tmp_path):
+    path = tmp_path / 'record.json'
+    path.write_bytes(b'{"age": 10, "name": "testName"}')
+    cache = DocumentCache()
+
+    record = JsonSerializer.serialize_from_path(
+        ConcreteRecord, DictMapper, path, cache=cache, compression=None
+    )
+    with pytest.raises(OSError):
+        JsonSerializer.serialize_from_path(
+            ConcreteRecord, DictMapper, path, cache=cache, compression='gzip'
+        )
+
+    assert record == ConcreteRecord(name='testName', age=10)
+    assert cache.stats.misses == 2
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import array
+import io
+
+import pytest
+
+from serde_components.columns import DictionaryColumn
+from serde_components.deserializers import CsvDeserializer
+from serde_components.schema import Column
+from serde_components.serializers import CsvSerializer
+
+
+def test_dictionary_column():
+    column = DictionaryColumn(['a', 'b', 'a', 'a'])
+
+    assert column.values == ['a', 'b']
+    assert list(column.codes) == [0, 1, 0, 0]
+    assert column[1] == 'b'
+    assert column[1:3] == ['b', 'a']
+    assert column == ['a', 'b', 'a', 'a']
+
+
+def test_csv_serialize_columns():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        data = golden_file_object.read()
+    columns = CsvSerializer.serialize_columns(
+        data, schema={'age': int, 'score': Column(float, default=0.0)}
+    )
+
+    assert isinstance(columns['age'], array.array)
+    assert list(columns['age']) == list(range(10))
+    assert isinstance(columns['name'], DictionaryColumn)
+    assert list(columns['name']) == ['testName'] * 10
+    assert list(columns['score']) == [0.0] * 10
+
+
+def test_csv_serialize_columns_nulls():
+    data = b'age,name\n1,a\n,b\n'
+    columns = CsvSerializer.serialize_columns(
+        data, schema={'age': int}, dictionary_encode=False
+    )
+
+    assert columns == {'age': [1, None], 'name': ['a', 'b']}
+
+
+def test_csv_serialize_columns_overflow():
+    data = b'id,name\n1,a\n18446744073709551615,b\n'
+    columns = CsvSerializer.serialize_columns(data, schema={'id': int})
+
+    assert columns['id'] == [1, 18446744073709551615]
+
+
+def test_csv_serialize_columns_numpy():
+    numpy = pytest.importorskip('numpy')
+    data = b'age,score,active\n1,0.5,true\n2,1.5,false\n'
+    columns = CsvSerializer.serialize_columns(
+        data, schema={'age': int, 'score': float, 'active': bool}, use_numpy=True
+    )
+
+    assert columns['age'].dtype == numpy.int64
+    assert columns['score'].tolist() == [0.5, 1.5]
+    assert columns['active'].dtype == numpy.bool_
+    assert columns['active'].tolist() == [True, False]
+
+
+def test_csv_serialize_columns_from_file():
+    with open('tests/data/csv/record2.csv', 'rb') as file_object:
+        columns = CsvSerializer.serialize_columns_from_file(
+            file_object, schema={'age': int}
+        )
+        assert not file_object.closed
+
+    assert list(columns['age']) == list(range(10))
+
+
+def test_csv_deserialize_columns():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        data = golden_file_object.read()
+    columns = CsvSerializer.serialize_columns(data, schema={'age': int})
+    file_object = io.BytesIO()
+    CsvDeserializer.deserialize_columns_to_file(columns, file_object)
+
+    assert CsvDeserializer.deserialize_columns(columns) == data
+    assert file_object.getvalue() == data
+    with pytest.raises(ValueError):
+        CsvDeserializer.deserialize_columns({'age': [1], 'name': []})
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import gzip
+import io
+import lzma
+
+import pytest
+
+from serde_components.compression import BZ2, GZIP, LZMA, decompress, detect
+from serde_components.compression import detect_name, reading, writing
+from serde_components.deserializers import (
+    CsvDeserializer,
+    JsonDeserializer,
+    JsonLinesDeserializer,
+)
+from serde_components.serializers import (
+    CsvSerializer,
+    JsonLinesSerializer,
+    JsonSerializer,
+)
+
+from .conftest import ConcreteRecord, DictMapper
+
+
+@pytest.mark.parametrize('extension', ['.gz', '.bz2', '.xz'])
+def test_csv_compressed_file(tmp_path, multiple_records, extension):
+    path = tmp_path / f'records.csv{extension}'
+    with open(path, 'wb') as file_object:
+        CsvDeserializer.deserialize_to_file(
+            multiple_records, DictMapper, file_object, compression_level=1
+        )
+    data = path.read_bytes()
+
+    assert detect(data) == detect_name(path)
+    assert decompress(data) == CsvDeserializer.deserialize(multiple_records, DictMapper)
+    with open(path, 'rb') as file_object:
+        records = CsvSerializer.iter_serialize_from_file(
+            ConcreteRecord, DictMapper, file_object, buffer_size=16
+        )
+        assert list(records) == multiple_records
+
+
+@pytest.mark.parametrize('compression', [GZIP, BZ2, LZMA])
+def test_json_lines_explicit_compression(multiple_records, compression):
+    file_object = io.BytesIO()
+    JsonLinesDeserializer.deserialize_to_file(
+        multiple_records, DictMapper, file_object, compression=compression
+    )
+
+    assert not file_object.closed
+    assert detect(file_object.getvalue()) == compression
+
+    file_object.seek(0)
+    records = JsonLinesSerializer.serialize_from_file(
+        ConcreteRecord, DictMapper, file_object, compression=compression
+    )
+
+    assert records == multiple_records
+
+
+def test_compressed_whole_documents(tmp_path, record):
+    path = tmp_path / 'record.json.xz'
+    with open(path, 'wb') as file_object:
+        JsonDeserializer.deserialize_to_file(record, DictMapper, file_object)
+
+    assert lzma.decompress(path.read_bytes()) == JsonDeserializer.deserialize(
+        record, DictMapper
+    )
+    assert JsonSerializer.serialize_from_path(ConcreteRecord(), DictMapper, path) == (
+        record
+    )
+    with open(path, 'rb') as file_object:
+        assert (
+            JsonSerializer.serialize_from_file(
+                ConcreteRecord(), DictMapper, file_object
+            )
+            == record
+        )
+
+    paths = [tmp_path / 'record.json.xz']
+    results = JsonSerializer.serialize_many_files(paths, ConcreteRecord, DictMapper)
+
+    assert [result for _, result in results] == [record]
+
+
+def test_detect():
+    assert detect(gzip.compress(b'data')) == GZIP
+    assert detect(b'BZh,name\n1,2\n') is None
+    assert detect(b'age,name\n') is None
+    assert detect_name('records.CSV.GZ') == GZIP
+    assert detect_name(3) is None
+    assert decompress(b'not compressed') == b'not compressed'
+
+    with pytest.raises(ValueError):
+        decompress(b'data', 'zip')
+    with reading(io.BytesIO(b'plain'), None) as file_object:
+        assert file_object.read() == b'plain'
+
+    file_object = io.BytesIO()
+    with writing(file_object, GZIP) as stream:
+        stream.write(b'data')
+
+    assert gzip.decompress(file_object.getvalue()) == b'data'
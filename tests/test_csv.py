@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 import ast
+import asyncio
 import csv
 import io
+import os
 from typing import Iterable, Type, Union
 
 from serde_components.serializers import CsvSerializer
 from serde_components.mappers import BaseMapper
 from serde_components.deserializers import CsvDeserializer, BaseDeserializer
 
-from .conftest import ConcreteRecord
+from .conftest import AsyncBytesWriter, ConcreteRecord, make_stream_reader
 
 Alias = Union[ConcreteRecord, Type[ConcreteRecord]]
 
@@ -144,3 +146,131 @@ def test_overwrite_csv_serializer_from_filebuffer():
     golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
 
     assert records == golden_records
+
+
+def test_csv_iter_deserializer(multiple_records):
+    chunks = list(
+        CsvDeserializer.iter_deserialize(
+            iter(multiple_records),
+            Mapper,
+            chunk_size=32,
+        )
+    )
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert len(chunks) > 1
+    assert b''.join(chunks) == golden_bytes
+
+
+def test_csv_deserializer_to_file_from_generator():
+    file_object = io.BytesIO(b'')
+    records = (ConcreteRecord(name='testName', age=i) for i in range(10))
+    CsvDeserializer.deserialize_to_file(records, Mapper, file_object)
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert file_object.getvalue() == golden_bytes
+
+
+def test_csv_iter_serializer_from_file():
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+    with open('tests/data/csv/record2.csv', 'rb') as file_object:
+        records = CsvSerializer.iter_serialize_from_file(
+            ConcreteRecord,
+            Mapper,
+            file_object,
+        )
+
+        assert next(records) == golden_records[0]
+        assert list(records) == golden_records[1:]
+        assert not file_object.closed
+
+
+def test_overwrite_csv_iter_serializer_from_filebuffer():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        file_object = io.BytesIO(golden_file_object.read())
+    records = [ConcreteRecord(name='aaa', age=i + 100) for i in range(10)]
+    mapped_records = list(
+        CsvSerializer.iter_serialize_from_file(records, Mapper, file_object)
+    )
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    assert records == golden_records
+    assert mapped_records == golden_records
+
+
+def test_csv_aiter_serializer_from_stream():
+    async def serialize():
+        with open('tests/data/csv/record2.csv', 'rb') as file_object:
+            reader = make_stream_reader(file_object.read())
+        records = CsvSerializer.aiter_serialize_from_stream(
+            ConcreteRecord,
+            Mapper,
+            reader,
+            chunk_size=7,
+            batch_size=3,
+        )
+
+        return [record async for record in records]
+
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    assert asyncio.run(serialize()) == golden_records
+
+
+def test_csv_aserializer_multiline_field():
+    async def serialize():
+        reader = make_stream_reader(b'age,name\r\n1,"test\r\nName"\r\n2,"a ""b"""\r\n')
+        records = [ConcreteRecord(), ConcreteRecord()]
+        await CsvSerializer.aserialize_from_stream(records, Mapper, reader)
+
+        return records
+
+    golden_records = [
+        ConcreteRecord(name='test\r\nName', age=1),
+        ConcreteRecord(name='a "b"', age=2),
+    ]
+
+    assert asyncio.run(serialize()) == golden_records
+
+
+def test_csv_adeserializer_to_stream(multiple_records):
+    writer = AsyncBytesWriter()
+    asyncio.run(
+        CsvDeserializer.adeserialize_to_stream(multiple_records, Mapper, writer)
+    )
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert writer.buffer.getvalue() == golden_bytes
+    assert writer.drain_count == 1
+
+
+def test_csv_serializer_buffers():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        data = golden_file_object.read()
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    for buffer in (bytearray(data), memoryview(data), memoryview(data)[:-1]):
+        records = CsvSerializer.serialize(ConcreteRecord, Mapper, buffer)
+
+        assert records == golden_records
+
+
+def test_csv_serializer_from_path():
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+    records = CsvSerializer.serialize_from_path(
+        ConcreteRecord,
+        Mapper,
+        'tests/data/csv/record2.csv',
+    )
+    fd = os.open('tests/data/csv/record2.csv', os.O_RDONLY)
+    try:
+        fd_records = CsvSerializer.serialize_from_path(ConcreteRecord, Mapper, fd)
+        os.fstat(fd)
+    finally:
+        os.close(fd)
+
+    assert records == golden_records
+    assert fd_records == golden_records
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from serde_components.delta import Delta, DeltaState, RowMapper, _digest
+from serde_components.delta import export_changes, export_full
+from serde_components.deserializers import (
+    CsvDeserializer,
+    JsonDeserializer,
+    JsonLinesDeserializer,
+)
+
+from .conftest import ConcreteRecord, DictMapper
+
+
+def make_records(count, changed=(), skip=()):
+    return [
+        ConcreteRecord(name=f'name{age}' + ('!' if age in changed else ''), age=age)
+        for age in range(count)
+        if age not in skip
+    ]
+
+
+def test_export_changes(tmp_path):
+    with DeltaState(tmp_path / 'state') as state:
+        first = io.BytesIO()
+        delta = export_changes(
+            CsvDeserializer, make_records(5), DictMapper, first, state, key='age'
+        )
+
+        assert delta == Delta(changed=5, unchanged=0, removed=[])
+        assert first.getvalue() == CsvDeserializer.deserialize(
+            make_records(5), DictMapper
+        )
+
+        unchanged = io.BytesIO()
+        delta = export_changes(
+            CsvDeserializer, make_records(5), DictMapper, unchanged, state, key='age'
+        )
+
+        assert delta == Delta(changed=0, unchanged=5, removed=[])
+        assert unchanged.getvalue() == b''
+
+    # The state is persisted between runs
+    with DeltaState(tmp_path / 'state') as state:
+        records = make_records(6, changed={1}, skip={3})
+        changes = io.BytesIO()
+        delta = export_changes(
+            JsonLinesDeserializer, records, DictMapper, changes, state, key='age'
+        )
+
+        assert delta == Delta(changed=2, unchanged=3, removed=['3'])
+        assert changes.getvalue() == (
+            b'{"age": 1, "name": "name1!"}\n{"age": 5, "name": "name5"}\n'
+        )
+        assert len(state) == 5
+        assert '3' not in state
+
+
+def test_iter_changes_uncommitted_run(tmp_path):
+    with DeltaState(tmp_path / 'state') as state:
+        list(state.iter_changes(make_records(3), DictMapper, key='age'))
+        state.commit()
+        changes = state.iter_changes(
+            make_records(3, changed={0, 2}), DictMapper, key=lambda row: row['age']
+        )
+        # Writing the first change fails and the run is never committed
+        next(changes)
+
+    with DeltaState(tmp_path / 'state') as state:
+        changes = state.iter_changes(make_records(3), DictMapper, key='age')
+        rows = [JsonDeserializer.deserialize(row, RowMapper) for row in changes]
+
+        assert rows == [b'{"age": 0, "name": "name0"}']
+        assert state.commit() == Delta(changed=1, unchanged=2, removed=[])
+
+
+def test_export_changes_empty_key(tmp_path):
+    with DeltaState(tmp_path / 'state') as state:
+        for _ in range(2):
+            delta = export_changes(
+                JsonLinesDeserializer,
+                [{'id': '', 'v': 1}],
+                RowMapper,
+                io.BytesIO(),
+                state,
+                key='id',
+            )
+
+        assert delta == Delta(changed=0, unchanged=1, removed=[])
+        assert '' in state
+        assert len(state) == 1
+
+
+def test_commit_removes_keys_of_interrupted_runs(tmp_path):
+    with DeltaState(tmp_path / 'state') as state:
+        list(state.iter_changes(make_records(2), DictMapper, key='age'))
+        state.commit()
+        # The record with age 2 is only seen by a run that is never committed
+        list(state.iter_changes(make_records(3), DictMapper, key='age'))
+
+    with DeltaState(tmp_path / 'state') as state:
+        list(state.iter_changes(make_records(1), DictMapper, key='age'))
+
+        assert state.commit() == Delta(changed=1, unchanged=0, removed=['1', '2'])
+        assert len(state) == 1
+
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == '.keys'] == [
+        'state.3.keys'
+    ]
+
+
+def test_digest_is_canonical():
+    assert _digest({'age': 1, 'name': 'a'}) == _digest({'name': 'a', 'age': 1})
+    assert _digest({'tags': {'b', 'a'}}) == _digest({'tags': {'a', 'b'}})
+    assert _digest({1: 'a', 'b': 2}) != _digest({1: 'a', 'b': 3})
+    assert _digest({'age': 1}) != _digest({'age': 1.0})
+
+
+def test_export_full(tmp_path):
+    state = DeltaState(tmp_path / 'state')
+    previous = tmp_path / 'previous.csv'
+    with open(previous, 'wb') as file_object:
+        delta = export_full(
+            CsvDeserializer, make_records(5), DictMapper, file_object, state, 'age'
+        )
+
+    assert delta == Delta(changed=5, unchanged=0, removed=[])
+    assert previous.read_bytes() == CsvDeserializer.deserialize(
+        make_records(5), DictMapper
+    )
+
+    records = make_records(7, changed={2}, skip={0})
+    output = io.BytesIO()
+    delta = export_full(
+        CsvDeserializer,
+        records,
+        DictMapper,
+        output,
+        state,
+        'age',
+        previous=previous,
+        batch_size=2,
+    )
+    state.close()
+
+    assert delta == Delta(changed=3, unchanged=3, removed=['0'])
+    assert output.getvalue() == CsvDeserializer.deserialize(records, DictMapper)
+
+
+def test_export_full_errors(tmp_path):
+    with DeltaState(tmp_path / 'state') as state:
+        with pytest.raises(ValueError):
+            export_full(
+                JsonDeserializer,
+                make_records(2),
+                DictMapper,
+                io.BytesIO(),
+                state,
+                'age',
+            )
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from serde_components.deserializers import (
+    CsvDeserializer,
+    FanOutDeserializer,
+    JsonDeserializer,
+    JsonLinesDeserializer,
+    Sink,
+    TomlDeserializer,
+)
+from serde_components.mappers import RowMapper
+
+from .conftest import ConcreteRecord, DictMapper
+
+
+class CountingMapper(DictMapper):
+    calls = 0
+
+    @classmethod
+    def map_to_dict(cls, record):
+        cls.calls += 1
+        return DictMapper.map_to_dict(record)
+
+
+def make_records(count):
+    return (ConcreteRecord(name=f'name{age}', age=age) for age in range(count))
+
+
+def test_fan_out_maps_once():
+    CountingMapper.calls = 0
+    sinks = [
+        Sink(CsvDeserializer, io.BytesIO(), {'flush_records': 7}),
+        Sink(JsonLinesDeserializer, io.BytesIO()),
+        Sink(JsonDeserializer, io.BytesIO(), collect=True),
+        Sink(TomlDeserializer, io.BytesIO(), method='deserialize_records_to_file'),
+    ]
+    FanOutDeserializer.deserialize_to_file(
+        make_records(100), CountingMapper, sinks, batch_size=8, max_pending=1
+    )
+    records = list(make_records(100))
+    csv, json_lines, json, toml = [sink.file_object.getvalue() for sink in sinks]
+
+    assert CountingMapper.calls == 100
+    assert csv == CsvDeserializer.deserialize(records, DictMapper)
+    assert json_lines == JsonLinesDeserializer.deserialize(records, DictMapper)
+    assert json == JsonDeserializer.deserialize(
+        [DictMapper.map_to_dict(record) for record in records], RowMapper
+    )
+    assert toml == TomlDeserializer.deserialize_records(records, DictMapper)
+
+
+def test_fan_out_in_memory(multiple_records):
+    csv, json_lines = FanOutDeserializer.deserialize(
+        iter(multiple_records), DictMapper, [CsvDeserializer, JsonLinesDeserializer]
+    )
+
+    assert csv == CsvDeserializer.deserialize(multiple_records, DictMapper)
+    assert json_lines == JsonLinesDeserializer.deserialize(multiple_records, DictMapper)
+
+
+def test_fan_out_errors():
+    class FailingDeserializer:
+        @staticmethod
+        def deserialize_to_file(rows, mapper, file_object):
+            next(iter(rows))
+            raise RuntimeError('sink failed')
+
+    sinks = [Sink(JsonLinesDeserializer, io.BytesIO()), Sink(FailingDeserializer, None)]
+    with pytest.raises(RuntimeError):
+        FanOutDeserializer.deserialize_to_file(
+            make_records(1000), DictMapper, sinks, batch_size=1, max_pending=1
+        )
+
+    def failing_records():
+        yield from make_records(10)
+        raise KeyError('records failed')
+
+    sinks = [Sink(JsonLinesDeserializer, io.BytesIO())]
+    with pytest.raises(KeyError):
+        FanOutDeserializer.deserialize_to_file(
+            failing_records(), DictMapper, sinks, batch_size=1
+        )
+
+    # The aborted sink does not write a partial output
+    assert sinks[0].file_object.getvalue() == b''
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import io
+import logging
+
+from serde_components import instrumentation
+from serde_components.deserializers import CsvDeserializer, JsonDeserializer
+from serde_components.instrumentation import Aggregator, Event, LoggingSink
+from serde_components.instrumentation import instrument, timed
+from serde_components.serializers import CsvSerializer, JsonSerializer
+
+from .conftest import ConcreteRecord, DictMapper
+from .test_csv import Mapper
+
+
+def test_instrumentation_disabled():
+    def function():
+        pass
+
+    assert instrumentation.sink is None
+    assert timed(function, 'component', 'stage') is function
+
+
+def test_instrumentation_aggregator(multiple_records):
+    aggregator = Aggregator()
+    file_object = io.BytesIO()
+    with instrument(aggregator):
+        CsvDeserializer.deserialize_to_file(
+            multiple_records, Mapper, file_object, batch_size=4
+        )
+        CsvSerializer.serialize(ConcreteRecord, Mapper, file_object.getvalue())
+
+    stages = aggregator.stages
+    assert instrumentation.sink is None
+    assert stages['Mapper', 'map'].records == 2 * len(multiple_records)
+    assert stages['Mapper', 'parse'].count == 3
+    assert stages['Mapper', 'format'].records == len(multiple_records)
+    assert stages['CsvDeserializer', 'encode'].count == len(multiple_records)
+    assert stages['CsvSerializer', 'decode'].count == len(multiple_records)
+    assert stages['ChunkedWriter', 'write'].size == len(file_object.getvalue())
+    assert sum(stages['Mapper', 'parse'].histogram.values()) == 3
+    assert 'CsvDeserializer' in aggregator.report()
+
+    aggregator.reset()
+
+    assert aggregator.stages == {}
+
+
+def test_instrumentation_callback(record):
+    events = []
+    with instrument(events.append):
+        data = JsonDeserializer.deserialize(record, DictMapper)
+        JsonSerializer.serialize(ConcreteRecord, DictMapper, data)
+
+    assert [(event.component, event.stage) for event in events] == [
+        ('DictMapper', 'map'),
+        ('JsonDeserializer', 'encode'),
+        ('JsonSerializer', 'decode'),
+        ('DictMapper', 'map'),
+    ]
+    assert events[1].size == len(data)
+
+
+def test_instrumentation_logging(caplog):
+    sink = LoggingSink(level=logging.INFO)
+    with caplog.at_level(logging.INFO):
+        sink(Event('Component', 'stage', 0.5, records=2, size=10))
+
+    assert caplog.messages == ['Component stage 0.500000s records=2 bytes=10']
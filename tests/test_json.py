@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 import ast
+import asyncio
 import io
-from typing import Type, Union
+import json
+from typing import Any, Type, Union
 
-from serde_components.serializers import JsonSerializer
-from serde_components.mappers import BaseMapper
-from serde_components.deserializers import JsonDeserializer
+import pytest
 
-from .conftest import ConcreteRecord
+from serde_components.serializers import JsonLinesSerializer, JsonSerializer
+from serde_components.mappers import BaseMapper
+from serde_components.deserializers import JsonDeserializer, JsonLinesDeserializer
+from serde_components import json_backends
+from serde_components.json_backends import (
+    StdlibJsonBackend,
+    get_backend,
+    get_loads,
+    project,
+    register_backend,
+    set_default_backend,
+)
+
+from .conftest import AsyncBytesWriter, ConcreteRecord, DictMapper, make_stream_reader
 
 Alias = Union[ConcreteRecord, Type[ConcreteRecord]]
 
@@ -146,3 +159,312 @@ def test_json_serializer_actual_file3():
         golden_record = ConcreteRecord(name=10, age='testName')
 
     assert single_record == golden_record
+
+
+def test_json_lines_deserializer():
+    records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+    json_data = JsonLinesDeserializer.deserialize(records, Mapper)
+    with open('tests/data/json/records.jsonl', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()
+
+    assert json_data == golden_bytes
+
+
+def test_json_lines_iter_deserializer():
+    records = (ConcreteRecord(name='testName', age=i) for i in range(3))
+    chunks = list(
+        JsonLinesDeserializer.iter_deserialize(records, DictMapper, chunk_size=1)
+    )
+    with open('tests/data/json/records.jsonl', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()
+
+    assert len(chunks) == 3
+    assert b''.join(chunks) == golden_bytes
+    assert list(JsonLinesDeserializer.iter_deserialize([], DictMapper)) == []
+
+
+def test_json_lines_deserializer_to_file():
+    file_object = io.BytesIO(b'')
+    records = (ConcreteRecord(name='testName', age=i) for i in range(3))
+    JsonLinesDeserializer.deserialize_to_file(records, DictMapper, file_object)
+    with open('tests/data/json/records.jsonl', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()
+
+    assert file_object.getvalue() == golden_bytes
+
+
+def test_json_lines_serializer():
+    json_data = b'{"age": 0, "name": "testName"}\n\n{"age": 1, "name": "testName"}'
+    records = [ConcreteRecord(), ConcreteRecord()]
+    JsonLinesSerializer.serialize(records, Mapper, json_data)
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(2)]
+
+    assert records == golden_records
+
+
+def test_json_lines_serializer_from_file():
+    with open('tests/data/json/records.jsonl', 'rb') as file_object:
+        records = JsonLinesSerializer.serialize_from_file(
+            ConcreteRecord,
+            DictMapper,
+            file_object,
+        )
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+
+    assert records == golden_records
+
+
+def test_json_lines_iter_serializer_from_file():
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+    with open('tests/data/json/records.jsonl', 'rb') as file_object:
+        records = JsonLinesSerializer.iter_serialize_from_file(
+            ConcreteRecord,
+            Mapper,
+            file_object,
+            batch_size=1,
+        )
+
+        assert next(records) == golden_records[0]
+        assert list(records) == golden_records[1:]
+
+
+def test_json_aserializer_from_stream():
+    async def serialize():
+        reader = make_stream_reader(b'{"age": 10, "name": "testName"}')
+        return await JsonSerializer.aserialize_from_stream(
+            ConcreteRecord, DictMapper, reader
+        )
+
+    assert asyncio.run(serialize()) == ConcreteRecord(name='testName', age=10)
+
+
+def test_json_adeserializer_to_stream(record):
+    writer = AsyncBytesWriter()
+    asyncio.run(JsonDeserializer.adeserialize_to_stream(record, Mapper, writer))
+
+    assert writer.buffer.getvalue() == b'{"age": 10, "name": "testName"}'
+    assert writer.drain_count == 1
+
+
+def test_json_lines_aiter_serializer_from_stream():
+    async def serialize():
+        with open('tests/data/json/records.jsonl', 'rb') as file_object:
+            reader = make_stream_reader(file_object.read())
+        records = JsonLinesSerializer.aiter_serialize_from_stream(
+            ConcreteRecord,
+            Mapper,
+            reader,
+            chunk_size=5,
+        )
+
+        return [record async for record in records]
+
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+
+    assert asyncio.run(serialize()) == golden_records
+
+
+def test_json_lines_adeserializer_to_stream():
+    writer = AsyncBytesWriter()
+    records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+    asyncio.run(
+        JsonLinesDeserializer.adeserialize_to_stream(records, DictMapper, writer)
+    )
+    with open('tests/data/json/records.jsonl', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()
+
+    assert writer.buffer.getvalue() == golden_bytes
+
+
+def test_json_serializer_from_path():
+    record = JsonSerializer.serialize_from_path(
+        ConcreteRecord,
+        Mapper,
+        'tests/data/json/record1.json',
+    )
+    memoryview_record = JsonSerializer.serialize(
+        ConcreteRecord,
+        DictMapper,
+        memoryview(b'{"age": 10, "name": "testName"}'),
+    )
+
+    assert record == ConcreteRecord(name='testName', age=10)
+    assert memoryview_record == ConcreteRecord(name='testName', age=10)
+
+
+def test_json_lines_serializer_from_path(tmp_path):
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(3)]
+    records = JsonLinesSerializer.serialize_from_path(
+        ConcreteRecord,
+        DictMapper,
+        'tests/data/json/records.jsonl',
+    )
+    empty_file = tmp_path / 'empty.jsonl'
+    empty_file.write_bytes(b'')
+
+    assert records == golden_records
+    assert (
+        JsonLinesSerializer.serialize_from_path(ConcreteRecord, DictMapper, empty_file)
+        == []
+    )
+
+
+class CountingBackend(StdlibJsonBackend):
+    calls = 0
+
+    @classmethod
+    def loads(cls, data: Any) -> Any:  # type: ignore
+        cls.calls += 1
+        return super().loads(data)
+
+    @classmethod
+    def dumps(cls, data: Any) -> bytes:  # type: ignore
+        cls.calls += 1
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def test_json_backend_per_call(record):
+    CountingBackend.calls = 0
+    json_data = JsonDeserializer.deserialize(record, Mapper, backend=CountingBackend)
+    new_record = JsonSerializer.serialize(
+        ConcreteRecord, Mapper, json_data, backend=CountingBackend
+    )
+
+    assert json_data == b'{"age":10,"name":"testName"}'
+    assert new_record == record
+    assert CountingBackend.calls == 2
+
+
+def test_json_backend_file(record):
+    CountingBackend.calls = 0
+    file_object = io.BytesIO()
+    JsonDeserializer.deserialize_to_file(
+        record, Mapper, file_object, backend=CountingBackend
+    )
+    file_object.seek(0)
+    new_record = JsonSerializer.serialize_from_file(
+        ConcreteRecord, Mapper, file_object, backend=CountingBackend
+    )
+
+    assert file_object.getvalue() == b'{"age":10,"name":"testName"}'
+    assert new_record == record
+    assert CountingBackend.calls == 2
+
+
+@pytest.fixture
+def backend_registry(monkeypatch):
+    # Backends registered by a test are removed again when the test ends
+    monkeypatch.setattr(json_backends, '_BACKENDS', dict(json_backends._BACKENDS))
+
+
+def test_json_lines_backend_registry(backend_registry, multiple_records):
+    CountingBackend.calls = 0
+    register_backend('counting', CountingBackend)
+    json_data = JsonLinesDeserializer.deserialize(
+        multiple_records, DictMapper, backend='counting'
+    )
+    records = JsonLinesSerializer.serialize(
+        ConcreteRecord, DictMapper, json_data, backend='counting'
+    )
+
+    assert json_data.count(b'\n') == 10
+    assert records == multiple_records
+    assert CountingBackend.calls == 20
+
+
+def test_json_default_backend(backend_registry, record):
+    register_backend('counting', CountingBackend)
+    set_default_backend('counting')
+    try:
+        json_data = JsonDeserializer.deserialize(record, Mapper)
+    finally:
+        set_default_backend(None)
+
+    assert json_data == b'{"age":10,"name":"testName"}'
+    assert get_backend() is StdlibJsonBackend
+
+
+def test_json_backend_errors(backend_registry):
+    with pytest.raises(TypeError):
+        register_backend('invalid', object())
+    with pytest.raises(KeyError):
+        get_backend('invalid')
+    with pytest.raises(KeyError):
+        get_backend('unknown')
+
+
+def test_json_projection():
+    data = b'{"age": 10, "name": "testName", "nested": {"large": [1, 2, 3]}}'
+    loads = get_loads(fields=('age', 'missing'))
+
+    assert loads(data) == {'age': 10}
+    assert project([1, 2], ('age',)) == [1, 2]
+    assert project({'age': 1}, None) == {'age': 1}
+    assert JsonSerializer.serialize(
+        ConcreteRecord, DictMapper, data, fields=['name']
+    ) == ConcreteRecord(name='testName', age=None)
+
+
+def test_json_lines_projection():
+    with open('tests/data/json/records.jsonl', 'rb') as file_object:
+        records = list(
+            JsonLinesSerializer.iter_serialize_from_file(
+                ConcreteRecord, DictMapper, file_object, fields=('age',)
+            )
+        )
+
+    assert records == [ConcreteRecord(name=None, age=i) for i in range(3)]
+
+
+def test_json_file_projection(backend_registry):
+    CountingBackend.calls = 0
+    register_backend('counting', CountingBackend)
+    with open('tests/data/json/record1.json', 'rb') as file_object:
+        record = JsonSerializer.serialize_from_file(
+            ConcreteRecord, DictMapper, file_object, fields=['name']
+        )
+    records = JsonLinesSerializer.serialize_from_path(
+        ConcreteRecord,
+        DictMapper,
+        'tests/data/json/records.jsonl',
+        backend='counting',
+        fields=('age',),
+    )
+
+    assert record == ConcreteRecord(name='testName', age=None)
+    assert records == [ConcreteRecord(name=None, age=i) for i in range(3)]
+    assert CountingBackend.calls == 3
+
+
+def test_json_serialize_many_files(tmp_path):
+    paths = [f'tests/data/json/record{i}.json' for i in (1, 2, 3)]
+    broken_path = tmp_path / 'broken.json'
+    broken_path.write_bytes(b'{')
+    errors = []
+    results = list(
+        JsonSerializer.serialize_many_files(
+            [paths[0], broken_path, tmp_path / 'missing.json', *paths[1:]],
+            ConcreteRecord,
+            DictMapper,
+            workers=2,
+            errors=errors,
+        )
+    )
+    unordered_results = JsonSerializer.serialize_many_files(
+        paths, ConcreteRecord, DictMapper, parse_workers=2, ordered=False
+    )
+
+    assert results == [
+        (paths[0], ConcreteRecord(name='testName', age=10)),
+        (paths[1], ConcreteRecord()),
+        (paths[2], ConcreteRecord(name=10, age='testName')),
+    ]
+    assert sorted(unordered_results, key=lambda result: result[0]) == results
+    assert [path for path, _ in errors] == [broken_path, tmp_path / 'missing.json']
+    assert isinstance(errors[1][1], FileNotFoundError)
+    with pytest.raises(FileNotFoundError):
+        list(
+            JsonSerializer.serialize_many_files(
+                [tmp_path / 'missing.json'], ConcreteRecord, DictMapper
+            )
+        )
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+import pytest
+
+import serde_components
+from serde_components import serializers
+from benchmarks.import_time import parse_importtime
+
+
+def _imported_modules(statement: str) -> set:
+    code = f'import sys\n{statement}\nprint(",".join(sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.strip().split(','))
+
+
+def test_package_import_is_lazy():
+    modules = _imported_modules('import serde_components')
+
+    assert 'serde_components.serializers' not in modules
+    assert not {'csv', 'json', 'tomllib', 'multiprocessing'} & modules
+
+
+def test_component_import_loads_only_its_format():
+    modules = _imported_modules(
+        'from serde_components.serializers import CsvSerializer'
+    )
+
+    assert 'csv' in modules
+    assert 'serde_components.serializers.json_serializer' not in modules
+    assert not {'json', 'tomllib', 'multiprocessing'} & modules
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'from serde_components.deserializers import CsvDeserializer',
+        'from serde_components.deserializers import JsonLinesDeserializer',
+        'from serde_components.deserializers import TomlDeserializer',
+        'from serde_components.serializers import CsvSerializer',
+        'from serde_components.serializers import JsonSerializer',
+        'from serde_components.serializers import TomlSerializer',
+    ],
+)
+def test_component_import_skips_unused_modules(statement):
+    modules = _imported_modules(statement)
+    unused = {'logging', 'pickle', 'concurrent.futures.thread', 'hashlib'}
+
+    assert not unused & modules
+
+
+def test_lazy_attributes():
+    assert serde_components.serializers is serializers
+    assert 'CsvSerializer' in dir(serializers)
+    assert serializers.CsvSerializer is serializers.CsvSerializer
+    assert 'CsvSerializer' in vars(serializers)
+    with pytest.raises(AttributeError):
+        serializers.NotASerializer
+    with pytest.raises(ImportError):
+        exec('from serde_components.serializers import NotASerializer')
+
+
+def test_parse_importtime():
+    output = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |   _csv\n'
+        'import time:       300 |        420 | csv\n'
+    )
+
+    assert parse_importtime(output) == [('_csv', 120, 120), ('csv', 300, 420)]
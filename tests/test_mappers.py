@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+import ast
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
+import pytest
+
+from serde_components.deserializers import CsvDeserializer, JsonDeserializer
+from serde_components.mappers import (
+    FieldMapper,
+    dict_from_record,
+    dicts_from_records,
+    record_from_dict,
+    records_from_dicts,
+)
+from serde_components.serializers import CsvSerializer, JsonSerializer
+from serde_components.utils import batched, map_batches
+
+from .conftest import ConcreteRecord, DictMapper
+from .test_csv import Mapper
+
+
+def test_dict_mapper_bytes_fallback(record):
+    data = ast.literal_eval(DictMapper.map_deserialize(record).decode('utf-8'))
+    new_record = DictMapper.map_serialize(
+        ConcreteRecord(), b"{'age': 10, 'name': 'testName'}"
+    )
+
+    assert data == {'age': 10, 'name': 'testName'}
+    assert new_record == record
+
+
+def test_dict_from_record(record):
+    golden_data = {'age': 10, 'name': 'testName'}
+
+    assert dict_from_record(DictMapper, record) == golden_data
+    assert dict_from_record(Mapper, record) == golden_data
+
+
+def test_record_from_dict(record):
+    data = {'age': 10, 'name': 'testName'}
+
+    assert record_from_dict(DictMapper, ConcreteRecord(), data) == record
+    assert record_from_dict(Mapper, ConcreteRecord(), data) == record
+
+
+def test_dict_mapper_csv_deserializer(multiple_records):
+    csv_data = CsvDeserializer.deserialize(multiple_records, DictMapper)
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert csv_data == golden_bytes
+
+
+def test_dict_mapper_csv_serializer():
+    with open('tests/data/csv/record2.csv', 'rb') as file_object:
+        records = CsvSerializer.serialize_from_file(
+            ConcreteRecord,
+            DictMapper,
+            file_object,
+        )
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    assert records == golden_records
+
+
+def test_dict_mapper_json(record):
+    file_object = io.BytesIO(b'')
+    JsonDeserializer.deserialize_to_file(record, DictMapper, file_object)
+    file_object.seek(0)
+    new_record = JsonSerializer.serialize_from_file(
+        ConcreteRecord,
+        DictMapper,
+        file_object,
+    )
+
+    assert file_object.getvalue() == b'{"age": 10, "name": "testName"}'
+    assert new_record == record
+
+
+class ConcreteFieldMapper(FieldMapper[ConcreteRecord]):
+    fields = ('age', 'name')
+    converters = {'age': int}
+
+
+class RenamedFieldMapper(FieldMapper[ConcreteRecord]):
+    fields = ('name', 'age')
+    renames = {'name': 'full_name'}
+
+
+def test_field_mapper_to_dict(record):
+    assert ConcreteFieldMapper.map_to_dict(record) == {
+        'age': 10,
+        'name': 'testName',
+    }
+    assert RenamedFieldMapper.map_to_dict(record) == {
+        'full_name': 'testName',
+        'age': 10,
+    }
+
+
+def test_field_mapper_from_dict():
+    record = ConcreteFieldMapper.map_from_dict(
+        ConcreteRecord(), {'age': '10', 'name': 'testName'}
+    )
+    empty_record = ConcreteFieldMapper.map_from_dict(ConcreteRecord(), {})
+    renamed_record = RenamedFieldMapper.map_from_dict(
+        ConcreteRecord(), {'full_name': 'testName', 'age': 10}
+    )
+
+    assert record == ConcreteRecord(name='testName', age=10)
+    assert empty_record == ConcreteRecord()
+    assert renamed_record == ConcreteRecord(name='testName', age=10)
+
+
+def test_field_mapper_invalid_field():
+    with pytest.raises(ValueError):
+
+        class InvalidMapper(FieldMapper[ConcreteRecord]):
+            fields = ('not valid',)
+
+    with pytest.raises(ValueError):
+
+        class KeywordMapper(FieldMapper[ConcreteRecord]):
+            fields = ('class',)
+
+
+def test_field_mapper_csv(multiple_records):
+    csv_data = CsvDeserializer.deserialize(multiple_records, ConcreteFieldMapper)
+    records = CsvSerializer.serialize(ConcreteRecord, ConcreteFieldMapper, csv_data)
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert csv_data == golden_bytes
+    assert records == multiple_records
+
+
+class BatchMapper(Mapper):
+    batches: List[int] = []
+
+    @classmethod
+    def map_deserialize_many(cls, records: Iterable[ConcreteRecord]) -> List[bytes]:
+        records = list(records)
+        cls.batches.append(len(records))
+        return super().map_deserialize_many(records)
+
+    @classmethod
+    def map_serialize_many(
+        cls, records: Iterable[ConcreteRecord], data: Iterable[bytes]
+    ) -> List[ConcreteRecord]:
+        records = list(records)
+        cls.batches.append(len(records))
+        return super().map_serialize_many(records, data)
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
+    with pytest.raises(ValueError):
+        list(batched(range(5), 0))
+
+
+def test_batch_mapper_csv(multiple_records):
+    BatchMapper.batches = []
+    csv_data = CsvDeserializer.deserialize(multiple_records, BatchMapper, 4)
+    records = CsvSerializer.serialize(ConcreteRecord, BatchMapper, csv_data, 3)
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+
+    assert BatchMapper.batches == [4, 4, 2, 3, 3, 3, 1]
+    assert csv_data == golden_bytes
+    assert records == multiple_records
+
+
+def test_field_mapper_many(multiple_records):
+    data = ConcreteFieldMapper.map_to_dict_many(multiple_records)
+    records = ConcreteFieldMapper.map_from_dict_many(
+        [ConcreteRecord() for _ in data], data
+    )
+    fallback_records = records_from_dicts(
+        Mapper, [ConcreteRecord() for _ in data], data
+    )
+
+    assert dicts_from_records(ConcreteFieldMapper, multiple_records) == data
+    assert records == multiple_records
+    assert fallback_records == multiple_records
+
+
+def test_map_batches():
+    batches = list(batched(range(100), 7))
+    golden_sums = [sum(batch) for batch in batches]
+
+    assert list(map_batches(sum, batches)) == golden_sums
+    assert list(map_batches(sum, batches, workers=2)) == golden_sums
+    assert list(map_batches(sum, [], workers=2)) == []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(map_batches(sum, batches, executor=executor)) == golden_sums
+
+
+def test_parallel_csv(multiple_records):
+    with open('tests/data/csv/record1.csv', 'rb') as golden_file_object:
+        golden_bytes = golden_file_object.read()[:-1]
+    csv_data = CsvDeserializer.deserialize(
+        multiple_records, Mapper, batch_size=3, workers=2
+    )
+    records = CsvSerializer.serialize(
+        ConcreteRecord, Mapper, csv_data, batch_size=3, workers=2
+    )
+
+    assert csv_data == golden_bytes
+    assert records == multiple_records
+
+
+def test_parallel_csv_executor(multiple_records):
+    records = [ConcreteRecord() for _ in multiple_records]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        csv_data = CsvDeserializer.deserialize(
+            multiple_records, DictMapper, batch_size=3, executor=executor
+        )
+        CsvSerializer.serialize(
+            records, DictMapper, csv_data, batch_size=3, executor=executor
+        )
+
+    assert records == multiple_records
+
+
+def test_parallel_unpicklable_mapper(multiple_records):
+    class LocalMapper(ConcreteFieldMapper):
+        pass
+
+    csv_data = CsvDeserializer.deserialize(
+        multiple_records, LocalMapper, batch_size=3, workers=2
+    )
+    records = CsvSerializer.serialize(
+        ConcreteRecord, LocalMapper, csv_data, batch_size=3, workers=2
+    )
+
+    assert records == multiple_records
+
+
+def test_parallel_record_instances(multiple_records):
+    csv_data = CsvDeserializer.deserialize(multiple_records, Mapper)
+    records = [ConcreteRecord() for _ in multiple_records]
+
+    with pytest.raises(ValueError):
+        CsvSerializer.serialize(records, Mapper, csv_data, batch_size=3, workers=2)
+    assert CsvSerializer.serialize(records, Mapper, csv_data) == multiple_records
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+
+from serde_components.deserializers import CsvDeserializer
+from serde_components.records import SlotsRecord, make_mapper, make_record
+from serde_components.serializers import CsvSerializer
+
+
+class SlottedRecord(SlotsRecord):
+    __slots__ = ('age', 'name')
+
+
+SlottedMapper = make_mapper(SlottedRecord, converters={'age': int})
+HeaderRecord = make_record('HeaderRecord', ['age', 'name'])
+
+
+def test_slots_record():
+    record = SlottedRecord(1, name='testName')
+
+    assert not hasattr(record, '__dict__')
+    assert record == SlottedRecord(age=1, name='testName')
+    assert record._asdict() == {'age': 1, 'name': 'testName'}
+    assert repr(record) == "SlottedRecord(age=1, name='testName')"
+    assert SlottedRecord().age is None
+    assert hash(record) == hash(SlottedRecord(1, 'testName'))
+    assert len({record, SlottedRecord(1, 'testName'), SlottedRecord(2)}) == 2
+    with pytest.raises(AttributeError):
+        record.other = 1  # type:ignore
+
+
+def test_make_record():
+    record = HeaderRecord(1, 'testName')
+
+    assert HeaderRecord._fields == ('age', 'name')
+    assert pickle.loads(pickle.dumps(record)) == record
+    with pytest.raises(ValueError):
+        make_record('Invalid', ['not valid'])
+    with pytest.raises(ValueError):
+        make_record('Keyword', ['class'])
+    with pytest.raises(ValueError):
+
+        class KeywordRecord(SlotsRecord):
+            __slots__ = ('from',)
+
+
+def test_csv_slots_record():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        data = golden_file_object.read()
+    golden_records = [SlottedRecord(i, 'testName') for i in range(10)]
+    records = CsvSerializer.serialize(SlottedRecord, SlottedMapper, data)
+    parallel_records = CsvSerializer.serialize(
+        HeaderRecord, make_mapper(HeaderRecord), data, batch_size=3, workers=2
+    )
+
+    assert records == golden_records
+    assert [tuple(record) for record in parallel_records] == [
+        (str(i), 'testName') for i in range(10)
+    ]
+    assert CsvDeserializer.deserialize(records, SlottedMapper) == data
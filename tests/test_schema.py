@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import gzip
+import io
+from typing import Any
+
+import pytest
+
+from serde_components.mappers import FieldMapper
+from serde_components.schema import Column, Schema, SchemaReader, to_bool
+from serde_components.serializers import CsvSerializer
+
+from .conftest import ConcreteRecord, make_stream_reader
+from .test_csv import Mapper
+
+
+class TypedMapper(FieldMapper[ConcreteRecord]):
+    fields = ('age', 'name')
+
+
+def test_to_bool():
+    assert to_bool('True') is True
+    assert to_bool(' no ') is False
+    with pytest.raises(ValueError):
+        to_bool('maybe')
+
+
+def test_schema_compile():
+    schema = Schema(
+        {
+            'age': int,
+            'active': bool,
+            'score': Column(float, default=0.0),
+            'missing': Column(str, default='default'),
+        }
+    )
+    convert_row = schema.compile(['name', 'age', 'active', 'score'])
+
+    assert convert_row(['testName', '10', 'true', '']) == {
+        'missing': 'default',
+        'name': 'testName',
+        'age': 10,
+        'active': True,
+        'score': 0.0,
+    }
+    assert convert_row(['testName', '']) == {
+        'missing': 'default',
+        'name': 'testName',
+        'age': None,
+        'active': None,
+        'score': 0.0,
+    }
+
+
+def test_schema_not_nullable():
+    schema = Schema({'age': Column(int, nullable=False)})
+    convert_row = schema.compile(['age'])
+
+    with pytest.raises(ValueError):
+        convert_row([''])
+    with pytest.raises(ValueError):
+        schema.compile(['name'])
+
+
+def test_schema_reader():
+    lines = ['age,name\r\n', '\r\n', '1,"test\r\n', 'Name"\r\n']
+    rows = list(SchemaReader(lines, Schema({'age': int})))
+
+    assert rows == [{'age': 1, 'name': 'test\r\nName'}]
+
+
+def test_csv_serializer_schema():
+    with open('tests/data/csv/record2.csv', 'rb') as golden_file_object:
+        data = golden_file_object.read()
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+    records = CsvSerializer.serialize(
+        ConcreteRecord, TypedMapper, data, schema={'age': int}
+    )
+    bytes_records = CsvSerializer.serialize(
+        ConcreteRecord, Mapper, data, schema=Schema({'age': int})
+    )
+    untyped_records = CsvSerializer.serialize(ConcreteRecord, TypedMapper, data)
+
+    assert records == golden_records
+    assert bytes_records == golden_records
+    assert untyped_records[1].age == '1'
+
+
+def test_csv_iter_serializer_schema():
+    with open('tests/data/csv/record2.csv', 'rb') as file_object:
+        records = list(
+            CsvSerializer.iter_serialize_from_file(
+                ConcreteRecord, TypedMapper, file_object, schema={'age': int}
+            )
+        )
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    assert records == golden_records
+
+
+def test_csv_serializer_from_file_schema():
+    with open('tests/data/csv/record2.csv', 'rb') as file_object:
+        records = CsvSerializer.serialize_from_file(
+            ConcreteRecord,
+            TypedMapper,
+            file_object,
+            batch_size=3,
+            schema={'age': int},
+        )
+    golden_records = [ConcreteRecord(name='testName', age=i) for i in range(10)]
+
+    assert records == golden_records
+
+
+def test_csv_aserializer_schema():
+    async def serialize() -> Any:
+        reader = make_stream_reader(b'age,name\n1,testName\n,testName\n')
+        return await CsvSerializer.aserialize_from_stream(
+            ConcreteRecord, TypedMapper, reader, schema={'age': Column(int)}
+        )
+
+    assert asyncio.run(serialize()) == [
+        ConcreteRecord(name='testName', age=1),
+        ConcreteRecord(name='testName', age=None),
+    ]
+
+
+def test_schema_projection():
+    schema = Schema({'age': int, 'other': Column(int, nullable=False)})
+    convert_row = schema.compile(['name', 'extra', 'age'], fields=('age', 'name'))
+
+    assert convert_row(['testName', 'skipped', '10']) == {
+        'name': 'testName',
+        'age': 10,
+    }
+
+
+def test_csv_serializer_projection():
+    data = b'age,name,extra\n1,testName,skipped\n'
+    records = CsvSerializer.serialize(
+        ConcreteRecord, TypedMapper, data, fields=['name']
+    )
+    typed_records = CsvSerializer.serialize(
+        ConcreteRecord, TypedMapper, data, schema={'age': int}, fields=['age']
+    )
+    columns = CsvSerializer.serialize_columns(data, fields=['age', 'extra'])
+
+    assert records == [ConcreteRecord(name='testName', age=None)]
+    assert typed_records == [ConcreteRecord(name=None, age=1)]
+    assert list(columns) == ['age', 'extra']
+
+
+def test_csv_serializer_file_projection(tmp_path):
+    data = b'age,name,extra\n1,testName,skipped\n'
+    path = tmp_path / 'records.csv.gz'
+    path.write_bytes(gzip.compress(data))
+    records = CsvSerializer.serialize_from_file(
+        ConcreteRecord, TypedMapper, io.BytesIO(data), fields=['name']
+    )
+    path_records = CsvSerializer.serialize_from_path(
+        ConcreteRecord, TypedMapper, path, schema={'age': int}, fields=['age']
+    )
+
+    assert records == [ConcreteRecord(name='testName', age=None)]
+    assert path_records == [ConcreteRecord(name=None, age=1)]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import io
+import struct
+
+import pytest
+
+from serde_components.deserializers import StructDeserializer
+from serde_components.serializers import StructSerializer
+from serde_components.struct_layout import FOOTER, LENGTH_PREFIXED, StructLayout
+
+from .conftest import ConcreteRecord, DictMapper
+from .test_csv import Mapper
+
+LAYOUT = StructLayout([('age', 'q'), ('name', 'str')])
+
+
+class RecordSerializer(StructSerializer[ConcreteRecord]):
+    layout = LAYOUT
+
+
+class RecordDeserializer(StructDeserializer[ConcreteRecord]):
+    layout = LAYOUT
+
+
+class PrefixedSerializer(StructSerializer[ConcreteRecord]):
+    layout = StructLayout(
+        [('name', 'str'), ('age', 'q')], strings=LENGTH_PREFIXED, byte_order='>'
+    )
+
+
+def test_struct_round_trip(multiple_records):
+    data = RecordDeserializer.deserialize(multiple_records, DictMapper)
+    records = RecordSerializer.serialize(ConcreteRecord, DictMapper, data)
+    bytes_records = RecordSerializer.serialize(
+        ConcreteRecord, Mapper, bytearray(data), batch_size=3
+    )
+
+    assert records == multiple_records
+    assert bytes_records == multiple_records
+    # Every record is 12 bytes, the single distinct name is stored once
+    assert data.count(b'testName') == 1
+    assert len(data) == 12 * len(multiple_records) + 16 + FOOTER.size
+
+
+def test_struct_length_prefixed(tmp_path, multiple_records):
+    layout = PrefixedSerializer.layout
+    records = multiple_records + [ConcreteRecord(name=None, age=-1)]
+    path = tmp_path / 'records.bin'
+    reports = []
+    with open(path, 'wb') as file_object:
+        StructDeserializer.deserialize_to_file(
+            records,
+            DictMapper,
+            file_object,
+            chunk_size=30,
+            layout=layout,
+            progress=reports.append,
+        )
+    chunks = list(
+        StructDeserializer.iter_deserialize(
+            records, DictMapper, chunk_size=30, layout=layout
+        )
+    )
+
+    assert b''.join(chunks) == path.read_bytes()
+    assert len(chunks) > 2
+    assert reports[-1].records == len(records)
+    assert (
+        PrefixedSerializer.serialize_from_path(ConcreteRecord, DictMapper, path)
+        == records
+    )
+
+
+def test_struct_errors(record):
+    with pytest.raises(ValueError):
+        StructDeserializer.deserialize([record], DictMapper)
+    with pytest.raises(ValueError):
+        RecordSerializer.serialize(ConcreteRecord, DictMapper, b'not struct data')
+    with pytest.raises(ValueError):
+        StructLayout([])
+    with pytest.raises(struct.error):
+        StructLayout([('age', 'not a code')])
+    with pytest.raises(struct.error):
+        RecordDeserializer.deserialize([ConcreteRecord(name='a')], DictMapper)
+    assert (
+        RecordSerializer.serialize(
+            ConcreteRecord, DictMapper, RecordDeserializer.deserialize([], DictMapper)
+        )
+        == []
+    )
+    assert io.BytesIO(RecordDeserializer.deserialize([], DictMapper)).read(4)
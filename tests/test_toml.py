@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 import ast
+import datetime
 import io
 import sys
-from typing import Type, Union
+from typing import Any, Type, Union
 
 import pytest
 
-from serde_components.mappers import BaseMapper
+from serde_components.deserializers import TomlDeserializer
+from serde_components.mappers import BaseDictMapper, BaseMapper
 from serde_components.serializers import TomlSerializer
 
-from .conftest import ConcreteRecord
+from .conftest import ConcreteRecord, DictMapper
 
 Alias = Union[ConcreteRecord, Type[ConcreteRecord]]
 
@@ -162,3 +164,88 @@ def test_toml_serializer_actual_file3():
         golden_record = ConcreteRecord(name=10, age='testName')
 
     assert record == golden_record
+
+
+def test_toml_serializer_from_path():
+    if sys.version_info.minor < 11:
+        with pytest.raises(ImportError):
+            TomlSerializer.serialize_from_path(
+                ConcreteRecord,
+                Mapper,
+                'tests/data/toml/record1.toml',
+            )
+        return
+
+    record = TomlSerializer.serialize_from_path(
+        ConcreteRecord,
+        Mapper,
+        'tests/data/toml/record1.toml',
+    )
+
+    assert record == ConcreteRecord(name='testName', age=10)
+
+
+class NestedMapper(BaseDictMapper[Any]):
+    @staticmethod
+    def map_to_dict(record: Any) -> Any:
+        return record
+
+    @staticmethod
+    def map_from_dict(record: Any, data: Any) -> Any:
+        return data
+
+
+def test_toml_deserializer_writer(record):
+    assert TomlDeserializer.deserialize(record, DictMapper) == (
+        b'age = 10\nname = "testName"\n'
+    )
+    assert TomlDeserializer.deserialize(record, Mapper) == (
+        b'name = "testName"\nage = 10\n'
+    )
+
+
+def test_toml_deserializer_writer_values():
+    document = {
+        'key with spaces': 'quote " and \\ and \n and \x01',
+        'flags': [True, False],
+        'numbers': [1, 1.5, float('inf')],
+        'date': datetime.date(2020, 1, 2),
+        'missing': None,
+        'table': {'inline': {'a': 1}, 'nested': {'b': 2}},
+        'items': [{'c': 3}, {'c': 4}],
+    }
+    toml_data = TomlDeserializer.deserialize(document, NestedMapper)
+
+    assert toml_data.startswith(b'"key with spaces" = "quote \\" and')
+    with pytest.raises(TypeError):
+        TomlDeserializer.deserialize({'key': [None]}, NestedMapper)
+    if sys.version_info.minor >= 11:
+        import tomllib
+
+        del document['missing']
+        assert tomllib.loads(toml_data.decode('utf-8')) == document
+
+
+def test_toml_deserializer_writer_records(multiple_records):
+    file_object = io.BytesIO()
+    TomlDeserializer.deserialize_records_to_file(
+        multiple_records, DictMapper, file_object, table='people'
+    )
+    chunks = list(
+        TomlDeserializer.iter_deserialize_records(
+            multiple_records, DictMapper, chunk_size=1, batch_size=3
+        )
+    )
+
+    assert file_object.getvalue().startswith(b'[[people]]\nage = 0\n')
+    assert len(chunks) == len(multiple_records)
+    assert TomlDeserializer.deserialize_records([], DictMapper) == b''
+    if sys.version_info.minor >= 11:
+        import tomllib
+
+        data = tomllib.loads(b''.join(chunks).decode('utf-8'))
+        assert data == {
+            'records': [
+                {'age': record.age, 'name': record.name} for record in multiple_records
+            ]
+        }
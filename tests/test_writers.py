@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from serde_components.deserializers import CsvDeserializer, JsonDeserializer
+from serde_components.deserializers import JsonLinesDeserializer, StructDeserializer
+from serde_components.struct_layout import StructLayout
+from serde_components.writers import ChunkedWriter, Progress, iter_chunks
+
+from .conftest import DictMapper
+
+
+class CollectingWriter:
+    # Keeps every object it is passed, like a queue backed writer would
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+
+def test_chunked_writer():
+    file_object = io.BytesIO()
+    reports = []
+    with ChunkedWriter(
+        file_object, flush_records=2, flush_bytes=8, progress=reports.append
+    ) as writer:
+        writer.write(b'head', records=0)
+        writer.writelines([b'a', b'b', b'c'])
+        writer.write(b'0123456789')
+        writer.write(b'0123456789')
+
+    assert file_object.getvalue() == b'headabc01234567890123456789'
+    assert reports == [
+        Progress(chunk_records=2, chunk_bytes=6, records=2, bytes_written=6),
+        Progress(chunk_records=2, chunk_bytes=11, records=4, bytes_written=17),
+        Progress(chunk_records=1, chunk_bytes=10, records=5, bytes_written=27),
+    ]
+    with pytest.raises(ValueError):
+        ChunkedWriter(file_object, flush_records=0)
+
+
+def test_chunked_writer_fsync(tmp_path):
+    path = tmp_path / 'data'
+    with open(path, 'wb') as file_object:
+        with ChunkedWriter(file_object, flush_records=1, fsync=True) as writer:
+            writer.write(b'a')
+            writer.write(b'b')
+
+            assert path.read_bytes() == b'ab'
+
+
+def test_chunked_writer_keeps_written_data(multiple_records):
+    file_object = CollectingWriter()
+    with ChunkedWriter(file_object, flush_bytes=4) as writer:
+        for data in (b'ab', b'cd', b'e', b'f'):
+            writer.write(data)
+
+    layout = StructLayout([('age', 'q'), ('name', 'str')])
+    struct_object = CollectingWriter()
+    StructDeserializer.deserialize_to_file(
+        multiple_records, DictMapper, struct_object, chunk_size=24, layout=layout
+    )
+
+    assert [bytes(chunk) for chunk in file_object.chunks] == [b'abcd', b'ef']
+    assert b''.join(struct_object.chunks) == StructDeserializer.deserialize(
+        multiple_records, DictMapper, layout=layout
+    )
+
+
+def test_iter_chunks():
+    assert list(iter_chunks([b'ab', b'c', b'de', b'f'], chunk_size=3)) == [
+        b'abc',
+        b'def',
+    ]
+    assert list(iter_chunks([], chunk_size=3)) == []
+
+
+def test_deserializers_to_file_progress(multiple_records):
+    csv_object = io.BytesIO()
+    json_lines_object = io.BytesIO()
+    json_object = io.BytesIO()
+    csv_reports = []
+    json_lines_reports = []
+    json_reports = []
+    CsvDeserializer.deserialize_to_file(
+        multiple_records,
+        DictMapper,
+        csv_object,
+        flush_records=4,
+        progress=csv_reports.append,
+    )
+    JsonLinesDeserializer.deserialize_to_file(
+        multiple_records,
+        DictMapper,
+        json_lines_object,
+        flush_records=4,
+        progress=json_lines_reports.append,
+    )
+    JsonDeserializer.deserialize_to_file(
+        multiple_records[0], DictMapper, json_object, progress=json_reports.append
+    )
+
+    assert csv_object.getvalue() == CsvDeserializer.deserialize(
+        multiple_records, DictMapper
+    )
+    assert [report.chunk_records for report in csv_reports] == [4, 4, 2]
+    assert json_lines_reports[-1].records == len(multiple_records)
+    assert json_reports[-1].bytes_written == len(json_object.getvalue())